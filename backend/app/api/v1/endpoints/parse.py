@@ -42,8 +42,13 @@ async def upload_statement(
     Returns:
         ParseResult with extracted data
     """
-    # Validate file
-    await file_validator.validate_upload(file)
+    # Save file temporarily, then validate it on disk
+    file_path = await file_service.save_upload(file)
+    try:
+        await file_validator.validate_saved(file_path, file.filename)
+    except Exception:
+        file_service.cleanup(file_path)
+        raise
     
     # Generate job ID
     job_id = str(uuid.uuid4())
@@ -51,9 +56,6 @@ async def upload_statement(
     # Create repository
     repo = JobRepository(db)
     
-    # Save file temporarily
-    file_path = None
-    
     try:
         # Create job record
         await repo.create_job(job_id, file.filename)
@@ -61,8 +63,6 @@ async def upload_statement(
             job_id, JobStatus.PROCESSING, progress=10, message="File uploaded, starting parsing"
         )
         
-        # Save file
-        file_path = await file_service.save_upload(file)
         logger.info(f"Processing job {job_id}: {file.filename}")
         await repo.update_job_status(
             job_id, JobStatus.PROCESSING, progress=30, message="Extracting text from PDF"
@@ -73,9 +73,6 @@ async def upload_statement(
         
         # Save results
         await repo.save_result(result)
-        await repo.update_job_status(
-            job_id, JobStatus.PROCESSING, progress=90, message="Finalizing results"
-        )
         
         # Build simplified result for frontend (same as /status mapping)
         simplified_result: Dict[str, Any] = {
@@ -161,8 +158,7 @@ async def upload_statement(
     
     finally:
         # Cleanup temporary file
-        if file_path:
-            file_service.cleanup(file_path)
+        file_service.cleanup(file_path)
 
 
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
@@ -304,18 +300,15 @@ async def batch_upload(
         raise HTTPException(status_code=400, detail="Maximum 10 files allowed per batch")
     
     batch_id = str(uuid.uuid4())
-    job_ids = []
     repo = JobRepository(db)
     
-    # Create jobs for each file
+    # Validate every file before creating any jobs
     for file in files:
-        # Validate
         await file_validator.validate_upload(file)
-        
-        # Create job
-        job_id = str(uuid.uuid4())
-        await repo.create_job(job_id, file.filename)
-        job_ids.append(job_id)
+    
+    # Create all jobs in a single insert
+    job_ids = [str(uuid.uuid4()) for _ in files]
+    await repo.create_jobs([(job_id, file.filename) for job_id, file in zip(job_ids, files)])
     
     logger.info(f"Created batch {batch_id} with {len(job_ids)} jobs")
     
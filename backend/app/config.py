@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     # MongoDB Settings
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DB_NAME: str = "credit_card_parser"
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10  # Connections opened at startup and kept warm
+    MONGODB_MAX_IDLE_TIME_MS: int = 60000
+    MONGODB_COMPRESSORS: str = "zstd,zlib"  # Wire compression, in order of preference
     
     # File Upload Settings
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
@@ -24,9 +28,14 @@ class Settings(BaseSettings):
     TESSERACT_DPI: int = 300
     TESSERACT_LANG: str = "eng"
     TESSERACT_CONFIG: str = "--psm 6"
+    TESSERACT_WORKERS: int = 0  # Pages OCR'd concurrently across all requests; 0 = one per CPU
     
     # Processing Settings
     MIN_TEXT_THRESHOLD: int = 100  # Minimum characters to consider text-based PDF
+    PDFPLUMBER_WORKERS: int = 0  # Processes for page-parallel pdfplumber; 0 = one per CPU
+    PDFPLUMBER_PARALLEL_MIN_PAGES: int = 8  # Smaller documents are parsed in-process
+    PDFPLUMBER_X_TOLERANCE: float = 3  # Max gap between chars of one word (pdfplumber default)
+    PDFPLUMBER_Y_TOLERANCE: float = 3  # Max vertical offset between chars of one line (pdfplumber default)
     DEFAULT_CURRENCY: str = "INR"
     
     # Confidence Thresholds
@@ -1,16 +1,59 @@
 """American Express extractor"""
-import regex as re
+import re
 from typing import Tuple
 from app.core.extractors.base import BaseExtractor
 from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
 from app.utils.date_parser import parse_date, parse_date_range
 from app.utils.amount_parser import parse_amount
+from app.utils import safe_re
+from app.utils.regex_patterns import PatternUnion
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Patterns are compiled once at import time
+_AMEX_ISSUER_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    r"American\s+Express",
+    r"AEBC",
+    r"americanexpress\.co\.in",
+    r"American\s+Express\s+Banking\s+Corp",
+))
+
+_AMEX_CARD_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    r"(\d{4}\s*X{4}\s*X{4}\s*\d{3,4})",
+    r"(X{4}-X{6}-\d{5})",
+    r"(\d{4}[\s\-]X{6}[\s\-]\d{5})",
+    r"Membership\s+Number\s*:?\s*(\d{4}[\sX\-]+)",
+))
+
+_AMEX_PERIOD_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    r"From\s+(\w+\s+\d{1,2})\s+to\s+(\w+\s+\d{1,2},\s+\d{4})",
+    r"Statement\s+Period\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
+    r"From\s+(\d{2}\d{2}\d{4})\s+to\s+(\d{2}\d{2}\d{4})",
+))
+
+_AMEX_DUE_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    # Minimum Payment Due section often has the date
+    r"Minimum\s+Payment\s+Due\s*.*?(\w+\s+\d{1,2},?\s+\d{4})",
+    r"Payment\s+Due\s+Date\s*:?\s*(\w+\s+\d{1,2},?\s+\d{4})",
+    r"Due\s+Date\s*:?\s*(\d{1,2}\s+\w+\s+\d{4})",
+    r"Pay\s+by\s*:?\s*(\w+\s+\d{1,2},?\s+\d{4})",
+))
+
+_AMEX_TOTAL_UNION = PatternUnion((
+    # Amex shows "Closing Balance Rs" as the total amount
+    r"Closing\s+Balance\s+Rs\.?\s*([\d,]+\.?\d*)",
+    r"Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"New\s+Balance\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"Your\s+Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    # Min Payment Due is also important
+    r"Min\s+Payment\s+Due\s+Rs\.?\s*([\d,]+\.?\d*)",
+), re.IGNORECASE)
+
+
 class AmexExtractor(BaseExtractor):
     """Extractor for American Express credit card statements"""
     
@@ -18,30 +61,16 @@ class AmexExtractor(BaseExtractor):
     
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
         """Extract American Express name"""
-        patterns = [
-            r"American\s+Express",
-            r"AEBC",
-            r"americanexpress\.co\.in",
-            r"American\s+Express\s+Banking\s+Corp",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _AMEX_ISSUER_PATS:
+            if pattern.search(text):
                 return self.ISSUER_NAME.value, 1.0
         
         return "", 0.0
     
     def extract_card_number(self, text: str) -> Tuple[str, float]:
         """Extract card number - Amex format: 3769 XXXX XXXX 000 or XXXX-XXXXXX-01007"""
-        patterns = [
-            r"(\d{4}\s*X{4}\s*X{4}\s*\d{3,4})",
-            r"(X{4}-X{6}-\d{5})",
-            r"(\d{4}[\s\-]X{6}[\s\-]\d{5})",
-            r"Membership\s+Number\s*:?\s*(\d{4}[\sX\-]+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _AMEX_CARD_PATS:
+            match = pattern.search(text)
             if match:
                 card_num = match.group(1)
                 card_num = ' '.join(card_num.split()).replace(' ', ' ')
@@ -53,14 +82,8 @@ class AmexExtractor(BaseExtractor):
     
     def extract_statement_period(self, text: str) -> Tuple[DateRangeField, float]:
         """Extract statement period - Amex format varies"""
-        patterns = [
-            r"From\s+(\w+\s+\d{1,2})\s+to\s+(\w+\s+\d{1,2},\s+\d{4})",
-            r"Statement\s+Period\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"From\s+(\d{2}\d{2}\d{4})\s+to\s+(\d{2}\d{2}\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _AMEX_PERIOD_PATS:
+            match = pattern.search(text)
             if match:
                 start_raw, end_raw = match.groups()
                 start_date = parse_date(start_raw)
@@ -91,16 +114,8 @@ class AmexExtractor(BaseExtractor):
     
     def extract_due_date(self, text: str) -> Tuple[DateField, float]:
         """Extract payment due date - Amex format: February 1, 2024"""
-        patterns = [
-            # Minimum Payment Due section often has the date
-            r"Minimum\s+Payment\s+Due\s*.*?(\w+\s+\d{1,2},?\s+\d{4})",
-            r"Payment\s+Due\s+Date\s*:?\s*(\w+\s+\d{1,2},?\s+\d{4})",
-            r"Due\s+Date\s*:?\s*(\d{1,2}\s+\w+\s+\d{4})",
-            r"Pay\s+by\s*:?\s*(\w+\s+\d{1,2},?\s+\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _AMEX_DUE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
                 date_formatted = parse_date(date_raw)
@@ -118,31 +133,18 @@ class AmexExtractor(BaseExtractor):
     
     def extract_total_amount(self, text: str) -> Tuple[AmountField, float]:
         """Extract total amount due - Amex format: Rs. 1,219.26"""
-        patterns = [
-            # Amex shows "Closing Balance Rs" as the total amount
-            r"Closing\s+Balance\s+Rs\.?\s*([\d,]+\.?\d*)",
-            r"Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"New\s+Balance\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"Your\s+Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            # Min Payment Due is also important
-            r"Min\s+Payment\s+Due\s+Rs\.?\s*([\d,]+\.?\d*)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount_raw = match.group(0)
-                amount, currency = parse_amount(amount_raw)
-                
-                if amount is not None and amount > 0:
-                    field = AmountField(
-                        raw=amount_raw,
-                        amount=amount,
-                        currency=currency
-                    )
-                    logger.info(f"Amex: Found amount: {currency} {amount}")
-                    return field, 1.0
+        for _, match in _AMEX_TOTAL_UNION.matches(text):
+            amount_raw = match.group(0)
+            amount, currency = parse_amount(amount_raw)
+            
+            if amount is not None and amount > 0:
+                field = AmountField(
+                    raw=amount_raw,
+                    amount=amount,
+                    currency=currency
+                )
+                logger.info(f"Amex: Found amount: {currency} {amount}")
+                return field, 1.0
         
         logger.warning("Amex: Total amount not found")
         return AmountField(raw="", amount=0.0, currency="INR"), 0.0
@@ -1,9 +1,11 @@
 """Axis Bank credit card statement extractor"""
-import regex as re
+import re
 from typing import Tuple
 from app.core.extractors.base import BaseExtractor
+from app.core.extractors.common_patterns import MINIMUM_AMOUNT_DUE
 from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
+from app.config import settings
 from app.utils.date_parser import parse_date, parse_date_range
 from app.utils.amount_parser import parse_amount
 import logging
@@ -11,6 +13,83 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# Patterns are compiled once at import time
+_AXIS_ISSUER_PATS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Axis\s+Bank",
+    r"AXIS\s+BANK",
+    r"axisbank\.com",
+    r"Axis\s+Bank\s+Ltd",
+))
+
+_AXIS_CARD_PATS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Card\s+Number\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
+    r"Card\s+No\.?\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
+    r"Credit\s+Card\s+Number\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
+    r"([X*]{4}[\s\-]*[X*]{4}[\s\-]*[X*]{4}[\s\-]*\d{4})",
+    r"(\d{4}[\s\-]*[X*]{4}[\s\-]*[X*]{4}[\s\-]*\d{4})",
+))
+_AXIS_CARD_SEP_RE = re.compile(r'[\s\-]+')
+
+# Payment summary line: <period start> - <period end> <due date> <statement date>
+_AXIS_SUMMARY_RE = re.compile(r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})")
+_AXIS_SUMMARY_DUE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{1,2}/\d{4}\s+(\d{1,2}/\d{1,2}/\d{4})")
+
+_AXIS_RANGE_PATS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
+    r"Statement\s+Period\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
+    r"Billing\s+Cycle\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})\s*(?:to|To|TO)\s*(\d{2}-\w{3}-\d{4})",
+    r"From\s+(\d{2}/\d{2}/\d{4})\s+(?:to|To|TO)\s+(\d{2}/\d{2}/\d{4})",
+    r"Statement\s+from\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
+))
+
+_AXIS_SINGLE_DATE_PATS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Statement\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Date\s+of\s+Statement\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+))
+
+_AXIS_DUE_PATS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Pay\s+by\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Payment\s+due\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Due\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})",
+    r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})",
+))
+
+# Example: 40,491.00 Dr
+_AXIS_DRCR_RE = re.compile(r"([\d,]+\.\d{2})\s*Dr")
+
+_AXIS_TOTAL_PATS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Total\s+Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Amount\s+Payable\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Outstanding\s+Amount\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Total\s+Outstanding\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Current\s+Outstanding\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Total\s+Amount\s+Due\s*.{0,100}?(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+    r"Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
+))
+
+_AXIS_TOTAL_FALLBACK_PATS = tuple(re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Total\s+Amount\s+Due\s*.{0,200}?([\d,]+\.?\d*)",
+    r"Amount\s+Payable\s*.{0,200}?([\d,]+\.?\d*)",
+))
+
+_AXIS_MIN_DUE_RE = re.compile(r"([\d,]+\.\d{2})\s*Dr\s+([\d,]+\.\d{2})\s*Dr\s+\d{1,2}/\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{1,2}/\d{4}")
+_AXIS_PREV_BAL_RE = re.compile(r"Previous\s+Balance[^\n\r]*[\n\r]+\s*([\d,]+\.\d{2})\s*Dr", re.IGNORECASE)
+_AXIS_PREV_BAL_LABEL_RE = re.compile(r"Previous\s+Balance\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)", re.IGNORECASE)
+
+_AXIS_LIMIT_PATS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Available\s+Credit\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+    r"Credit\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+    r"Available\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+))
+
+_AXIS_REWARDS_TOTAL_RE = re.compile(r"Reward[s]?\s+Summary[\s\S]{0,120}?Total\s*:?\s*([\d,]+)", re.IGNORECASE)
+_AXIS_REWARDS_SNIPPET_RE = re.compile(r"Reward[s]?\s+Summary[\s\S]{0,200}", re.IGNORECASE)
+
+
 class AxisExtractor(BaseExtractor):
     """Extractor for Axis Bank credit card statements"""
     
@@ -18,35 +97,20 @@ class AxisExtractor(BaseExtractor):
     
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
         """Extract Axis Bank name"""
-        patterns = [
-            r"Axis\s+Bank",
-            r"AXIS\s+BANK",
-            r"axisbank\.com",
-            r"Axis\s+Bank\s+Ltd",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _AXIS_ISSUER_PATS:
+            if pattern.search(text):
                 return self.ISSUER_NAME.value, 1.0
         
         return "", 0.0
     
     def extract_card_number(self, text: str) -> Tuple[str, float]:
         """Extract card number - Axis format variations"""
-        patterns = [
-            r"Card\s+Number\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
-            r"Card\s+No\.?\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
-            r"Credit\s+Card\s+Number\s*:?\s*([X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*[X*\d]{4}[\s\-]*\d{4})",
-            r"([X*]{4}[\s\-]*[X*]{4}[\s\-]*[X*]{4}[\s\-]*\d{4})",
-            r"(\d{4}[\s\-]*[X*]{4}[\s\-]*[X*]{4}[\s\-]*\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _AXIS_CARD_PATS:
+            match = pattern.search(text)
             if match:
                 card_num = match.group(1)
                 # Normalize spacing/dashes to spaces
-                card_num = re.sub(r'[\s\-]+', ' ', card_num).strip()
+                card_num = _AXIS_CARD_SEP_RE.sub(' ', card_num).strip()
                 logger.info(f"Axis: Found card number: {card_num}")
                 return card_num, 0.9
         
@@ -55,8 +119,7 @@ class AxisExtractor(BaseExtractor):
     
     def extract_statement_period(self, text: str) -> Tuple[DateRangeField, float]:
         """Extract statement period for Axis Bank"""
-        summary_pattern = r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})"
-        match = re.search(summary_pattern, text)
+        match = _AXIS_SUMMARY_RE.search(text)
         if match:
             start_raw = match.group(1)
             end_raw = match.group(2)
@@ -71,15 +134,8 @@ class AxisExtractor(BaseExtractor):
                 logger.info(f"Axis: Found statement period: {start_date} to {end_date}")
                 return field, 0.9
         # Fallback to previous logic
-        range_patterns = [
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
-            r"Statement\s+Period\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
-            r"Billing\s+Cycle\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})\s*(?:to|To|TO)\s*(\d{2}-\w{3}-\d{4})",
-            r"From\s+(\d{2}/\d{2}/\d{4})\s+(?:to|To|TO)\s+(\d{2}/\d{2}/\d{4})",
-            r"Statement\s+from\s*.{0,100}?(\d{2}/\d{2}/\d{4})\s*(?:to|To|TO)\s*(\d{2}/\d{2}/\d{4})",
-        ]
-        for pattern in range_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_RANGE_PATS:
+            match = pattern.search(text)
             if match:
                 start_raw = match.group(1)
                 end_raw = match.group(2)
@@ -94,13 +150,8 @@ class AxisExtractor(BaseExtractor):
                     logger.info(f"Axis: Found statement period: {start_date} to {end_date}")
                     return field, 0.9
         # Single date patterns (fallback)
-        single_patterns = [
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Statement\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Date\s+of\s+Statement\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-        ]
-        for pattern in single_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_SINGLE_DATE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
                 start_date = parse_date(date_raw)
@@ -127,8 +178,7 @@ class AxisExtractor(BaseExtractor):
 
     def extract_statement_date(self, text: str) -> Tuple[str, float]:
         """Extract statement generated date for Axis Bank"""
-        summary_pattern = r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})\s+(\d{1,2}/\d{1,2}/\d{4})"
-        match = re.search(summary_pattern, text)
+        match = _AXIS_SUMMARY_RE.search(text)
         if match:
             statement_raw = match.group(4)
             statement_date = parse_date(statement_raw)
@@ -136,13 +186,8 @@ class AxisExtractor(BaseExtractor):
                 logger.info(f"Axis: Found statement generated date: {statement_date}")
                 return statement_date, 0.9
         # Fallback to single date patterns
-        single_patterns = [
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Statement\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Date\s+of\s+Statement\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-        ]
-        for pattern in single_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_SINGLE_DATE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
                 statement_date = parse_date(date_raw)
@@ -151,14 +196,16 @@ class AxisExtractor(BaseExtractor):
                     return statement_date, 0.85
         logger.warning("Axis: Statement generated date not found")
         return "", 0.0
-    def extract_all(self, text: str) -> dict:
+    def extract_all(self, text: str, *, fail_fast: bool = False) -> dict:
         logger.info(f"Extracting data using {self.__class__.__name__}")
         logger.info(f"Text length: {len(text)} characters")
-        if len(text) > 0:
+        if text and logger.isEnabledFor(logging.INFO):
             logger.info(f"First 800 chars:\n{text[:800]}")
             logger.info(f"Last 800 chars:\n{text[-800:]}")
 
         issuer, issuer_conf = self.extract_card_issuer(text)
+        if fail_fast and issuer_conf < settings.MIN_CONFIDENCE_SCORE:
+            return self._issuer_mismatch_result(issuer, issuer_conf)
         card_number, card_conf = self.extract_card_number(text)
         statement_period, period_conf = self.extract_statement_period(text)
         statement_date, date_conf = self.extract_statement_date(text)
@@ -258,8 +305,7 @@ class AxisExtractor(BaseExtractor):
         """Extract payment due date - Axis formats"""
         # Try to find a date after the statement period (e.g., 05/10/2024)
         # Payment summary line: ... 16/08/2024 - 15/09/2024 05/10/2024 13/09/2024
-        summary_pattern = r"\d{1,2}/\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{1,2}/\d{4}\s+(\d{1,2}/\d{1,2}/\d{4})"
-        match = re.search(summary_pattern, text)
+        match = _AXIS_SUMMARY_DUE_RE.search(text)
         if match:
             date_raw = match.group(1)
             date_formatted = parse_date(date_raw)
@@ -271,17 +317,8 @@ class AxisExtractor(BaseExtractor):
                 logger.info(f"Axis: Found due date (summary): {date_formatted}")
                 return field, 0.95
         # Fallback to standard patterns
-        patterns = [
-            r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Pay\s+by\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Payment\s+due\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Due\s+on\s*.{0,100}?(\d{2}/\d{2}/\d{4})",
-            r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})",
-            r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}-\w{3}-\d{4})",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_DUE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
                 date_formatted = parse_date(date_raw)
@@ -299,8 +336,7 @@ class AxisExtractor(BaseExtractor):
         """Extract total amount due - Axis formats"""
         # Try to find Dr/Cr pattern in payment summary line
         # Example: 40,491.00 Dr
-        drcr_pattern = r"([\d,]+\.\d{2})\s*Dr"
-        match = re.search(drcr_pattern, text)
+        match = _AXIS_DRCR_RE.search(text)
         if match:
             amount_raw = match.group(1)
             amount_str = amount_raw.replace(',', '')
@@ -317,17 +353,8 @@ class AxisExtractor(BaseExtractor):
             except ValueError:
                 pass
         # Fallback to standard patterns
-        patterns = [
-            r"Total\s+Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Amount\s+Payable\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Outstanding\s+Amount\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Total\s+Outstanding\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Current\s+Outstanding\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Total\s+Amount\s+Due\s*.{0,100}?(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_TOTAL_PATS:
+            match = pattern.search(text)
             if match:
                 amount_raw = match.group(1)
                 amount_str = amount_raw.replace(',', '')
@@ -344,12 +371,8 @@ class AxisExtractor(BaseExtractor):
                 except ValueError:
                     continue
         # Fallback: try to find just the number after "Total Amount Due"
-        fallback_patterns = [
-            r"Total\s+Amount\s+Due\s*.{0,200}?([\d,]+\.?\d*)",
-            r"Amount\s+Payable\s*.{0,200}?([\d,]+\.?\d*)",
-        ]
-        for pattern in fallback_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _AXIS_TOTAL_FALLBACK_PATS:
+            match = pattern.search(text)
             if match:
                 amount_raw = match.group(1)
                 if ',' in amount_raw or '.' in amount_raw:
@@ -377,8 +400,7 @@ class AxisExtractor(BaseExtractor):
         Example line:
         40,491.00 Dr 810.00 Dr 16/08/2024 - 15/09/2024 05/10/2024 13/09/2024
         """
-        pattern = r"([\d,]+\.\d{2})\s*Dr\s+([\d,]+\.\d{2})\s*Dr\s+\d{1,2}/\d{1,2}/\d{4}\s*-\s*\d{1,2}/\d{1,2}/\d{4}"
-        m = re.search(pattern, text)
+        m = _AXIS_MIN_DUE_RE.search(text)
         if m:
             # group(1) is Total Amount Due, group(2) is Minimum Amount Due
             min_raw = m.group(2)
@@ -390,7 +412,7 @@ class AxisExtractor(BaseExtractor):
             except ValueError:
                 pass
         # Fallback label-based
-        fallback = re.search(r"Minimum\s+Amount\s+Due\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)", text, re.IGNORECASE)
+        fallback = MINIMUM_AMOUNT_DUE.search(text)
         if fallback:
             min_raw = fallback.group(1)
             try:
@@ -407,8 +429,7 @@ class AxisExtractor(BaseExtractor):
         Looks for a number tagged with Dr near 'Previous Balance'.
         """
         # Try to capture first amount after 'Previous Balance'
-        pat = r"Previous\s+Balance[^\n\r]*[\n\r]+\s*([\d,]+\.\d{2})\s*Dr"
-        m = re.search(pat, text, re.IGNORECASE)
+        m = _AXIS_PREV_BAL_RE.search(text)
         if m:
             raw = m.group(1)
             try:
@@ -419,7 +440,7 @@ class AxisExtractor(BaseExtractor):
             except ValueError:
                 pass
         # Generic label match
-        m2 = re.search(r"Previous\s+Balance\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)", text, re.IGNORECASE)
+        m2 = _AXIS_PREV_BAL_LABEL_RE.search(text)
         if m2:
             raw = m2.group(1)
             try:
@@ -433,13 +454,8 @@ class AxisExtractor(BaseExtractor):
 
     def extract_available_credit_limit(self, text: str):
         """Extract available credit or credit limit if present."""
-        labels = [
-            r"Available\s+Credit\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-            r"Credit\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-            r"Available\s+Limit\s*[:\-]?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        ]
-        for p in labels:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _AXIS_LIMIT_PATS:
+            m = p.search(text)
             if m:
                 raw = m.group(1)
                 try:
@@ -453,10 +469,10 @@ class AxisExtractor(BaseExtractor):
 
     def extract_reward_points_summary(self, text: str):
         """Try to capture reward points total or section snippet."""
-        m = re.search(r"Reward[s]?\s+Summary[\s\S]{0,120}?Total\s*:?\s*([\d,]+)", text, re.IGNORECASE)
+        m = _AXIS_REWARDS_TOTAL_RE.search(text)
         if m:
             logger.info("Axis: Found reward points total")
             return f"Total Rewards: {m.group(1)}"
-        sec = re.search(r"Reward[s]?\s+Summary[\s\S]{0,200}", text, re.IGNORECASE)
+        sec = _AXIS_REWARDS_SNIPPET_RE.search(text)
         return sec.group(0).strip() if sec else None
 
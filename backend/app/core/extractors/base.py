@@ -5,16 +5,163 @@ from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
 from app.utils.amount_parser import parse_amount
 from app.utils.date_parser import parse_date
+from app.config import settings
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
 import re
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
 
+# extract_all memoization bounds
+EXTRACTION_CACHE_SIZE = 256
+EXTRACTION_CACHE_MAX_CHARS = 2 * 1024 * 1024  # Larger texts are never cached
+
+# Patterns for the generic optional extractors, compiled once at import time
+_MIN_DUE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Minimum\s+Amount\s+Due\s*[:\-]?\s*Rs\.?\s*[^\d]{0,2}([\d,]+\.?\d*)",
+    r"Minimum\s+Amount\s+Due\s*[\n\r\s]+[^\d]{0,2}([\d,]+\.?\d*)",
+    r"Min\.?\s+Amt\.?\s+Due\s*[:\-]?\s*[^\d]{0,2}([\d,]+\.?\d*)",
+))
+_PREV_BALANCE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Previous\s+Balance\s*[:\-]?\s*Rs\.?\s*[^\d]{0,2}([\d,]+\.?\d*)",
+    r"Previous\s+Balance\s*[\n\r\s]+[^\d]{0,2}([\d,]+\.?\d*)",
+    r"Opening\s+Balance\s*[:\-]?\s*[^\d]{0,2}([\d,]+\.?\d*)",
+))
+_CREDIT_LIMIT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Available\s+Credit\s+Limit\s*[:\-]?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"Available\s+Credit\s*[\n\r\s]+([\d,]+\.?\d*)",
+    r"Credit\s+Limit\s*[:\-]?\s*([\d,]+\.?\d*)",
+))
+_REWARDS_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Reward\s+Points\s+Summary[\s\S]{0,120}?Total\s*:?\s*([\d,]+)",
+    r"Total\s+Reward\s+Points\s*:?\s*([\d,]+)",
+))
+_REWARDS_SECTION_RE = re.compile(r"Reward\s+Points\s+Summary[\s\S]{0,200}", re.IGNORECASE)
+_TXN_DATE_RE = re.compile(r"(\d{2}[\-/]\d{2}[\-/]\d{4}|\d{2}[\-/]\d{2}[\-/]\d{2})")
+_TXN_AMOUNT_RE = re.compile(r"([\-]?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)$")
+
+
+# Value extract_all reports for a required field that wasn't found
+_EMPTY_FIELDS = {
+    "card_issuer": str,
+    "card_number": str,
+    "statement_period": lambda: DateRangeField(raw=""),
+    "payment_due_date": lambda: DateField(raw=""),
+    "total_amount_due": lambda: AmountField(raw="", amount=0.0),
+}
+
+
+def memoize_extraction(extract_all):
+    """
+    Memoize an extractor's extract_all on a digest of the input text
+    
+    Retries, re-uploads and parser fallbacks often hand the same text to the
+    same extractor again; those calls become a dict lookup. The key is a
+    16-byte BLAKE2b digest so cached entries don't pin the full text.
+    Extraction runs in worker threads, so the cache is guarded by a lock;
+    extraction itself runs outside it.
+    """
+    cache: "OrderedDict[tuple, dict]" = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(extract_all)
+    def wrapper(self, text: str, **kwargs) -> dict:
+        if len(text) > EXTRACTION_CACHE_MAX_CHARS:
+            return extract_all(self, text, **kwargs)
+        
+        digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        key = (type(self), digest, tuple(sorted(kwargs.items())))
+        with lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+        if result is None:
+            result = extract_all(self, text, **kwargs)
+            with lock:
+                cache[key] = result
+                if len(cache) > EXTRACTION_CACHE_SIZE:
+                    cache.popitem(last=False)
+        else:
+            logger.info(f"{self.__class__.__name__}: Reusing cached extraction")
+        
+        # Hand out a deep copy so callers can't mutate the cached entry,
+        # including the field models and transaction rows inside it
+        return copy.deepcopy(result)
+    
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+    
+    wrapper.cache_clear = cache_clear
+    return wrapper
+
 
 class BaseExtractor(ABC):
     """Abstract base class for issuer-specific extractors"""
     
     ISSUER_NAME: CardIssuer = CardIssuer.UNKNOWN
+    # Lowercase substrings at least one of which every issuer pattern requires.
+    # Empty means the extractor can't rule text out cheaply.
+    IDENTIFYING_LITERALS: Tuple[str, ...] = ()
+    # Lowercase words at least one of which every pattern of a field needs,
+    # keyed by extract_all field name; extract_all skips a field's extractor
+    # when none of them occur in the text
+    FIELD_ANCHORS: Dict[str, Tuple[str, ...]] = {}
+    
+    @classmethod
+    def cheap_gate(cls, text_lower: str) -> bool:
+        """
+        Fast substring check for whether text can belong to this issuer
+        
+        Args:
+            text_lower: Lowercased extracted text
+            
+        Returns:
+            False only when none of the issuer patterns can possibly match
+        """
+        if not cls.IDENTIFYING_LITERALS:
+            return True
+        return cls.mentions_any(text_lower, cls.IDENTIFYING_LITERALS)
+    
+    @staticmethod
+    def mentions_any(text_lower: str, literals: Tuple[str, ...]) -> bool:
+        """
+        Check whether any lowercase literal occurs in the text
+        
+        Substring search is much cheaper than a regex scan, so extractors
+        use it to skip pattern batches whose required label is absent.
+        
+        Args:
+            text_lower: Lowercased extracted text
+            literals: Lowercase words at least one of which every pattern needs
+            
+        Returns:
+            True if any literal is present
+        """
+        return any(lit in text_lower for lit in literals)
+    
+    @staticmethod
+    def collapse_spaces(value: str) -> str:
+        """
+        Collapse whitespace runs to single spaces and trim, like ' '.join(value.split())
+        
+        Captured card numbers are usually already clean; isprintable() rules
+        out every whitespace character except the plain space, so in that
+        case only doubled or edge spaces need the split/join.
+        
+        Args:
+            value: Captured text
+            
+        Returns:
+            Text with single-space separators
+        """
+        if value.isprintable() and "  " not in value and value[:1] != " " and value[-1:] != " ":
+            return value
+        return " ".join(value.split())
     
     @abstractmethod
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
@@ -81,12 +228,62 @@ class BaseExtractor(ABC):
         """
         pass
     
-    def extract_all(self, text: str) -> dict:
+    def _extract_field(self, field: str, extract, text: str, text_lower: str) -> Tuple[object, float]:
+        """
+        Run a field extractor unless the field's anchor words are all absent
+        
+        Args:
+            field: extract_all field name, as in FIELD_ANCHORS
+            extract: Field extractor taking the text and returning (value, confidence)
+            text: Extracted text from PDF
+            text_lower: Lowercased text, computed once per extraction
+            
+        Returns:
+            Tuple of (value, confidence_score)
+        """
+        anchors = self.FIELD_ANCHORS.get(field)
+        if anchors is not None and not self.mentions_any(text_lower, anchors):
+            logger.warning(f"{self.__class__.__name__}: No {field} anchor in text, skipping its patterns")
+            return _EMPTY_FIELDS[field](), 0.0
+        return extract(text)
+    
+    def _issuer_mismatch_result(self, issuer: str, issuer_conf: float) -> dict:
+        """
+        Empty extract_all result for text that doesn't confirm this issuer
+        
+        Args:
+            issuer: Issuer name as extracted (usually empty)
+            issuer_conf: Issuer confidence score
+            
+        Returns:
+            Dictionary shaped like extract_all output with every field empty
+        """
+        logger.info(
+            f"{self.__class__.__name__}: Issuer not confirmed (confidence {issuer_conf}), skipping field extraction"
+        )
+        return {
+            "data": {
+                "card_issuer": issuer,
+                **{field: empty() for field, empty in _EMPTY_FIELDS.items() if field != "card_issuer"},
+            },
+            "confidence": {
+                "card_issuer": issuer_conf,
+                "card_number": 0.0,
+                "statement_period": 0.0,
+                "payment_due_date": 0.0,
+                "total_amount_due": 0.0,
+            }
+        }
+    
+    @memoize_extraction
+    def extract_all(self, text: str, *, fail_fast: bool = False) -> dict:
         """
         Extract all data points
         
         Args:
             text: Extracted text from PDF
+            fail_fast: Return an empty result straight away when the issuer
+                isn't confirmed, for callers probing several extractors
             
         Returns:
             Dictionary with all extracted data and confidence scores
@@ -95,15 +292,23 @@ class BaseExtractor(ABC):
         
         # Show extracted text to help troubleshoot
         logger.info(f"Text length: {len(text)} characters")
-        if len(text) > 0:
+        if text and logger.isEnabledFor(logging.INFO):
             logger.info(f"First 800 chars:\n{text[:800]}")
             logger.info(f"Last 800 chars:\n{text[-800:]}")
         
-        issuer, issuer_conf = self.extract_card_issuer(text)
-        card_number, card_conf = self.extract_card_number(text)
-        statement_period, period_conf = self.extract_statement_period(text)
-        due_date, due_conf = self.extract_due_date(text)
-        total_amount, amount_conf = self.extract_total_amount(text)
+        # Lowercased once for every field's anchor precheck
+        text_lower = text.lower() if self.FIELD_ANCHORS else text
+        issuer, issuer_conf = self._extract_field("card_issuer", self.extract_card_issuer, text, text_lower)
+        if fail_fast and issuer_conf < settings.MIN_CONFIDENCE_SCORE:
+            return self._issuer_mismatch_result(issuer, issuer_conf)
+        card_number, card_conf = self._extract_field("card_number", self.extract_card_number, text, text_lower)
+        statement_period, period_conf = self._extract_field(
+            "statement_period", self.extract_statement_period, text, text_lower
+        )
+        due_date, due_conf = self._extract_field("payment_due_date", self.extract_due_date, text, text_lower)
+        total_amount, amount_conf = self._extract_field(
+            "total_amount_due", self.extract_total_amount, text, text_lower
+        )
 
         # Optional fields via generic heuristics
         minimum_amount = self._extract_minimum_amount_due(text)
@@ -156,13 +361,8 @@ class BaseExtractor(ABC):
     # Generic optional extractors
     # -----------------------
     def _extract_minimum_amount_due(self, text: str) -> Optional[AmountField]:
-        patterns = [
-            r"Minimum\s+Amount\s+Due\s*[:\-]?\s*Rs\.?\s*[^\d]{0,2}([\d,]+\.?\d*)",
-            r"Minimum\s+Amount\s+Due\s*[\n\r\s]+[^\d]{0,2}([\d,]+\.?\d*)",
-            r"Min\.?\s+Amt\.?\s+Due\s*[:\-]?\s*[^\d]{0,2}([\d,]+\.?\d*)",
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _MIN_DUE_PATTERNS:
+            m = p.search(text)
             if m:
                 amt_str = m.group(1).replace(',', '')
                 try:
@@ -173,13 +373,8 @@ class BaseExtractor(ABC):
         return None
 
     def _extract_previous_balance(self, text: str) -> Optional[AmountField]:
-        patterns = [
-            r"Previous\s+Balance\s*[:\-]?\s*Rs\.?\s*[^\d]{0,2}([\d,]+\.?\d*)",
-            r"Previous\s+Balance\s*[\n\r\s]+[^\d]{0,2}([\d,]+\.?\d*)",
-            r"Opening\s+Balance\s*[:\-]?\s*[^\d]{0,2}([\d,]+\.?\d*)",
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _PREV_BALANCE_PATTERNS:
+            m = p.search(text)
             if m:
                 amt_str = m.group(1).replace(',', '')
                 try:
@@ -190,13 +385,8 @@ class BaseExtractor(ABC):
         return None
 
     def _extract_available_credit_limit(self, text: str) -> Optional[AmountField]:
-        patterns = [
-            r"Available\s+Credit\s+Limit\s*[:\-]?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"Available\s+Credit\s*[\n\r\s]+([\d,]+\.?\d*)",
-            r"Credit\s+Limit\s*[:\-]?\s*([\d,]+\.?\d*)",
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _CREDIT_LIMIT_PATTERNS:
+            m = p.search(text)
             if m:
                 amt_str = m.group(1).replace(',', '')
                 try:
@@ -207,32 +397,26 @@ class BaseExtractor(ABC):
         return None
 
     def _extract_reward_points_summary(self, text: str) -> Optional[str]:
-        patterns = [
-            r"Reward\s+Points\s+Summary[\s\S]{0,120}?Total\s*:?\s*([\d,]+)",
-            r"Total\s+Reward\s+Points\s*:?\s*([\d,]+)",
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _REWARDS_PATTERNS:
+            m = p.search(text)
             if m:
                 return m.group(0).strip()
         # If a section exists without total, capture a short snippet
-        sec = re.search(r"Reward\s+Points\s+Summary[\s\S]{0,200}", text, re.IGNORECASE)
+        sec = _REWARDS_SECTION_RE.search(text)
         return sec.group(0).strip() if sec else None
 
     def _extract_transactions(self, text: str) -> Optional[List[dict]]:
         # Heuristic: lines with date + merchant + amount
         lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
         txns: List[dict] = []
-        date_pat = re.compile(r"(\d{2}[\-/]\d{2}[\-/]\d{4}|\d{2}[\-/]\d{2}[\-/]\d{2})")
-        amount_pat = re.compile(r"([\-]?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)$")
         for ln in lines:
-            d_match = date_pat.search(ln)
+            d_match = _TXN_DATE_RE.search(ln)
             if not d_match:
                 continue
             # Split line into parts; assume last token is amount
             parts = ln.split()
             last = parts[-1]
-            if not amount_pat.search(last):
+            if not _TXN_AMOUNT_RE.search(last):
                 continue
             amount = last
             merchant = ' '.join(parts[1:-1]) if len(parts) > 2 else ''
@@ -1,16 +1,62 @@
 """Capital One extractor"""
-import regex as re
+import re
 from typing import Tuple
 from app.core.extractors.base import BaseExtractor
 from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
 from app.utils.date_parser import parse_date, parse_date_range
 from app.utils.amount_parser import parse_amount
+from app.utils import safe_re
+from app.utils.regex_patterns import PatternUnion
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Patterns are compiled once at import time
+_CAPONE_ISSUER_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    r"Capital\s+One\s+Europe",
+    r"capitalone\.co\.uk",
+    r"Capital\s+One",
+))
+
+_CAPONE_CARD_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    r"(\d{4}\s*\*{4}\s*\*{4}\s*\d{4})",
+    r"(\d{4}\s*X{4}\s*X{4}\s*\d{4})",
+    r"Card\s+ending\s+in\s+(\d{4})",
+    r"(\d{4})(?:\s|$)",  # Last resort: just 4 digits
+))
+
+_CAPONE_PERIOD_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    # Capital One uses "Statement date DD Month YY" format
+    r"Statement\s+date\s+(\d{1,2}\s+\w+\s+\d{2,4})",
+    r"From\s+(\d{8})\s+to\s+(\d{8})",
+    r"Statement\s+Period\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
+    r"(\d{1,2}\s+\w+\s+\d{4})\s+to\s+(\d{1,2}\s+\w+\s+\d{4})",
+))
+
+_CAPONE_DUE_PATS = tuple(safe_re.compile(p, re.IGNORECASE) for p in (
+    # Capital One uses "It's due on DD Mon YY" format
+    r"(?:It'?s\s+)?due\s+on\s+(\d{1,2}\s+\w+\s+\d{2,4})",
+    r"Payment\s+Due\s+Date\s*:?\s*(\d{8})",
+    r"Due\s+Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})",
+    r"Pay\s+by\s*:?\s*(\d{1,2}\s+\w+\s+\d{2,4})",
+    # Generic date after "due"
+    r"due\s+(?:date\s+)?(?:on\s+)?(\d{1,2}\s+\w+\s+\d{2,4})",
+))
+
+_CAPONE_TOTAL_UNION = PatternUnion((
+    # Capital One shows "Your new balance £amount"
+    r"(?:Your\s+)?[Nn]ew\s+balance\s+£\s*([\d,]+\.?\d*)",
+    r"NEW\s+CLOSING\s+BALANCE\s+£\s*([\d,]+\.?\d*)",
+    r"Total\s+Amount\s+Due\s*:?\s*£\s*([\d,]+\.?\d*)",
+    r"New\s+Balance\s*:?\s*£\s*([\d,]+\.?\d*)",
+    r"Amount\s+Due\s*:?\s*£\s*([\d,]+\.?\d*)",
+    # Support GBP symbol without space
+    r"(?:Your\s+)?[Nn]ew\s+balance\s+£([\d,]+\.?\d*)",
+), re.IGNORECASE)
+
+
 class CapitalOneExtractor(BaseExtractor):
     """Extractor for Capital One Europe credit card statements"""
     
@@ -18,29 +64,16 @@ class CapitalOneExtractor(BaseExtractor):
     
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
         """Extract Capital One name"""
-        patterns = [
-            r"Capital\s+One\s+Europe",
-            r"capitalone\.co\.uk",
-            r"Capital\s+One",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _CAPONE_ISSUER_PATS:
+            if pattern.search(text):
                 return self.ISSUER_NAME.value, 1.0
         
         return "", 0.0
     
     def extract_card_number(self, text: str) -> Tuple[str, float]:
         """Extract card number - Capital One format: 4811 (short) or full masked"""
-        patterns = [
-            r"(\d{4}\s*\*{4}\s*\*{4}\s*\d{4})",
-            r"(\d{4}\s*X{4}\s*X{4}\s*\d{4})",
-            r"Card\s+ending\s+in\s+(\d{4})",
-            r"(\d{4})(?:\s|$)",  # Last resort: just 4 digits
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CAPONE_CARD_PATS:
+            match = pattern.search(text)
             if match:
                 card_num = match.group(1)
                 return card_num, 0.9 if len(card_num) == 4 else 1.0
@@ -50,16 +83,8 @@ class CapitalOneExtractor(BaseExtractor):
     
     def extract_statement_period(self, text: str) -> Tuple[DateRangeField, float]:
         """Extract statement period - Capital One format: Statement date 5 October 24"""
-        patterns = [
-            # Capital One uses "Statement date DD Month YY" format
-            r"Statement\s+date\s+(\d{1,2}\s+\w+\s+\d{2,4})",
-            r"From\s+(\d{8})\s+to\s+(\d{8})",
-            r"Statement\s+Period\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"(\d{1,2}\s+\w+\s+\d{4})\s+to\s+(\d{1,2}\s+\w+\s+\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CAPONE_PERIOD_PATS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 1:
@@ -104,18 +129,8 @@ class CapitalOneExtractor(BaseExtractor):
     
     def extract_due_date(self, text: str) -> Tuple[DateField, float]:
         """Extract payment due date - Capital One format: It's due on 31 Oct 24"""
-        patterns = [
-            # Capital One uses "It's due on DD Mon YY" format
-            r"(?:It'?s\s+)?due\s+on\s+(\d{1,2}\s+\w+\s+\d{2,4})",
-            r"Payment\s+Due\s+Date\s*:?\s*(\d{8})",
-            r"Due\s+Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})",
-            r"Pay\s+by\s*:?\s*(\d{1,2}\s+\w+\s+\d{2,4})",
-            # Generic date after "due"
-            r"due\s+(?:date\s+)?(?:on\s+)?(\d{1,2}\s+\w+\s+\d{2,4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CAPONE_DUE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
                 date_formatted = parse_date(date_raw)
@@ -133,31 +148,18 @@ class CapitalOneExtractor(BaseExtractor):
     
     def extract_total_amount(self, text: str) -> Tuple[AmountField, float]:
         """Extract total amount due - Capital One format: Your new balance £1,219.26"""
-        patterns = [
-            # Capital One shows "Your new balance £amount"
-            r"(?:Your\s+)?[Nn]ew\s+balance\s+£\s*([\d,]+\.?\d*)",
-            r"NEW\s+CLOSING\s+BALANCE\s+£\s*([\d,]+\.?\d*)",
-            r"Total\s+Amount\s+Due\s*:?\s*£\s*([\d,]+\.?\d*)",
-            r"New\s+Balance\s*:?\s*£\s*([\d,]+\.?\d*)",
-            r"Amount\s+Due\s*:?\s*£\s*([\d,]+\.?\d*)",
-            # Support GBP symbol without space
-            r"(?:Your\s+)?[Nn]ew\s+balance\s+£([\d,]+\.?\d*)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount_raw = match.group(0)
-                amount, currency = parse_amount(amount_raw, default_currency="GBP")
-                
-                if amount is not None and amount > 0:
-                    field = AmountField(
-                        raw=amount_raw,
-                        amount=amount,
-                        currency=currency
-                    )
-                    logger.info(f"Capital One: Found amount: {currency} {amount}")
-                    return field, 1.0
+        for _, match in _CAPONE_TOTAL_UNION.matches(text):
+            amount_raw = match.group(0)
+            amount, currency = parse_amount(amount_raw, default_currency="GBP")
+            
+            if amount is not None and amount > 0:
+                field = AmountField(
+                    raw=amount_raw,
+                    amount=amount,
+                    currency=currency
+                )
+                logger.info(f"Capital One: Found amount: {currency} {amount}")
+                return field, 1.0
         
         logger.warning("Capital One: Total amount not found")
         return AmountField(raw="", amount=0.0, currency="GBP"), 0.0
@@ -0,0 +1,21 @@
+"""Issuer-agnostic label patterns shared by the extractors"""
+import re
+from app.utils import safe_re
+
+
+# Currency marker and amount capture used across statement labels
+CURRENCY = r"(?:Rs\.?|INR|₹)"
+AMOUNT = r"([\d,]+\.?\d*)"
+
+# Label followed by a mandatory currency marker
+TOTAL_AMOUNT_DUE = safe_re.compile(rf"Total\s+Amount\s+Due\s*:?\s*{CURRENCY}\s*{AMOUNT}", re.IGNORECASE)
+TOTAL_OUTSTANDING = safe_re.compile(rf"Total\s+Outstanding\s*:?\s*{CURRENCY}\s*{AMOUNT}", re.IGNORECASE)
+AMOUNT_DUE = safe_re.compile(rf"Amount\s+Due\s*:?\s*{CURRENCY}\s*{AMOUNT}", re.IGNORECASE)
+NEW_BALANCE = safe_re.compile(rf"New\s+Balance\s*:?\s*{CURRENCY}\s*{AMOUNT}", re.IGNORECASE)
+CLOSING_BALANCE = safe_re.compile(rf"Closing\s+Balance\s*:?\s*{CURRENCY}\s*{AMOUNT}", re.IGNORECASE)
+
+# Label followed by an optional currency marker
+MINIMUM_AMOUNT_DUE = safe_re.compile(rf"Minimum\s+Amount\s+Due\s*[:\-]?\s*{CURRENCY}?\s*{AMOUNT}", re.IGNORECASE)
+OPENING_BALANCE = safe_re.compile(rf"Opening\s+Balance\s*[:\-]?\s*{CURRENCY}?\s*{AMOUNT}", re.IGNORECASE)
+AVAILABLE_CREDIT = safe_re.compile(rf"Available\s+Credit\s*[:\-]?\s*{CURRENCY}?\s*{AMOUNT}", re.IGNORECASE)
+CREDIT_LIMIT = safe_re.compile(rf"Credit\s+Limit\s*[:\-]?\s*{CURRENCY}?\s*{AMOUNT}", re.IGNORECASE)
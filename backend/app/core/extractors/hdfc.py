@@ -1,46 +1,114 @@
 """HDFC Bank extractor"""
-import regex as re
+import re
 from typing import Tuple, Optional
-from app.core.extractors.base import BaseExtractor
+from app.core.extractors.base import BaseExtractor, memoize_extraction
+from app.core.extractors.issuer_router import mentioned_issuers
 from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
-from app.utils.date_parser import parse_date, parse_date_range
+from app.config import settings
+from app.utils.date_parser import parse_date, parse_date_range, parse_dmy_slash
 from app.utils.amount_parser import parse_amount
+from app.utils.regex_patterns import PatternUnion
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Integer tokens inside the tolerant rewards window
+_INT_TOKEN_RE = re.compile(r"\b\d[\d,]*\b")
+
+# Due date patterns tagged with the shape of the captured date
+_DUE_DATE_PATTERNS = tuple(
+    (shape, re.compile(pattern, re.IGNORECASE | re.DOTALL))
+    for shape, pattern in (
+        # Look for any DD/MM/YYYY date after "Payment Due Date" within 200 characters
+        ("ddmmyyyy_slash", r"Payment\s+Due\s+Date.{0,200}?(\d{2}/\d{2}/\d{4})"),
+        ("ddmmyyyy_slash", r"Due\s+Date.{0,100}?(\d{2}/\d{2}/\d{4})"),
+        # Same line patterns
+        ("ddmmyyyy_slash", r"Payment\s+Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})"),
+        ("ddmmyyyy_slash", r"Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})"),
+        ("ddmmyyyy_slash", r"Pay\s+by\s*:?\s*(\d{2}/\d{2}/\d{4})"),
+        # Also support 8-digit format (DDMMYYYY)
+        ("ddmmyyyy_compact", r"Payment\s+Due\s+Date.{0,200}?(\d{8})"),
+    )
+)
+
+_CARD_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"(\d{4}\s*\d{2}X{2}\s*X{4}\s*\d{4})",
+    r"(\d{4}\s+X{4}\s+X{4}\s+\d{4})",
+    r"Card\s+No\.?\s*:?\s*(\d{4}\s+\d{2}X{2}\s+X{4}\s+\d{4})",
+))
+
+_PERIOD_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # HDFC shows "Statement Date:DD/MM/YYYY" format
+    r"Statement\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
+    r"Statement\s+for.*?(\d{2}/\d{2}/\d{4})",
+    # Also support 8-digit format (DDMMYYYY)
+    r"Statement\s+Date\s*:?\s*(\d{8})",
+    # Look for two dates near "Statement" or "Period"
+    r"(?:Statement|Period|From).{0,100}?(\d{2}/\d{2}/\d{4}).{0,50}?(?:to|To)\s*(\d{2}/\d{2}/\d{4})",
+))
+
+_TOTAL_UNION = PatternUnion((
+    # HDFC shows "Payment Due Date Minimum Amount Due" followed by amounts on next line
+    # Format: "28/06/2019 45,240.00 2,262.00" - first number after date is total
+    r"Payment\s+Due\s+Date\s+Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)",
+    r"Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)",
+    # Standard patterns
+    r"Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"Total\s+Dues\s*:?\s*([\d,]+\.?\d*)",
+    r"New\s+Balance\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"CLOSING\s+BALANCE\s*:?\s*([\d,]+\.?\d*)",
+    # Just look for the pattern "DD/MM/YYYY number number" and take first number
+    r"\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+[\d,]+\.?\d*",
+), re.IGNORECASE)
+
+_MIN_DUE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # Table header where amounts follow the date line
+    r"Payment\s+Due\s+Date\s+Minimum\s+Amount\s+Due[\s\S]{0,60}?\n\s*\d{2}/\d{2}/\d{4}\s+[\d,]+\.?\d*\s+([\d,]+\.?\d*)",
+    r"Minimum\s+Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+))
+
+_PREV_BALANCE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Previous\s+Balance\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+    # Look in Statement Summary row for the first numeric field
+    r"Statement\s+Summary[\s\S]{0,120}?([\d,]+\.?\d*)\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*",
+))
+
+_CREDIT_LIMIT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"Available\s+Credit\s+Limit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+    r"Available\s+Credit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+    r"Credit\s+Limit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
+))
+
+# Rewards: 4-number table, section header, explicit closing balance, snippets
+_REWARDS_TABLE_RE = re.compile(
+    r"Opening\s+Balance\s+Earned[\s\S]{0,40}?Redeemed[\s\S]{0,40}?Closing\s+Balance[\s\S]{0,140}?" \
+    r"(\d[\d,]*)\s+(\d[\d,]*)\s+(\d[\d,]*)\s+(\d[\d,]*)",
+    re.IGNORECASE,
+)
+_REWARDS_HEADER_RE = re.compile(r"Reward[s]?\s+Points\s+Summary|Rewards?\s+.*?Opening\s+Balance", re.IGNORECASE)
+_REWARDS_CLOSING_RE = re.compile(r"Rewards?\s+.*?Closing\s+Balance\s*:?\s*([\d,]+)", re.IGNORECASE | re.DOTALL)
+_REWARDS_SECTION_RE = re.compile(r"Reward[s]?\s+Points\s+Summary[\s\S]{0,200}", re.IGNORECASE)
+_REWARDS_SNIPPET_RE = re.compile(r"Rewards[\s\S]{0,200}", re.IGNORECASE)
+
 
 class HDFCExtractor(BaseExtractor):
     """Extractor for HDFC Bank credit card statements"""
     
     ISSUER_NAME = CardIssuer.HDFC
+    IDENTIFYING_LITERALS = ("hdfc", "platinum", "33aaach2702h2z6")
     
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
         """Extract HDFC Bank name"""
-        patterns = [
-            r"HDFC\s+Bank",
-            r"Platinum\s+Times\s+Card",
-            r"GSTIN\s*33AAACH2702H2Z6",
-            r"hdfcbank\.com",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return self.ISSUER_NAME.value, 1.0
+        if "hdfc" in mentioned_issuers(text):
+            return self.ISSUER_NAME.value, 1.0
         
         return "", 0.0
     
     def extract_card_number(self, text: str) -> Tuple[str, float]:
         """Extract card number - HDFC format: 5228 52XX XXXX 0591"""
-        patterns = [
-            r"(\d{4}\s*\d{2}X{2}\s*X{4}\s*\d{4})",
-            r"(\d{4}\s+X{4}\s+X{4}\s+\d{4})",
-            r"Card\s+No\.?\s*:?\s*(\d{4}\s+\d{2}X{2}\s+X{4}\s+\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _CARD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 card_num = match.group(1) if match.lastindex else match.group(0)
                 # Normalize spacing
@@ -52,18 +120,8 @@ class HDFCExtractor(BaseExtractor):
     
     def extract_statement_period(self, text: str) -> Tuple[DateRangeField, float]:
         """Extract statement period - HDFC format: Statement Date:08/06/2019"""
-        patterns = [
-            # HDFC shows "Statement Date:DD/MM/YYYY" format
-            r"Statement\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
-            r"Statement\s+for.*?(\d{2}/\d{2}/\d{4})",
-            # Also support 8-digit format (DDMMYYYY)
-            r"Statement\s+Date\s*:?\s*(\d{8})",
-            # Look for two dates near "Statement" or "Period"
-            r"(?:Statement|Period|From).{0,100}?(\d{2}/\d{2}/\d{4}).{0,50}?(?:to|To)\s*(\d{2}/\d{2}/\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _PERIOD_PATTERNS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) == 1:
@@ -108,23 +166,14 @@ class HDFCExtractor(BaseExtractor):
     
     def extract_due_date(self, text: str) -> Tuple[DateField, float]:
         """Extract payment due date - HDFC format: 28/06/2019"""
-        patterns = [
-            # Look for any DD/MM/YYYY date after "Payment Due Date" within 200 characters
-            r"Payment\s+Due\s+Date.{0,200}?(\d{2}/\d{2}/\d{4})",
-            r"Due\s+Date.{0,100}?(\d{2}/\d{2}/\d{4})",
-            # Same line patterns
-            r"Payment\s+Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
-            r"Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
-            r"Pay\s+by\s*:?\s*(\d{2}/\d{2}/\d{4})",
-            # Also support 8-digit format (DDMMYYYY)
-            r"Payment\s+Due\s+Date.{0,200}?(\d{8})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for shape, pattern in _DUE_DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
-                date_formatted = parse_date(date_raw)
+                if shape == "ddmmyyyy_slash":
+                    date_formatted = parse_dmy_slash(date_raw)
+                else:
+                    date_formatted = parse_date(date_raw)
                 
                 if date_formatted:
                     field = DateField(
@@ -139,38 +188,22 @@ class HDFCExtractor(BaseExtractor):
     
     def extract_total_amount(self, text: str) -> Tuple[AmountField, float]:
         """Extract total amount due - HDFC format: 45,240.00"""
-        patterns = [
-            # HDFC shows "Payment Due Date Minimum Amount Due" followed by amounts on next line
-            # Format: "28/06/2019 45,240.00 2,262.00" - first number after date is total
-            r"Payment\s+Due\s+Date\s+Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)",
-            r"Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)",
-            # Standard patterns
-            r"Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"Total\s+Dues\s*:?\s*([\d,]+\.?\d*)",
-            r"New\s+Balance\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
-            r"CLOSING\s+BALANCE\s*:?\s*([\d,]+\.?\d*)",
-            # Just look for the pattern "DD/MM/YYYY number number" and take first number
-            r"\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+[\d,]+\.?\d*",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount_raw = match.group(1)
-                # Clean and parse the amount
-                amount_str = amount_raw.replace(',', '')
-                try:
-                    amount = float(amount_str)
-                    if amount > 0:
-                        field = AmountField(
-                            raw=amount_raw,
-                            amount=amount,
-                            currency="INR"
-                        )
-                        logger.info(f"HDFC: Found amount: INR {amount}")
-                        return field, 1.0
-                except ValueError:
-                    continue
+        for _, match in _TOTAL_UNION.matches(text):
+            amount_raw = match.group(1)
+            # Clean and parse the amount
+            amount_str = amount_raw.replace(',', '')
+            try:
+                amount = float(amount_str)
+                if amount > 0:
+                    field = AmountField(
+                        raw=amount_raw,
+                        amount=amount,
+                        currency="INR"
+                    )
+                    logger.info(f"HDFC: Found amount: INR {amount}")
+                    return field, 1.0
+            except ValueError:
+                continue
         
         logger.warning("HDFC: Total amount not found")
         return AmountField(raw="", amount=0.0, currency="INR"), 0.0
@@ -180,13 +213,8 @@ class HDFCExtractor(BaseExtractor):
     # -----------------------
     def extract_minimum_amount_due(self, text: str) -> Optional[AmountField]:
         """Extract Minimum Amount Due from the summary table next to Payment Due Date."""
-        patterns = [
-            # Table header where amounts follow the date line
-            r"Payment\s+Due\s+Date\s+Minimum\s+Amount\s+Due[\s\S]{0,60}?\n\s*\d{2}/\d{2}/\d{4}\s+[\d,]+\.?\d*\s+([\d,]+\.?\d*)",
-            r"Minimum\s+Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        ]
-        for p in patterns:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _MIN_DUE_PATTERNS:
+            m = p.search(text)
             if m:
                 raw = m.group(1)
                 try:
@@ -200,13 +228,8 @@ class HDFCExtractor(BaseExtractor):
 
     def extract_previous_balance(self, text: str) -> Optional[AmountField]:
         """Extract previous balance from Statement Summary row."""
-        pats = [
-            r"Previous\s+Balance\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-            # Look in Statement Summary row for the first numeric field
-            r"Statement\s+Summary[\s\S]{0,120}?([\d,]+\.?\d*)\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*\s+[\d,]+\.?\d*",
-        ]
-        for p in pats:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _PREV_BALANCE_PATTERNS:
+            m = p.search(text)
             if m:
                 raw = m.group(1)
                 try:
@@ -220,13 +243,8 @@ class HDFCExtractor(BaseExtractor):
 
     def extract_available_credit_limit(self, text: str) -> Optional[AmountField]:
         """Extract available credit from Credit Summary block."""
-        labels = [
-            r"Available\s+Credit\s+Limit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-            r"Available\s+Credit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-            r"Credit\s+Limit\s*:?\s*(?:Rs\.?|INR|₹)?\s*([\d,]+\.?\d*)",
-        ]
-        for p in labels:
-            m = re.search(p, text, re.IGNORECASE)
+        for p in _CREDIT_LIMIT_PATTERNS:
+            m = p.search(text)
             if m:
                 raw = m.group(1)
                 try:
@@ -243,51 +261,50 @@ class HDFCExtractor(BaseExtractor):
         Prefer capturing the table: Opening Balance | Earned | Redeemed | Closing Balance
         """
         # 1) Table header pattern capturing 4 numbers after the headers
-        m_table = re.search(
-            r"Opening\s+Balance\s+Earned[\s\S]{0,40}?Redeemed[\s\S]{0,40}?Closing\s+Balance[\s\S]{0,140}?" \
-            r"(\d[\d,]*)\s+(\d[\d,]*)\s+(\d[\d,]*)\s+(\d[\d,]*)",
-            text,
-            re.IGNORECASE,
-        )
+        m_table = _REWARDS_TABLE_RE.search(text)
         if m_table:
             closing = m_table.group(4)
             logger.info("HDFC: Found rewards table; using Closing Balance")
             return f"Rewards Closing Balance: {closing}"
 
         # 1b) More tolerant: find the rewards header and collect integers in a window
-        m_header = re.search(r"Reward[s]?\s+Points\s+Summary|Rewards?\s+.*?Opening\s+Balance", text, re.IGNORECASE)
+        m_header = _REWARDS_HEADER_RE.search(text)
         if m_header:
             start = m_header.start()
-            window = text[start:start + 300]
-            nums = re.findall(r"\b\d[\d,]*\b", window)
-            if nums:
-                closing = nums[-1]
+            last = None
+            for last in _INT_TOKEN_RE.finditer(text, start, start + 300):
+                pass
+            if last is not None:
+                closing = last.group(0)
                 logger.info("HDFC: Rewards window parsed; using last integer as Closing Balance")
                 return f"Rewards Closing Balance: {closing}"
 
         # 2) Any explicit 'Closing Balance' mention
-        m_close = re.search(r"Rewards?\s+.*?Closing\s+Balance\s*:?\s*([\d,]+)", text, re.IGNORECASE | re.DOTALL)
+        m_close = _REWARDS_CLOSING_RE.search(text)
         if m_close:
             logger.info("HDFC: Found rewards closing balance")
             return f"Rewards Closing Balance: {m_close.group(1)}"
 
         # 3) Generic Reward Points Summary section
-        sec = re.search(r"Reward[s]?\s+Points\s+Summary[\s\S]{0,200}", text, re.IGNORECASE)
+        sec = _REWARDS_SECTION_RE.search(text)
         if sec:
             return sec.group(0).strip()
 
         # 4) Fallback: any 'Rewards' block snippet
-        sec2 = re.search(r"Rewards[\s\S]{0,200}", text, re.IGNORECASE)
+        sec2 = _REWARDS_SNIPPET_RE.search(text)
         return sec2.group(0).strip() if sec2 else None
 
-    def extract_all(self, text: str) -> dict:
+    @memoize_extraction
+    def extract_all(self, text: str, *, fail_fast: bool = False) -> dict:
         logger.info(f"Extracting data using {self.__class__.__name__}")
         logger.info(f"Text length: {len(text)} characters")
-        if len(text) > 0:
+        if text and logger.isEnabledFor(logging.INFO):
             logger.info(f"First 800 chars:\n{text[:800]}")
             logger.info(f"Last 800 chars:\n{text[-800:]}")
 
         issuer, issuer_conf = self.extract_card_issuer(text)
+        if fail_fast and issuer_conf < settings.MIN_CONFIDENCE_SCORE:
+            return self._issuer_mismatch_result(issuer, issuer_conf)
         card_number, card_conf = self.extract_card_number(text)
         statement_period, period_conf = self.extract_statement_period(text)
         due_date, due_conf = self.extract_due_date(text)
@@ -1,16 +1,78 @@
 """IDFC First Bank extractor"""
-import regex as re
+import re
 from typing import Tuple
 from app.core.extractors.base import BaseExtractor
+from app.core.extractors.issuer_router import mentioned_issuers
+from app.core.extractors.common_patterns import (
+    TOTAL_AMOUNT_DUE, TOTAL_OUTSTANDING, AMOUNT_DUE, NEW_BALANCE, CLOSING_BALANCE
+)
 from app.models.schemas import DateRangeField, DateField, AmountField
 from app.models.enums import CardIssuer
-from app.utils.date_parser import parse_date, parse_date_range
-from app.utils.amount_parser import parse_amount
+from app.utils.date_parser import parse_dmy, parse_date_range
+from app.utils.amount_parser import parse_amount, parse_amount_fast
+from app.utils import safe_re
+from app.utils.regex_patterns import PatternUnion
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Patterns are compiled once at import time
+_IDFC_CARD_UNION = PatternUnion((
+    # Full format
+    r"Card\s+(?:No|Number)\s*\.?\s*:?\s*([X*\d]{4}\s*[X*\d]{4}\s*[X*\d]{4}\s*\d{4})",
+    r"(\d{4}\s*X{4}\s*X{4}\s*\d{4})",
+    r"(\d{4}\s*\*{4}\s*\*{4}\s*\d{4})",
+    r"(\d{4}[\s\-]X{4}[\s\-]X{4}[\s\-]\d{4})",
+    # Short format (just last digits)
+    r"Card\s+(?:No|Number)\s*\.?\s*:?\s*([X*]{2,6}\d{4})",
+    r"Card\s+(?:No|Number)\s*\.?\s*:?\s*(XX\d{4,6})",
+), re.IGNORECASE)
+
+_IDFC_PERIOD_PATS = tuple(safe_re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    # Mixed format: DD/Mon/YYYY - DD/Mon/YYYY
+    r"(\d{1,2}/\w{3}/\d{4})\s*-\s*(\d{1,2}/\w{3}/\d{4})",
+    # Standard formats
+    r"Statement\s+Period\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Statement\s+for\s+period\s*:?\s*(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"From\s+(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
+    # DD-Mon-YYYY format
+    r"(\d{1,2}-\w{3}-\d{4})\s*(?:to|To|-)\s*(\d{1,2}-\w{3}-\d{4})",
+))
+
+_IDFC_STATEMENT_DATE_PATS = tuple(safe_re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Statement\s+Date\s*:?\s*.{0,100}?(\d{1,2}/\w{3}/\d{4})",
+))
+
+_IDFC_DUE_PATS = tuple(safe_re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    # DD/Mon/YYYY or DD-Mon-YYYY format
+    r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}[/-]\w{3}[/-]\d{4})",
+    r"Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}[/-]\w{3}[/-]\d{4})",
+    # Standard DD/MM/YYYY format
+    r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Pay\s+by\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
+    r"Payment\s+due\s+on\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
+    # Generic pattern - look for date after "due"
+    r"Due\s+(?:Date|on)\s*.{0,50}?(\d{1,2}[/-]\w{3}[/-]\d{4})",
+))
+
+_IDFC_TOTAL_PATS = (
+    # IDFC common patterns
+    TOTAL_AMOUNT_DUE,
+    TOTAL_OUTSTANDING,
+    AMOUNT_DUE,
+    NEW_BALANCE,
+    CLOSING_BALANCE,
+) + tuple(safe_re.compile(p, re.IGNORECASE | re.DOTALL) for p in (
+    # Without currency symbol
+    r"Total\s+Amount\s+Due.{0,100}?([\d,]+\.?\d*)",
+    r"Amount\s+Due.{0,50}?([\d,]+\.?\d*)",
+))
+
+
 class IDFCExtractor(BaseExtractor):
     """Extractor for IDFC First Bank credit card statements"""
     
@@ -18,67 +80,33 @@ class IDFCExtractor(BaseExtractor):
     
     def extract_card_issuer(self, text: str) -> Tuple[str, float]:
         """Extract IDFC First Bank name"""
-        patterns = [
-            r"IDFC\s+First\s+Bank",
-            r"IDFC\s+FIRST\s+Bank",
-            r"idfcfirstbank\.com",
-            r"IDFC\s+Bank",
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.info(f"IDFC: Found issuer: {self.ISSUER_NAME.value}")
-                return self.ISSUER_NAME.value, 1.0
+        if "idfc" in mentioned_issuers(text):
+            logger.info(f"IDFC: Found issuer: {self.ISSUER_NAME.value}")
+            return self.ISSUER_NAME.value, 1.0
         
         return "", 0.0
     
     def extract_card_number(self, text: str) -> Tuple[str, float]:
         """Extract card number - IDFC format: varies (XX7853, XXXX XXXX XXXX 1234)"""
-        patterns = [
-            # Full format
-            r"Card\s+(?:No|Number)\s*\.?\s*:?\s*([X*\d]{4}\s*[X*\d]{4}\s*[X*\d]{4}\s*\d{4})",
-            r"(\d{4}\s*X{4}\s*X{4}\s*\d{4})",
-            r"(\d{4}\s*\*{4}\s*\*{4}\s*\d{4})",
-            r"(\d{4}[\s\-]X{4}[\s\-]X{4}[\s\-]\d{4})",
-            # Short format (just last digits)
-            r"Card\s+(?:No|Number)\s*\.?\s*:?\s*([X*]{2,6}\d{4})",
-            r"Card\s+(?:No|Number)\s*\.?\s*:?\s*(XX\d{4,6})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                card_num = match.group(1).strip()
-                # Normalize spacing
-                card_num = ' '.join(card_num.split())
-                logger.info(f"IDFC: Found card number: {card_num}")
-                return card_num, 0.9
+        for _, match in _IDFC_CARD_UNION.matches(text):
+            # Normalize spacing
+            card_num = self.collapse_spaces(match.group(1))
+            logger.info(f"IDFC: Found card number: {card_num}")
+            return card_num, 0.9
         
         logger.warning("IDFC: Card number not found")
         return "", 0.0
     
     def extract_statement_period(self, text: str) -> Tuple[DateRangeField, float]:
         """Extract statement period - IDFC format: 20/May/2025 - 19/Jun/2025"""
-        patterns = [
-            # Mixed format: DD/Mon/YYYY - DD/Mon/YYYY
-            r"(\d{1,2}/\w{3}/\d{4})\s*-\s*(\d{1,2}/\w{3}/\d{4})",
-            # Standard formats
-            r"Statement\s+Period\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Statement\s+for\s+period\s*:?\s*(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To|-)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"From\s+(\d{2}[/-]\d{2}[/-]\d{4})\s*(?:to|To)\s*(\d{2}[/-]\d{2}[/-]\d{4})",
-            # DD-Mon-YYYY format
-            r"(\d{1,2}-\w{3}-\d{4})\s*(?:to|To|-)\s*(\d{1,2}-\w{3}-\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _IDFC_PERIOD_PATS:
+            match = pattern.search(text)
             if match:
                 groups = match.groups()
                 if len(groups) >= 2:
                     start_raw, end_raw = groups[0], groups[1]
-                    start_date = parse_date(start_raw)
-                    end_date = parse_date(end_raw)
+                    start_date = parse_dmy(start_raw)
+                    end_date = parse_dmy(end_raw)
                     
                     if start_date and end_date:
                         field = DateRangeField(
@@ -90,16 +118,11 @@ class IDFCExtractor(BaseExtractor):
                         return field, 0.95
         
         # Single date patterns
-        single_patterns = [
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Statement\s+Date\s*:?\s*.{0,100}?(\d{1,2}/\w{3}/\d{4})",
-        ]
-        
-        for pattern in single_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _IDFC_STATEMENT_DATE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
-                end_date = parse_date(date_raw)
+                end_date = parse_dmy(date_raw)
                 if end_date:
                     field = DateRangeField(
                         raw=f"Statement Date {date_raw}",
@@ -125,27 +148,11 @@ class IDFCExtractor(BaseExtractor):
     
     def extract_due_date(self, text: str) -> Tuple[DateField, float]:
         """Extract payment due date - IDFC format: 04/Jul/2025"""
-        patterns = [
-            # DD/Mon/YYYY format
-            r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}/\w{3}/\d{4})",
-            r"Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}/\w{3}/\d{4})",
-            # DD-Mon-YYYY format
-            r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}-\w{3}-\d{4})",
-            r"Due\s+Date\s*:?\s*.{0,100}?(\d{1,2}-\w{3}-\d{4})",
-            # Standard DD/MM/YYYY format
-            r"Payment\s+Due\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Due\s+Date\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Pay\s+by\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
-            r"Payment\s+due\s+on\s*:?\s*.{0,100}?(\d{2}[/-]\d{2}[/-]\d{4})",
-            # Generic pattern - look for date after "due"
-            r"Due\s+(?:Date|on)\s*.{0,50}?(\d{1,2}[/-]\w{3}[/-]\d{4})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _IDFC_DUE_PATS:
+            match = pattern.search(text)
             if match:
                 date_raw = match.group(1)
-                date_formatted = parse_date(date_raw)
+                date_formatted = parse_dmy(date_raw)
                 
                 if date_formatted:
                     field = DateField(
@@ -160,26 +167,12 @@ class IDFCExtractor(BaseExtractor):
     
     def extract_total_amount(self, text: str) -> Tuple[AmountField, float]:
         """Extract total amount due - IDFC format: varies"""
-        patterns = [
-            # IDFC common patterns
-            r"Total\s+Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Total\s+Outstanding\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Amount\s+Due\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"New\s+Balance\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            r"Closing\s+Balance\s*:?\s*(?:Rs\.?|INR|₹)\s*([\d,]+\.?\d*)",
-            # Without currency symbol
-            r"Total\s+Amount\s+Due.{0,100}?([\d,]+\.?\d*)",
-            r"Amount\s+Due.{0,50}?([\d,]+\.?\d*)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        for pattern in _IDFC_TOTAL_PATS:
+            match = pattern.search(text)
             if match:
                 amount_raw = match.group(1)
-                # Clean and parse the amount
-                amount_str = amount_raw.replace(',', '')
                 try:
-                    amount = float(amount_str)
+                    amount = parse_amount_fast(amount_raw)
                     if amount > 0:
                         field = AmountField(
                             raw=amount_raw,
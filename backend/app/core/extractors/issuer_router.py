@@ -0,0 +1,72 @@
+"""Single-pass issuer detection shared by the issuer extractors"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import FrozenSet
+
+
+# Each extractor's issuer-confirmation patterns, keyed by group name
+_ISSUER_BRANCHES = {
+    "icici": (
+        r"ICICI\s+Bank",
+        r"GSTIN\s*27AAACI1195H3ZK",
+        r"icicibank\.com",
+    ),
+    "idfc": (
+        r"IDFC\s+First\s+Bank",
+        r"idfcfirstbank\.com",
+        r"IDFC\s+Bank",
+    ),
+    "hdfc": (
+        r"HDFC\s+Bank",
+        r"Platinum\s+Times\s+Card",
+        r"GSTIN\s*33AAACH2702H2Z6",
+        r"hdfcbank\.com",
+    ),
+}
+
+_ISSUER_UNION = re.compile(
+    "|".join(f"(?P<{key}>{'|'.join(patterns)})" for key, patterns in _ISSUER_BRANCHES.items()),
+    re.IGNORECASE,
+)
+
+_CACHE_SIZE = 32
+_cache: "OrderedDict[bytes, FrozenSet[str]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def mentioned_issuers(text: str) -> FrozenSet[str]:
+    """
+    Find every issuer whose confirmation patterns occur in the text
+
+    Extractors probe the same text one after another; the result is cached
+    so the union is scanned once per text rather than once per extractor.
+    The cache is keyed on a digest of the text so entries don't pin it.
+
+    Args:
+        text: Extracted text from PDF
+
+    Returns:
+        Frozenset of issuer keys ("icici", "idfc", "hdfc")
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _cache_lock:
+        issuers = _cache.get(digest)
+        if issuers is not None:
+            _cache.move_to_end(digest)
+            return issuers
+
+    found = set()
+    for match in _ISSUER_UNION.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) == len(_ISSUER_BRANCHES):
+            break
+    issuers = frozenset(found)
+
+    with _cache_lock:
+        _cache[digest] = issuers
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return issuers
+
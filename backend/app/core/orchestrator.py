@@ -1,8 +1,13 @@
 """Parser orchestrator - coordinates all parsing operations"""
+import asyncio
+import hashlib
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional
 from datetime import datetime
 from app.core.parsers.pymupdf_parser import PyMuPDFParser
+from app.core.parsers.pypdfium2_parser import Pypdfium2Parser
 from app.core.parsers.pdfplumber_parser import PDFPlumberParser
 from app.core.parsers.tesseract_parser import TesseractOCRParser, detect_if_ocr_needed
 from app.core.extractors.kotak import KotakExtractor
@@ -20,6 +25,13 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Parse results kept for re-uploads of identical files, bounded by entry
+# count, total serialized size and age
+RESULT_CACHE_SIZE = 64
+RESULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
+RESULT_CACHE_TTL_SECONDS = 15 * 60
+_HASH_CHUNK_BYTES = 4 * 1024 * 1024
+
 
 class ParserOrchestrator:
     """Orchestrates PDF parsing and data extraction"""
@@ -27,8 +39,15 @@ class ParserOrchestrator:
     def __init__(self):
         # Initialize parsers
         self.pymupdf_parser = PyMuPDFParser()
+        self.pypdfium2_parser = Pypdfium2Parser()
         self.pdfplumber_parser = PDFPlumberParser()
         self.tesseract_parser = TesseractOCRParser()
+        self.parsers = {
+            ParserType.PYMUPDF: self.pymupdf_parser,
+            ParserType.PYPDFIUM2: self.pypdfium2_parser,
+            ParserType.PDFPLUMBER: self.pdfplumber_parser,
+            ParserType.TESSERACT: self.tesseract_parser,
+        }
         
         # Initialize extractors
         self.extractors = {
@@ -43,6 +62,11 @@ class ParserOrchestrator:
         
         # Initialize issuer detector
         self.issuer_detector = IssuerDetector()
+        
+        # Completed results keyed by (file digest, use_ocr), least recent
+        # first, as (expiry time, serialized size, result)
+        self._result_cache: "OrderedDict[tuple[str, bool], tuple[float, int, ParseResult]]" = OrderedDict()
+        self._result_cache_bytes = 0
     
     async def parse(
         self,
@@ -67,9 +91,27 @@ class ParserOrchestrator:
         
         logger.info(f"Starting parsing for job {job_id}: {filename}")
         
+        # Identical bytes always parse to the same result
+        cache_key = (await asyncio.to_thread(self._file_digest, file_path), use_ocr)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing result of an identical upload for job {job_id}")
+            # Deep copy so no two jobs share nested data or scores
+            return cached.model_copy(deep=True, update={
+                "job_id": job_id,
+                "filename": filename,
+                "metadata": cached.metadata.model_copy(update={
+                    "processing_time_ms": int((time.time() - start_time) * 1000)
+                }),
+                "processed_at": datetime.utcnow(),
+            })
+        
         # Step 1: Extract text from PDF
+        # Parser outputs for this file, shared with the fallback pass below so
+        # no parser runs twice on the same document
+        parser_runs: dict[ParserType, dict] = {}
         text, parser_used, metadata = await self._extract_text_with_fallback(
-            file_path, use_ocr
+            file_path, use_ocr, parser_runs
         )
         
         if not text or len(text.strip()) < 50:
@@ -78,7 +120,9 @@ class ParserOrchestrator:
         logger.info(f"Extracted {len(text)} characters using {parser_used.value}")
         
         # Step 2: Detect issuer
-        issuer = self.issuer_detector.detect_issuer(text)
+        # Regex scans over the whole statement run off the event loop, like
+        # the parsers, so they don't stall other requests
+        issuer = await asyncio.to_thread(self.issuer_detector.detect_issuer, text)
         if not issuer or issuer == CardIssuer.UNKNOWN:
             logger.warning("Could not detect issuer, using generic extraction")
             issuer = CardIssuer.UNKNOWN
@@ -102,21 +146,20 @@ class ParserOrchestrator:
             else:
                 alt_order = [ParserType.PYMUPDF, ParserType.TESSERACT]
 
+            # Texts already extracted from; parsers often agree byte for byte,
+            # and the same text with the same issuer yields the same data
+            seen_texts = {text}
             for alt in alt_order:
                 try:
-                    if alt == ParserType.PYMUPDF:
-                        alt_text = await self.pymupdf_parser.extract_text(file_path)
-                        if not self.pymupdf_parser.has_sufficient_text(alt_text, settings.MIN_TEXT_THRESHOLD):
-                            continue
-                        alt_metadata = await self.pymupdf_parser.extract_metadata(file_path)
-                    elif alt == ParserType.PDFPLUMBER:
-                        alt_text = await self.pdfplumber_parser.extract_text(file_path)
-                        if not self.pdfplumber_parser.has_sufficient_text(alt_text, settings.MIN_TEXT_THRESHOLD):
-                            continue
-                        alt_metadata = await self.pdfplumber_parser.extract_metadata(file_path)
-                    else:
-                        alt_text = await self.tesseract_parser.extract_text(file_path)
-                        alt_metadata = await self.tesseract_parser.extract_metadata(file_path)
+                    alt_text = await self._parser_text(alt, file_path, parser_runs)
+                    if alt_text in seen_texts:
+                        continue
+                    seen_texts.add(alt_text)
+                    if alt != ParserType.TESSERACT and not self.parsers[alt].has_sufficient_text(
+                        alt_text, settings.MIN_TEXT_THRESHOLD
+                    ):
+                        continue
+                    alt_metadata = await self._parser_metadata(alt, file_path, parser_runs)
 
                     # Re-extract with same issuer
                     alt_extracted = await self._extract_data(alt_text, issuer)
@@ -158,46 +201,196 @@ class ParserOrchestrator:
         
         logger.info(f"Parsing completed for job {job_id}, confidence: {result.confidence_scores.average:.2f}")
         
+        self._cache_result(cache_key, result)
+        
+        return result
+    
+    def _cached_result(self, cache_key: tuple[str, bool]) -> Optional[ParseResult]:
+        """
+        Look up a cached result, dropping it if it has expired
+        
+        Args:
+            cache_key: (file digest, use_ocr)
+            
+        Returns:
+            The cached ParseResult, or None
+        """
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, size, result = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[cache_key]
+            self._result_cache_bytes -= size
+            return None
+        self._result_cache.move_to_end(cache_key)
         return result
     
+    def _cache_result(self, cache_key: tuple[str, bool], result: ParseResult) -> None:
+        """
+        Keep a private copy of a result, evicting the oldest entries past the bounds
+        
+        Args:
+            cache_key: (file digest, use_ocr)
+            result: Result just returned to the caller
+        """
+        size = len(result.model_dump_json())
+        if size > RESULT_CACHE_MAX_BYTES:
+            return
+        previous = self._result_cache.pop(cache_key, None)
+        if previous is not None:
+            self._result_cache_bytes -= previous[1]
+        self._result_cache[cache_key] = (
+            time.monotonic() + RESULT_CACHE_TTL_SECONDS,
+            size,
+            result.model_copy(deep=True),
+        )
+        self._result_cache_bytes += size
+        while (
+            len(self._result_cache) > RESULT_CACHE_SIZE
+            or self._result_cache_bytes > RESULT_CACHE_MAX_BYTES
+        ):
+            _, (_, evicted_size, _) = self._result_cache.popitem(last=False)
+            self._result_cache_bytes -= evicted_size
+    
+    @staticmethod
+    def _file_digest(file_path: str) -> str:
+        """
+        Hash file contents in fixed-size chunks
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Returns:
+            Hex BLAKE2b digest of the file bytes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_BYTES):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    async def _parser_text(self, parser_type: ParserType, file_path: str, parser_runs: dict) -> str:
+        """
+        Extract text with a parser, reusing its earlier output for this file
+        
+        Args:
+            parser_type: Parser to run
+            file_path: Path to PDF file
+            parser_runs: Per-file cache of parser outputs
+            
+        Returns:
+            Extracted text
+        """
+        run = parser_runs.setdefault(parser_type, {})
+        if "text" not in run:
+            run["text"] = await self.parsers[parser_type].extract_text(file_path)
+        return run["text"]
+    
+    async def _parser_metadata(self, parser_type: ParserType, file_path: str, parser_runs: dict) -> dict:
+        """
+        Extract metadata with a parser, reusing its earlier output for this file
+        
+        Args:
+            parser_type: Parser to run
+            file_path: Path to PDF file
+            parser_runs: Per-file cache of parser outputs
+            
+        Returns:
+            Metadata dictionary
+        """
+        run = parser_runs.setdefault(parser_type, {})
+        if "metadata" not in run:
+            run["metadata"] = await self.parsers[parser_type].extract_metadata(file_path)
+        return run["metadata"]
+    
     async def _extract_text_with_fallback(
         self,
         file_path: str,
-        force_ocr: bool = False
+        force_ocr: bool = False,
+        parser_runs: Optional[dict] = None
     ) -> tuple[str, ParserType, dict]:
         """
         Extract text with parser fallback logic
         
+        Args:
+            file_path: Path to PDF file
+            force_ocr: Skip straight to OCR
+            parser_runs: Per-file cache of parser outputs, filled as parsers run
+        
         Returns:
             Tuple of (text, parser_used, metadata)
         """
+        parser_runs = {} if parser_runs is None else parser_runs
+        
         # Check if OCR is needed
-        if force_ocr or detect_if_ocr_needed(file_path, settings.MIN_TEXT_THRESHOLD):
+        needs_ocr = force_ocr
+        if not force_ocr:
+            needs_ocr, detected_text = await asyncio.to_thread(
+                detect_if_ocr_needed, file_path, settings.MIN_TEXT_THRESHOLD
+            )
+            if detected_text is not None and ParserType.PYMUPDF not in parser_runs:
+                # Detection already read every page with PyMuPDF
+                parser_runs[ParserType.PYMUPDF] = {
+                    "text": self.pymupdf_parser.clean_text(detected_text)
+                }
+        
+        if needs_ocr:
             logger.info("Using OCR parser")
-            text = await self.tesseract_parser.extract_text(file_path)
-            metadata = await self.tesseract_parser.extract_metadata(file_path)
+            text = await self._parser_text(ParserType.TESSERACT, file_path, parser_runs)
+            metadata = await self._parser_metadata(ParserType.TESSERACT, file_path, parser_runs)
             return text, ParserType.TESSERACT, metadata
         
-        # Try PyMuPDF first (fastest)
+        # PyMuPDF is preferred (fastest), but pdfplumber starts alongside it so
+        # documents PyMuPDF can't read don't pay for both parsers back to back;
+        # not needed when detection already produced enough PyMuPDF text
         logger.info("Trying PyMuPDF parser")
-        text = await self.pymupdf_parser.extract_text(file_path)
-        
-        if self.pymupdf_parser.has_sufficient_text(text, settings.MIN_TEXT_THRESHOLD):
-            metadata = await self.pymupdf_parser.extract_metadata(file_path)
-            return text, ParserType.PYMUPDF, metadata
+        stop_pdfplumber = threading.Event()
+        pdfplumber_task = None
+        pymupdf_text = parser_runs.get(ParserType.PYMUPDF, {}).get("text")
+        if ParserType.PDFPLUMBER not in parser_runs and not self.pymupdf_parser.has_sufficient_text(
+            pymupdf_text, settings.MIN_TEXT_THRESHOLD
+        ):
+            pdfplumber_task = asyncio.create_task(
+                self.pdfplumber_parser.extract_text(file_path, stop_pdfplumber)
+            )
+        try:
+            text = await self._parser_text(ParserType.PYMUPDF, file_path, parser_runs)
+            
+            if self.pymupdf_parser.has_sufficient_text(text, settings.MIN_TEXT_THRESHOLD):
+                metadata = await self._parser_metadata(ParserType.PYMUPDF, file_path, parser_runs)
+                return text, ParserType.PYMUPDF, metadata
+            
+            # pypdfium2 is nearly as fast and reads some files PyMuPDF can't
+            logger.info("PyMuPDF insufficient, trying pypdfium2")
+            text = await self._parser_text(ParserType.PYPDFIUM2, file_path, parser_runs)
+            
+            if self.pypdfium2_parser.has_sufficient_text(text, settings.MIN_TEXT_THRESHOLD):
+                metadata = await self._parser_metadata(ParserType.PYPDFIUM2, file_path, parser_runs)
+                return text, ParserType.PYPDFIUM2, metadata
+            
+            # Use pdfplumber as fallback
+            logger.info("pypdfium2 insufficient, using pdfplumber")
+            if pdfplumber_task is not None:
+                parser_runs[ParserType.PDFPLUMBER] = {"text": await pdfplumber_task}
+        finally:
+            if pdfplumber_task is not None:
+                # pdfplumber stops at its next page boundary; waiting for it
+                # keeps the run from outliving the request, and gather
+                # retrieves any exception it ended with
+                stop_pdfplumber.set()
+                await asyncio.gather(pdfplumber_task, return_exceptions=True)
         
-        # Try pdfplumber as fallback
-        logger.info("PyMuPDF insufficient, trying pdfplumber")
-        text = await self.pdfplumber_parser.extract_text(file_path)
+        text = await self._parser_text(ParserType.PDFPLUMBER, file_path, parser_runs)
         
         if self.pdfplumber_parser.has_sufficient_text(text, settings.MIN_TEXT_THRESHOLD):
-            metadata = await self.pdfplumber_parser.extract_metadata(file_path)
+            metadata = await self._parser_metadata(ParserType.PDFPLUMBER, file_path, parser_runs)
             return text, ParserType.PDFPLUMBER, metadata
         
         # Last resort: OCR
         logger.info("Text-based parsers failed, falling back to OCR")
-        text = await self.tesseract_parser.extract_text(file_path)
-        metadata = await self.tesseract_parser.extract_metadata(file_path)
+        text = await self._parser_text(ParserType.TESSERACT, file_path, parser_runs)
+        metadata = await self._parser_metadata(ParserType.TESSERACT, file_path, parser_runs)
         return text, ParserType.TESSERACT, metadata
     
     async def _extract_data(self, text: str, issuer: CardIssuer) -> dict:
@@ -215,12 +408,12 @@ class ParserOrchestrator:
             extractor = self.extractors[CardIssuer.HDFC]
         
         # Extract all data
-        extracted = extractor.extract_all(text)
+        extracted = await asyncio.to_thread(extractor.extract_all, text)
         
         # Build Pydantic models
-        # Build ParsedData including optional fields when available
+        # Extractors already return typed field models, so skip re-validation
         data_dict = extracted["data"]
-        parsed_data = ParsedData(
+        parsed_data = ParsedData.model_construct(
             card_issuer=data_dict["card_issuer"],
             card_number=data_dict["card_number"],
             statement_period=data_dict["statement_period"],
@@ -233,12 +426,14 @@ class ParserOrchestrator:
             transactions=data_dict.get("transactions"),
         )
         
-        confidence_scores = ConfidenceScores(
-            card_issuer=extracted["confidence"]["card_issuer"],
-            card_number=extracted["confidence"]["card_number"],
-            statement_period=extracted["confidence"]["statement_period"],
-            payment_due_date=extracted["confidence"]["payment_due_date"],
-            total_amount_due=extracted["confidence"]["total_amount_due"]
+        # float() keeps the coercion validation would do for integer scores
+        confidence = extracted["confidence"]
+        confidence_scores = ConfidenceScores.model_construct(
+            card_issuer=float(confidence["card_issuer"]),
+            card_number=float(confidence["card_number"]),
+            statement_period=float(confidence["statement_period"]),
+            payment_due_date=float(confidence["payment_due_date"]),
+            total_amount_due=float(confidence["total_amount_due"])
         )
         
         return {
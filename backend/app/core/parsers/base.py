@@ -49,9 +49,14 @@ class PDFParser(ABC):
         if not text:
             return False
         
-        # Remove whitespace and count
-        cleaned = text.strip()
-        char_count = len(cleaned)
+        # Length without leading/trailing whitespace, as len(text.strip())
+        # would give, but without copying the whole text to measure it
+        start, end = 0, len(text)
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        char_count = end - start
         
         logger.debug(f"Extracted {char_count} characters (threshold: {threshold})")
         return char_count >= threshold
@@ -69,9 +74,7 @@ class PDFParser(ABC):
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        lines = [line.strip() for line in text.split('\n')]
-        # Remove empty lines
-        lines = [line for line in lines if line]
-        # Join with single newline
-        return '\n'.join(lines)
+        # Strip each line, drop empty ones and join with single newlines;
+        # map/filter run the per-line work in C and keep only the split
+        # lines in memory, not two list copies
+        return '\n'.join(filter(None, map(str.strip, text.split('\n'))))
@@ -1,40 +1,139 @@
 """pdfplumber parser implementation"""
 import pdfplumber
-from typing import Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+import asyncio
+import io
+import multiprocessing
 import os
+import threading
 import logging
 from app.core.parsers.base import PDFParser
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _page_pool_size() -> int:
+    """Number of worker processes for page-parallel extraction"""
+    return settings.PDFPLUMBER_WORKERS or os.cpu_count() or 1
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all page-parallel extractions, created on first use"""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            # Spawned workers avoid forking a process that already runs threads
+            _page_pool = ProcessPoolExecutor(
+                max_workers=_page_pool_size(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _page_pool
+
+
+def shutdown_page_pool() -> None:
+    """Stop the page pool's worker processes, if it was ever started"""
+    global _page_pool
+    with _page_pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+        logger.info("pdfplumber: Shut down page pool")
+
+
+def _page_text(page) -> Optional[str]:
+    """
+    Extract one page's text in plain reading order
+    
+    Layout mode (which pads text to mimic the page geometry) stays off;
+    the extractor patterns only need words and line breaks.
+    
+    Args:
+        page: pdfplumber page
+        
+    Returns:
+        Page text (None or empty for pages without text)
+    """
+    return page.extract_text(
+        x_tolerance=settings.PDFPLUMBER_X_TOLERANCE,
+        y_tolerance=settings.PDFPLUMBER_Y_TOLERANCE,
+        layout=False,
+    )
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[Optional[str]]:
+    """
+    Extract text from a contiguous range of pages in a worker process
+    
+    pdfplumber page objects can't be pickled, so each worker opens the
+    file itself and sends back only the page texts.
+    
+    Args:
+        file_path: Path to PDF file
+        start: First page index
+        stop: Page index to stop before
+        
+    Returns:
+        Text of each page in order (None for pages without text)
+    """
+    with pdfplumber.open(file_path) as pdf:
+        return [_page_text(page) for page in pdf.pages[start:stop]]
+
 
 class PDFPlumberParser(PDFParser):
     """PDF parser using pdfplumber library"""
     
-    async def extract_text(self, file_path: str) -> str:
+    async def extract_text(self, file_path: str, cancel: Optional[threading.Event] = None) -> str:
         """
         Extract text using pdfplumber
         
         Args:
             file_path: Path to PDF file
+            cancel: Event that stops extraction at the next page boundary
             
         Returns:
             Extracted text content
         """
+        return await asyncio.to_thread(self._sync_extract_text, file_path, cancel)
+    
+    def _sync_extract_text(self, file_path: str, cancel: Optional[threading.Event] = None) -> str:
+        """Blocking body of extract_text, run in a worker thread"""
         try:
             logger.info(f"pdfplumber: Extracting text from {file_path}")
             
             with pdfplumber.open(file_path) as pdf:
-                text_content = []
+                # Pages are written straight into one buffer; the trailing
+                # separator becomes an empty line that clean_text drops
+                buf = io.StringIO()
+                page_count = len(pdf.pages)
+                
+                if page_count >= settings.PDFPLUMBER_PARALLEL_MIN_PAGES and _page_pool_size() > 1:
+                    page_texts = self._extract_pages_parallel(file_path, page_count, cancel)
+                    if page_texts is None:
+                        logger.info("pdfplumber: Extraction cancelled")
+                        return ""
+                    for text in page_texts:
+                        if text:
+                            buf.write(text)
+                            buf.write("\n\n")
+                    logger.debug("pdfplumber: Extracted %s pages in worker processes", page_count)
                 
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        text_content.append(text)
-                        logger.debug(f"pdfplumber: Extracted {len(text)} chars from page {page_num + 1}")
+                else:
+                    for page_num, page in enumerate(pdf.pages):
+                        if cancel is not None and cancel.is_set():
+                            logger.info("pdfplumber: Extraction cancelled")
+                            return ""
+                        text = _page_text(page)
+                        if text:
+                            buf.write(text)
+                            buf.write("\n\n")
+                            logger.debug("pdfplumber: Extracted %s chars from page %s", len(text), page_num + 1)
                 
-                full_text = "\n\n".join(text_content)
-                cleaned_text = self.clean_text(full_text)
+                cleaned_text = self.clean_text(buf.getvalue())
                 
                 logger.info(f"pdfplumber: Total extracted {len(cleaned_text)} characters")
                 return cleaned_text
@@ -43,6 +142,42 @@ class PDFPlumberParser(PDFParser):
             logger.error(f"pdfplumber: Error extracting text: {e}")
             return ""
     
+    def _extract_pages_parallel(
+        self,
+        file_path: str,
+        page_count: int,
+        cancel: Optional[threading.Event] = None
+    ) -> Optional[List[Optional[str]]]:
+        """
+        Extract pages in contiguous chunks spread over the worker pool
+        
+        pdfplumber's layout analysis is pure Python, so threads would just
+        contend for the GIL; separate processes parse pages in parallel.
+        
+        Args:
+            file_path: Path to PDF file
+            page_count: Number of pages in the document
+            cancel: Event that abandons the remaining chunks
+            
+        Returns:
+            Text of each page in order, or None if cancelled
+        """
+        pool = _get_page_pool()
+        chunk_size = -(-page_count // min(page_count, _page_pool_size()))
+        futures = [
+            pool.submit(_extract_page_range, file_path, start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        
+        page_texts = []
+        for future in futures:
+            if cancel is not None and cancel.is_set():
+                for pending in futures:
+                    pending.cancel()
+                return None
+            page_texts.extend(future.result())
+        return page_texts
+    
     async def extract_metadata(self, file_path: str) -> Dict[str, Any]:
         """
         Extract PDF metadata
@@ -53,6 +188,10 @@ class PDFPlumberParser(PDFParser):
         Returns:
             Metadata dictionary
         """
+        return await asyncio.to_thread(self._sync_extract_metadata, file_path)
+    
+    def _sync_extract_metadata(self, file_path: str) -> Dict[str, Any]:
+        """Blocking body of extract_metadata, run in a worker thread"""
         try:
             with pdfplumber.open(file_path) as pdf:
                 metadata = {
@@ -1,12 +1,20 @@
 """PyMuPDF (fitz) parser implementation"""
 import fitz  # PyMuPDF
 from typing import Dict, Any
+import asyncio
+import io
 import os
+import threading
 import logging
 from app.core.parsers.base import PDFParser
 
 logger = logging.getLogger(__name__)
 
+# PyMuPDF must not be called from several threads at once, even on
+# separate documents. Every fitz call made off the event loop (parsing,
+# OCR detection and rendering, upload validation) holds this lock.
+FITZ_LOCK = threading.Lock()
+
 
 class PyMuPDFParser(PDFParser):
     """PDF parser using PyMuPDF library"""
@@ -21,22 +29,29 @@ class PyMuPDFParser(PDFParser):
         Returns:
             Extracted text content
         """
+        return await asyncio.to_thread(self._sync_extract_text, file_path)
+    
+    def _sync_extract_text(self, file_path: str) -> str:
+        """Blocking body of extract_text, run in a worker thread"""
         try:
             logger.info(f"PyMuPDF: Extracting text from {file_path}")
             
-            doc = fitz.open(file_path)
-            text_content = []
-            
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                text = page.get_text()
-                text_content.append(text)
-                logger.debug(f"PyMuPDF: Extracted {len(text)} chars from page {page_num + 1}")
-            
-            doc.close()
+            # Pages are cleaned one at a time and streamed into one buffer;
+            # since clean_text drops blank lines, this matches cleaning the
+            # joined document
+            buf = io.StringIO()
+            with FITZ_LOCK, fitz.open(file_path) as doc:
+                for page_num, page in enumerate(doc):
+                    text = page.get_text("text", sort=False)
+                    logger.debug("PyMuPDF: Extracted %s chars from page %s", len(text), page_num + 1)
+                    if not text or text.isspace():
+                        continue
+                    page_text = self.clean_text(text)
+                    if buf.tell():
+                        buf.write("\n")
+                    buf.write(page_text)
             
-            full_text = "\n\n".join(text_content)
-            cleaned_text = self.clean_text(full_text)
+            cleaned_text = buf.getvalue()
             
             logger.info(f"PyMuPDF: Total extracted {len(cleaned_text)} characters")
             return cleaned_text
@@ -55,19 +70,21 @@ class PyMuPDFParser(PDFParser):
         Returns:
             Metadata dictionary
         """
+        return await asyncio.to_thread(self._sync_extract_metadata, file_path)
+    
+    def _sync_extract_metadata(self, file_path: str) -> Dict[str, Any]:
+        """Blocking body of extract_metadata, run in a worker thread"""
         try:
-            doc = fitz.open(file_path)
-            
-            metadata = {
-                "pages": len(doc),
-                "file_size_bytes": os.path.getsize(file_path),
-                "format": "PDF",
-                "encrypted": doc.is_encrypted,
-                "producer": doc.metadata.get("producer", ""),
-                "creator": doc.metadata.get("creator", ""),
-            }
+            with FITZ_LOCK, fitz.open(file_path) as doc:
+                metadata = {
+                    "pages": len(doc),
+                    "file_size_bytes": os.path.getsize(file_path),
+                    "format": "PDF",
+                    "encrypted": doc.is_encrypted,
+                    "producer": doc.metadata.get("producer", ""),
+                    "creator": doc.metadata.get("creator", ""),
+                }
             
-            doc.close()
             return metadata
             
         except Exception as e:
@@ -0,0 +1,101 @@
+"""pypdfium2 parser implementation"""
+import pypdfium2 as pdfium
+from typing import Dict, Any
+import asyncio
+import os
+import threading
+import logging
+from app.core.parsers.base import PDFParser
+
+logger = logging.getLogger(__name__)
+
+# PDFium is not thread-safe, and these calls run in worker threads; every
+# pdfium call, from opening a document to closing it, holds this lock
+PDFIUM_LOCK = threading.Lock()
+
+
+class Pypdfium2Parser(PDFParser):
+    """PDF parser using PDFium through pypdfium2"""
+    
+    async def extract_text(self, file_path: str) -> str:
+        """
+        Extract text using pypdfium2
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Returns:
+            Extracted text content
+        """
+        return await asyncio.to_thread(self._sync_extract_text, file_path)
+    
+    def _sync_extract_text(self, file_path: str) -> str:
+        """Blocking body of extract_text, run in a worker thread"""
+        try:
+            logger.info(f"pypdfium2: Extracting text from {file_path}")
+            
+            text_content = []
+            
+            with PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(file_path)
+                try:
+                    for page_num in range(len(pdf)):
+                        page = pdf[page_num]
+                        textpage = page.get_textpage()
+                        text = textpage.get_text_range()
+                        textpage.close()
+                        page.close()
+                        text_content.append(text)
+                        logger.debug("pypdfium2: Extracted %s chars from page %s", len(text), page_num + 1)
+                finally:
+                    pdf.close()
+            
+            full_text = "\n\n".join(text_content)
+            cleaned_text = self.clean_text(full_text)
+            
+            logger.info(f"pypdfium2: Total extracted {len(cleaned_text)} characters")
+            return cleaned_text
+            
+        except Exception as e:
+            logger.error(f"pypdfium2: Error extracting text: {e}")
+            return ""
+    
+    async def extract_metadata(self, file_path: str) -> Dict[str, Any]:
+        """
+        Extract PDF metadata
+        
+        Args:
+            file_path: Path to PDF file
+            
+        Returns:
+            Metadata dictionary
+        """
+        return await asyncio.to_thread(self._sync_extract_metadata, file_path)
+    
+    def _sync_extract_metadata(self, file_path: str) -> Dict[str, Any]:
+        """Blocking body of extract_metadata, run in a worker thread"""
+        try:
+            with PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(file_path)
+                try:
+                    info = pdf.get_metadata_dict()
+                    metadata = {
+                        "pages": len(pdf),
+                        "file_size_bytes": os.path.getsize(file_path),
+                        "format": "PDF",
+                        "producer": info.get("Producer", ""),
+                        "creator": info.get("Creator", ""),
+                    }
+                finally:
+                    pdf.close()
+            
+            return metadata
+            
+        except Exception as e:
+            logger.error(f"pypdfium2: Error extracting metadata: {e}")
+            return {
+                "pages": 0,
+                "file_size_bytes": os.path.getsize(file_path) if os.path.exists(file_path) else 0,
+                "format": "PDF",
+                "error": str(e)
+            }
@@ -1,15 +1,146 @@
 """Tesseract OCR parser implementation"""
-from pdf2image import convert_from_path
+import fitz  # PyMuPDF
 import pytesseract
-from PIL import Image, ImageEnhance
-from typing import Dict, Any
+from PIL import Image, ImageFilter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+import asyncio
+import functools
+import io
 import os
+import re
+import tempfile
+import threading
 import logging
 from app.core.parsers.base import PDFParser
+from app.core.parsers.pymupdf_parser import FITZ_LOCK
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Pages are OCR'd in parallel by separate tesseract processes, each of which
+# would otherwise start an OpenMP thread per core and oversubscribe the CPU.
+# The tesseract subprocesses inherit this; an explicit setting still wins.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+# Imported after the OpenMP limit is set, since libtesseract reads it on load
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# TESSERACT_CONFIG values tesserocr can honour; anything else needs the CLI
+_PSM_ONLY_CONFIG = re.compile(r"\s*(?:--psm\s+(\d+))?\s*")
+
+# Sharpness enhancement by 1.5 folded into one 3x3 kernel: 1.5 * image minus
+# 0.5 * the SMOOTH filter ([1 1 1; 1 5 1; 1 1 1] / 13), scaled by 26
+_SHARPEN_KERNEL = ImageFilter.Kernel((3, 3), (-1, -1, -1, -1, 34, -1, -1, -1, -1), scale=26)
+_CONTRAST_FACTOR = 2.0
+
+_ocr_pool: Optional[ThreadPoolExecutor] = None
+_ocr_pool_lock = threading.Lock()
+
+
+def _get_ocr_pool() -> ThreadPoolExecutor:
+    """
+    Thread pool shared by all OCR jobs, created on first use
+    
+    pytesseract waits on a tesseract subprocess and tesserocr releases the
+    GIL while recognising, so threads are enough to OCR pages in parallel.
+    Sharing one pool caps concurrent OCR work across requests.
+    """
+    global _ocr_pool
+    with _ocr_pool_lock:
+        if _ocr_pool is None:
+            _ocr_pool = ThreadPoolExecutor(
+                max_workers=_ocr_pool_size(),
+                thread_name_prefix="ocr",
+                initializer=_warm_ocr_thread,
+            )
+        return _ocr_pool
+
+
+def _ocr_pool_size() -> int:
+    """Number of OCR pool threads"""
+    return settings.TESSERACT_WORKERS or os.cpu_count() or 1
+
+
+def warm_ocr_pool() -> None:
+    """
+    Start every OCR pool thread so each loads its language model up front
+    
+    Pool threads are otherwise started by the first pages OCR'd, which
+    would then wait for the model to load. Only useful with tesserocr;
+    the tesseract CLI loads the model per page regardless.
+    """
+    if tesserocr is None or _tesserocr_psm(settings.TESSERACT_CONFIG) is None:
+        return
+    
+    size = _ocr_pool_size()
+    # Each task holds its thread until all are running, forcing the pool
+    # to start one thread per task
+    started = threading.Barrier(size, timeout=60)
+    try:
+        list(_get_ocr_pool().map(lambda _: started.wait(), range(size)))
+        logger.info("Tesseract OCR: Warmed %s OCR threads", size)
+    except threading.BrokenBarrierError:
+        logger.warning("Tesseract OCR: Timed out warming OCR threads")
+
+
+def _warm_ocr_thread() -> None:
+    """OCR pool thread initializer: load the language model before any page"""
+    psm = _tesserocr_psm(settings.TESSERACT_CONFIG)
+    if tesserocr is None or psm is None:
+        return
+    try:
+        api = _tesserocr_api(settings.TESSERACT_LANG, psm)
+        api.SetImage(Image.new("L", (8, 8), 255))
+        api.GetUTF8Text()
+    except Exception as e:
+        # The first page will retry and report the failure
+        logger.warning(f"Tesseract OCR: Failed to warm OCR thread: {e}")
+
+
+def _tesserocr_psm(config: str) -> Optional[int]:
+    """
+    Page segmentation mode for tesserocr from a TESSERACT_CONFIG string
+    
+    Args:
+        config: Tesseract CLI options
+        
+    Returns:
+        The --psm value (3, tesseract's automatic default, if absent), or
+        None if the config carries options tesserocr can't honour
+    """
+    psm_config = _PSM_ONLY_CONFIG.fullmatch(config)
+    if psm_config is None:
+        return None
+    return int(psm_config.group(1)) if psm_config.group(1) else 3
+
+
+_tesserocr_local = threading.local()
+
+
+def _tesserocr_api(lang: str, psm: int) -> "tesserocr.PyTessBaseAPI":
+    """
+    Tesseract API instance of the calling OCR pool thread
+    
+    The API keeps its language model loaded, so each pool thread creates one
+    on first use and reuses it for every later page. Instances aren't
+    thread-safe, hence one per thread rather than one per parser.
+    
+    Args:
+        lang: Tesseract language(s), e.g. "eng"
+        psm: Page segmentation mode
+        
+    Returns:
+        Initialised tesserocr.PyTessBaseAPI
+    """
+    api = getattr(_tesserocr_local, "api", None)
+    if api is None:
+        api = _tesserocr_local.api = tesserocr.PyTessBaseAPI(lang=lang, psm=psm)
+    return api
+
 
 class TesseractOCRParser(PDFParser):
     """PDF parser using Tesseract OCR for image-based PDFs"""
@@ -18,6 +149,12 @@ class TesseractOCRParser(PDFParser):
         self.dpi = settings.TESSERACT_DPI
         self.lang = settings.TESSERACT_LANG
         self.config = settings.TESSERACT_CONFIG
+        
+        # Use the in-process API when installed, unless the config carries
+        # options beyond the page segmentation mode
+        psm = _tesserocr_psm(self.config)
+        self.use_tesserocr = tesserocr is not None and psm is not None
+        self.psm = psm if psm is not None else 3
     
     async def extract_text(self, file_path: str) -> str:
         """
@@ -29,34 +166,29 @@ class TesseractOCRParser(PDFParser):
         Returns:
             Extracted text content
         """
+        return await asyncio.to_thread(self._sync_extract_text, file_path)
+    
+    def _sync_extract_text(self, file_path: str) -> str:
+        """Blocking body of extract_text, run in a worker thread"""
         try:
             logger.info(f"Tesseract OCR: Converting PDF to images and performing OCR on {file_path}")
             
-            # Convert PDF pages to images
-            images = convert_from_path(
-                file_path,
-                dpi=self.dpi,
-                fmt='png'
-            )
+            with FITZ_LOCK, fitz.open(file_path) as doc:
+                page_count = len(doc)
             
-            logger.info(f"Tesseract OCR: Converted to {len(images)} images")
+            logger.info(f"Tesseract OCR: Rendering and OCR'ing {page_count} pages")
             
             text_content = []
             
-            for i, image in enumerate(images):
-                # Preprocess image
-                processed_image = self._preprocess_image(image)
-                
-                # Perform OCR
-                text = pytesseract.image_to_string(
-                    processed_image,
-                    lang=self.lang,
-                    config=self.config
-                )
-                
+            # Each pool thread renders and OCRs its own page, so rendering
+            # (one page at a time, under FITZ_LOCK) overlaps OCR and only
+            # in-flight pages are held in memory; map() still yields them
+            # in page order
+            render_and_ocr = functools.partial(self._ocr_page_at, file_path)
+            for i, text in enumerate(_get_ocr_pool().map(render_and_ocr, range(page_count))):
                 if text:
                     text_content.append(text)
-                    logger.debug(f"Tesseract OCR: Extracted {len(text)} chars from page {i + 1}")
+                    logger.debug("Tesseract OCR: Extracted %s chars from page %s", len(text), i + 1)
             
             full_text = "\n\n".join(text_content)
             cleaned_text = self.clean_text(full_text)
@@ -68,6 +200,71 @@ class TesseractOCRParser(PDFParser):
             logger.error(f"Tesseract OCR: Error performing OCR: {e}")
             return ""
     
+    def _render_page(self, page: "fitz.Page") -> Image.Image:
+        """
+        Rasterize a page straight into a grayscale PIL image
+        
+        PyMuPDF renders in-process into a raw buffer, so there is no
+        pdftoppm subprocess, PNG encode/decode or temp file per page.
+        
+        Args:
+            page: PyMuPDF page
+            
+        Returns:
+            8-bit grayscale image at the configured DPI
+        """
+        pix = page.get_pixmap(dpi=self.dpi, colorspace=fitz.csGRAY)
+        return Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    
+    def _ocr_page_at(self, file_path: str, page_num: int) -> str:
+        """
+        Render and OCR one page of a PDF in an OCR pool thread
+        
+        PyMuPDF can't run in several threads at once, so opening and
+        rendering hold FITZ_LOCK; OCR, the slow part, runs outside it and
+        stays parallel. The rendered image is dropped once OCR'd.
+        
+        Args:
+            file_path: Path to PDF file
+            page_num: Zero-based page index
+            
+        Returns:
+            Recognised text
+        """
+        with FITZ_LOCK, fitz.open(file_path) as doc:
+            image = self._render_page(doc[page_num])
+        return self._ocr_page(image)
+    
+    def _ocr_page(self, image: Image.Image) -> str:
+        """
+        Preprocess and OCR a single page image
+        
+        Args:
+            image: Rendered page
+            
+        Returns:
+            Recognised text
+        """
+        processed_image = self._preprocess_image(image)
+        if self.use_tesserocr:
+            api = _tesserocr_api(self.lang, self.psm)
+            api.SetImage(processed_image)
+            api.SetSourceResolution(self.dpi)
+            return api.GetUTF8Text()
+        # pytesseract would save the image to a temp PNG; a raw PGM file of
+        # our own skips zlib-compressing a multi-megapixel page
+        fd, image_path = tempfile.mkstemp(prefix="ocr_", suffix=".pgm")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                processed_image.save(f, format="PPM")
+            return pytesseract.image_to_string(
+                image_path,
+                lang=self.lang,
+                config=self.config
+            )
+        finally:
+            os.remove(image_path)
+    
     async def extract_metadata(self, file_path: str) -> Dict[str, Any]:
         """
         Extract PDF metadata
@@ -78,12 +275,16 @@ class TesseractOCRParser(PDFParser):
         Returns:
             Metadata dictionary
         """
+        return await asyncio.to_thread(self._sync_extract_metadata, file_path)
+    
+    def _sync_extract_metadata(self, file_path: str) -> Dict[str, Any]:
+        """Blocking body of extract_metadata, run in a worker thread"""
         try:
-            # Convert first page to get page count
-            images = convert_from_path(file_path, dpi=self.dpi)
+            with FITZ_LOCK, fitz.open(file_path) as doc:
+                page_count = len(doc)
             
             return {
-                "pages": len(images),
+                "pages": page_count,
                 "file_size_bytes": os.path.getsize(file_path),
                 "format": "PDF",
                 "ocr_used": True,
@@ -109,51 +310,59 @@ class TesseractOCRParser(PDFParser):
         Returns:
             Processed image
         """
-        # Convert to grayscale
-        image = image.convert('L')
-        
-        # Increase contrast
-        enhancer = ImageEnhance.Contrast(image)
-        image = enhancer.enhance(2.0)
+        # Convert to grayscale (pages are already rendered that way)
+        if image.mode != 'L':
+            image = image.convert('L')
         
-        # Increase sharpness
-        sharpness_enhancer = ImageEnhance.Sharpness(image)
-        image = sharpness_enhancer.enhance(1.5)
+        # Increase contrast around the mean grey level, as ImageEnhance.Contrast
+        # does, but as one lookup-table pass instead of blending with a
+        # full-size flat image
+        histogram = image.histogram()
+        mean = int(sum(level * count for level, count in enumerate(histogram)) / (image.width * image.height) + 0.5)
+        image = image.point([
+            min(255, max(0, int(mean + _CONTRAST_FACTOR * (level - mean)))) for level in range(256)
+        ])
         
-        return image
+        # Increase sharpness in a single convolution (within one grey level
+        # of ImageEnhance.Sharpness, which smooths and then blends)
+        return image.filter(_SHARPEN_KERNEL)
 
 
-def detect_if_ocr_needed(file_path: str, threshold: int = 100) -> bool:
+def detect_if_ocr_needed(file_path: str, threshold: int = 100) -> Tuple[bool, Optional[str]]:
     """
     Determine if PDF needs OCR by checking text content
     
+    Text-based documents are read in full, so the raw page text is handed
+    back for the PyMuPDF parser to reuse instead of extracting it again.
+    
     Args:
         file_path: Path to PDF file
         threshold: Minimum character threshold
         
     Returns:
-        True if OCR is needed, False otherwise
+        Tuple of (OCR needed, raw page text joined by blank lines, or None
+        when OCR is needed)
     """
     try:
-        import fitz
-        doc = fitz.open(file_path)
-        
+        # Pages go straight into one buffer rather than a list that is
+        # joined afterwards, which would briefly hold the text twice
         total_chars = 0
-        for page in doc:
-            text = page.get_text()
-            total_chars += len(text.strip())
-            
-            # Early exit if we have enough text
-            if total_chars >= threshold:
-                doc.close()
-                return False
-        
-        doc.close()
+        buf = io.StringIO()
+        with FITZ_LOCK, fitz.open(file_path) as doc:
+            for page_num, page in enumerate(doc):
+                text = page.get_text("text", sort=False)
+                total_chars += len(text.strip())
+                if page_num:
+                    buf.write("\n\n")
+                buf.write(text)
         
         # If very little text extracted, PDF is likely scanned
-        logger.info(f"Detected {total_chars} characters, OCR needed: {total_chars < threshold}")
-        return total_chars < threshold
+        needs_ocr = total_chars < threshold
+        logger.info(f"Detected {total_chars} characters, OCR needed: {needs_ocr}")
+        if needs_ocr:
+            return True, None
+        return False, buf.getvalue()
         
     except Exception as e:
         logger.warning(f"Error detecting OCR need: {e}, assuming OCR needed")
-        return True
+        return True, None
@@ -1,6 +1,7 @@
 """MongoDB database connection"""
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from typing import Optional
+import asyncio
 from app.config import settings
 import logging
 
@@ -17,11 +18,24 @@ class MongoDB:
     async def connect_db(cls):
         """Connect to MongoDB"""
         try:
-            cls.client = AsyncIOMotorClient(settings.MONGODB_URL)
+            cls.client = AsyncIOMotorClient(
+                settings.MONGODB_URL,
+                maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+                compressors=[c for c in settings.MONGODB_COMPRESSORS.split(",") if c],
+            )
             cls.db = cls.client[settings.MONGODB_DB_NAME]
             
             # Test connection
             await cls.client.admin.command('ping')
+            
+            # Concurrent pings each check out a socket, opening the minimum
+            # pool up front instead of on the first requests
+            await asyncio.gather(*(
+                cls.client.admin.command('ping')
+                for _ in range(settings.MONGODB_MIN_POOL_SIZE)
+            ))
             logger.info(f"Connected to MongoDB: {settings.MONGODB_DB_NAME}")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
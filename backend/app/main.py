@@ -1,6 +1,8 @@
 """FastAPI main application"""
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import os
 from contextlib import asynccontextmanager
 import logging
@@ -10,6 +12,8 @@ from app.config import settings
 from app.db.database import MongoDB
 from app.db.repository import JobRepository
 from app.services.file_service import FileService
+from app.core.parsers.pdfplumber_parser import shutdown_page_pool
+from app.core.parsers.tesseract_parser import warm_ocr_pool
 
 # Configure logging
 logging.basicConfig(
@@ -35,6 +39,9 @@ async def lifespan(app: FastAPI):
         repo = JobRepository(db)
         await repo.create_indexes()
         
+        # Load OCR language models before the first scanned upload
+        await asyncio.to_thread(warm_ocr_pool)
+        
         # Cleanup old temp files
         file_service = FileService()
         deleted = file_service.cleanup_old_files(max_age_hours=24)
@@ -49,6 +56,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down...")
     await MongoDB.close_db()
+    await asyncio.to_thread(shutdown_page_pool)
     logger.info("Application shutdown complete")
 
 
@@ -59,6 +67,7 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
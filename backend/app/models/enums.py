@@ -25,5 +25,6 @@ class JobStatus(str, Enum):
 class ParserType(str, Enum):
     """PDF parser types"""
     PYMUPDF = "pymupdf"
+    PYPDFIUM2 = "pypdfium2"
     PDFPLUMBER = "pdfplumber"
     TESSERACT = "tesseract"
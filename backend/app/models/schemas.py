@@ -1,5 +1,6 @@
 """Pydantic schemas for data validation"""
 from pydantic import BaseModel, Field, field_validator
+from functools import cached_property
 from typing import Optional, Dict, Any
 from datetime import datetime
 from app.models.enums import CardIssuer, JobStatus, ParserType
@@ -33,17 +34,16 @@ class ConfidenceScores(BaseModel):
     payment_due_date: float = Field(ge=0.0, le=1.0, description="Confidence score for payment due date")
     total_amount_due: float = Field(ge=0.0, le=1.0, description="Confidence score for total amount due")
     
-    @property
+    @cached_property
     def average(self) -> float:
-        """Calculate average confidence score"""
-        scores = [
-            self.card_issuer,
-            self.card_number,
-            self.statement_period,
-            self.payment_due_date,
-            self.total_amount_due
-        ]
-        return sum(scores) / len(scores)
+        """Average confidence score, computed once per instance and not serialized"""
+        return (
+            self.card_issuer
+            + self.card_number
+            + self.statement_period
+            + self.payment_due_date
+            + self.total_amount_due
+        ) / 5
 
 
 class ParsedData(BaseModel):
@@ -1,15 +1,17 @@
 """File management service"""
 import tempfile
+import asyncio
 import os
-import uuid
 from pathlib import Path
-from fastapi import UploadFile
+from fastapi import UploadFile, HTTPException
 from app.config import settings
 import logging
 import time
 
 logger = logging.getLogger(__name__)
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class FileService:
     """Manages temporary file storage"""
@@ -28,17 +30,35 @@ class FileService:
             
         Returns:
             Path to saved file
+            
+        Raises:
+            HTTPException: If the upload exceeds MAX_FILE_SIZE
         """
-        # Generate unique filename
-        file_id = str(uuid.uuid4())
+        # Generate unique filename (128 random bits, as with uuid4)
+        file_id = os.urandom(16).hex()
         file_path = self.temp_dir / f"{file_id}.pdf"
         
-        # Save file
-        content = await file.read()
-        with open(file_path, 'wb') as f:
-            f.write(content)
+        # Stream to disk in chunks so the upload is never held in memory
+        # whole; writes run in a worker thread off the event loop. Oversized
+        # uploads are cut off as soon as they pass the limit, not once the
+        # whole body is on disk.
+        size = 0
+        try:
+            with open(file_path, 'wb') as f:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > settings.MAX_FILE_SIZE:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / (1024*1024):.1f}MB"
+                        )
+                    await asyncio.to_thread(f.write, chunk)
+        except BaseException:
+            # Don't leave a partial upload behind
+            self.cleanup(str(file_path))
+            raise
         
-        logger.info(f"Saved file: {file_path} ({len(content)} bytes)")
+        logger.info(f"Saved file: {file_path} ({size} bytes)")
         
         return str(file_path)
     
@@ -49,10 +69,13 @@ class FileService:
         Args:
             file_path: Path to file
         """
+        # Unlink outright rather than checking first: one syscall, and no
+        # window for the file to vanish between the check and the delete
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Deleted temp file: {file_path}")
+            os.unlink(file_path)
+            logger.debug(f"Deleted temp file: {file_path}")
+        except FileNotFoundError:
+            pass
         except OSError as e:
             logger.warning(f"Failed to delete temp file {file_path}: {e}")
     
@@ -66,17 +89,31 @@ class FileService:
         Returns:
             Number of files deleted
         """
-        now = time.time()
+        cutoff = time.time() - max_age_hours * 3600
         deleted_count = 0
         
-        for file_path in self.temp_dir.glob("*.pdf"):
-            if now - file_path.stat().st_mtime > max_age_hours * 3600:
-                try:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    logger.debug(f"Cleaned up old file: {file_path}")
-                except OSError as e:
-                    logger.warning(f"Failed to delete {file_path}: {e}")
+        # One directory listing; entries carry their own stat results and
+        # are unlinked relative to the open directory, not by full path
+        dir_fd = os.open(self.temp_dir, os.O_RDONLY) if os.unlink in os.supports_dir_fd else None
+        try:
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".pdf"):
+                        continue
+                    try:
+                        if entry.stat().st_mtime >= cutoff:
+                            continue
+                        if dir_fd is not None:
+                            os.unlink(entry.name, dir_fd=dir_fd)
+                        else:
+                            os.unlink(entry.path)
+                        deleted_count += 1
+                        logger.debug(f"Cleaned up old file: {entry.path}")
+                    except OSError as e:
+                        logger.warning(f"Failed to delete {entry.path}: {e}")
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
         
         if deleted_count > 0:
             logger.info(f"Cleaned up {deleted_count} old temporary files")
@@ -1,12 +1,39 @@
 """Issuer detection service"""
-import regex as re
+from functools import lru_cache
 from typing import Optional
 from app.models.enums import CardIssuer
-from app.utils.regex_patterns import ISSUER_PATTERNS
+from app.utils.regex_patterns import ISSUER_LITERAL_HINTS, ISSUER_PATTERNS_COMPILED, scan_issuer_patterns
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Full bank names, each a literal match of one of the issuer's scored
+# patterns; checked by plain substring search before the scored detection
+_ISSUER_NAME_PHRASES = (
+    ("kotak", ("kotak mahindra bank",)),
+    ("hdfc", ("hdfc bank",)),
+    ("icici", ("icici bank",)),
+    ("idfc", ("idfc first bank",)),
+    ("axis", ("axis bank",)),
+    ("amex", ("american express",)),
+    ("capital_one", ("capital one",)),
+)
+
+_ISSUER_MAP = {
+    "kotak": CardIssuer.KOTAK,
+    "hdfc": CardIssuer.HDFC,
+    "icici": CardIssuer.ICICI,
+    "idfc": CardIssuer.IDFC,
+    "axis": CardIssuer.AXIS,
+    "amex": CardIssuer.AMEX,
+    "capital_one": CardIssuer.CAPITAL_ONE,
+}
+
+# Characters the scored detection looks at, and the leading header area
+# (increased from 1000) whose matches are weighted more
+_DETECTION_WINDOW_CHARS = 5000
+_HEADER_CHARS = 2000
+
 
 class IssuerDetector:
     """Detect credit card issuer from PDF text"""
@@ -21,50 +48,95 @@ class IssuerDetector:
         Returns:
             Detected CardIssuer or None
         """
-        # Analyze first 2000 characters (header area) - increased from 1000
-        header_text = text[:2000]
-        
-        # Also check full text for issuer keywords (sometimes they appear later)
-        full_text_sample = text[:5000] if len(text) > 5000 else text
-        
-        scores = {}
-        
-        # Check each issuer's patterns in both header and full text
-        for issuer_key, patterns in ISSUER_PATTERNS.items():
-            score = 0
-            for pattern in patterns:
-                # Check header (weighted more)
-                header_matches = re.findall(pattern, header_text, re.IGNORECASE)
-                score += len(header_matches) * 2  # Header matches count double
-                
-                # Check extended text
-                full_matches = re.findall(pattern, full_text_sample, re.IGNORECASE)
-                score += len(full_matches)
-            
-            if score > 0:
-                scores[issuer_key] = score
-                logger.info(f"Issuer detection - {issuer_key}: score {score}")
-        
-        if not scores:
-            logger.warning("No issuer detected")
-            logger.debug(f"Text sample (first 500 chars): {text[:500]}")
-            return None
+        # Only the window is read, so retried or duplicate statements are
+        # answered from the cache
+        return _detect_in_window(text[:_DETECTION_WINDOW_CHARS])
+
+
+@lru_cache(maxsize=256)
+def _detect_in_window(full_text_sample: str) -> Optional[CardIssuer]:
+    """
+    Detect issuer from the start of the text
+    
+    Args:
+        full_text_sample: First _DETECTION_WINDOW_CHARS of the extracted text
         
-        # Get issuer with highest score
-        best_issuer = max(scores, key=scores.get)
+    Returns:
+        Detected CardIssuer or None
+    """
+    full_text_lower = full_text_sample.lower()
+    hinted = _detect_by_hint(full_text_lower)
+    if hinted is not None:
+        logger.info(f"Detected issuer: {hinted.value} (name match)")
+        return hinted
+    
+    scores = {}
+    
+    # With Hyperscan, one pass narrows every issuer to its patterns
+    # that can match
+    candidates = scan_issuer_patterns(full_text_lower)
+    
+    # Check each issuer's patterns in both header and full text
+    for issuer_key, patterns in ISSUER_PATTERNS_COMPILED.items():
+        if candidates is not None:
+            patterns = candidates.get(issuer_key)
+            if not patterns:
+                continue
+        # Otherwise skip the regex scans when none of the issuer's
+        # literals appear
+        elif not any(hint in full_text_lower for hint in ISSUER_LITERAL_HINTS[issuer_key]):
+            continue
         
-        # Map to CardIssuer enum
-        issuer_map = {
-            "kotak": CardIssuer.KOTAK,
-            "hdfc": CardIssuer.HDFC,
-            "icici": CardIssuer.ICICI,
-            "idfc": CardIssuer.IDFC,
-            "axis": CardIssuer.AXIS,
-            "amex": CardIssuer.AMEX,
-            "capital_one": CardIssuer.CAPITAL_ONE,
-        }
+        score = 0
+        for pattern in patterns:
+            # One scan of the sample; a match inside the header counts
+            # once for the sample and double again for the header. The
+            # compiled patterns are lowercase, so they scan the lowered text
+            for match in pattern.finditer(full_text_lower):
+                score += 3 if match.end() <= _HEADER_CHARS else 1
         
-        detected = issuer_map.get(best_issuer, CardIssuer.UNKNOWN)
-        logger.info(f"Detected issuer: {detected.value} (score: {scores[best_issuer]})")
+        if score > 0:
+            scores[issuer_key] = score
+            logger.info(f"Issuer detection - {issuer_key}: score {score}")
+    
+    if not scores:
+        logger.warning("No issuer detected")
+        logger.debug("Text sample (first 500 chars): %s", full_text_sample[:500])
+        return None
+    
+    # Get issuer with highest score
+    best_issuer = max(scores, key=scores.get)
+    
+    # Map to CardIssuer enum
+    detected = _ISSUER_MAP.get(best_issuer, CardIssuer.UNKNOWN)
+    logger.info(f"Detected issuer: {detected.value} (score: {scores[best_issuer]})")
+    
+    return detected
+
+
+def _detect_by_hint(window_lower: str) -> Optional[CardIssuer]:
+    """
+    Identify the issuer from its name alone when scoring could only agree
+    
+    Statements almost always print the bank's full name near the top, and
+    a few substring checks are far cheaper than scoring every issuer's
+    patterns. The name only decides when no other issuer's literal hints
+    occur anywhere in the window: none of that issuer's patterns can then
+    match, so the scored detection would pick the named issuer too. A
+    transfer or merchant line naming another bank defers to scoring.
+    
+    Args:
+        window_lower: Lowercased start of the extracted text
         
-        return detected
+    Returns:
+        The issuer named in the header, or None to run scored detection
+    """
+    header = window_lower[:_HEADER_CHARS]
+    for issuer_key, phrases in _ISSUER_NAME_PHRASES:
+        if not any(phrase in header for phrase in phrases):
+            continue
+        for other_key, hints in ISSUER_LITERAL_HINTS.items():
+            if other_key != issuer_key and any(hint in window_lower for hint in hints):
+                return None
+        return _ISSUER_MAP[issuer_key]
+    return None
@@ -1,12 +1,18 @@
 """File validation service"""
 from fastapi import UploadFile, HTTPException
-import magic
+import fitz  # PyMuPDF
+import asyncio
 import os
 from app.config import settings
+from app.core.parsers.pymupdf_parser import FITZ_LOCK
 import logging
 
 logger = logging.getLogger(__name__)
 
+# PDF readers accept the "%PDF-" header anywhere in the first 1024 bytes
+PDF_HEADER = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
 
 class FileValidator:
     """Validates uploaded PDF files"""
@@ -26,8 +32,41 @@ class FileValidator:
         content = await file.read()
         await file.seek(0)  # Reset file pointer
         
-        # Check file size
         file_size = len(content)
+        FileValidator._check_size(file_size)
+        FileValidator._check_header(content[:PDF_HEADER_WINDOW])
+        await asyncio.to_thread(FileValidator._check_structure, stream=content, filetype="pdf")
+        
+        logger.info(f"File validation passed: {file.filename}, size: {file_size} bytes")
+    
+    @staticmethod
+    async def validate_saved(file_path: str, filename: str) -> None:
+        """
+        Validate an upload already streamed to disk
+        
+        Only the header is read into memory; PyMuPDF opens the file itself.
+        
+        Args:
+            file_path: Path the upload was saved to
+            filename: Original filename, for logging
+            
+        Raises:
+            HTTPException: If validation fails
+        """
+        await asyncio.to_thread(FileValidator._sync_validate_saved, file_path)
+        logger.info(f"File validation passed: {filename}, size: {os.path.getsize(file_path)} bytes")
+    
+    @staticmethod
+    def _sync_validate_saved(file_path: str) -> None:
+        """Blocking body of validate_saved, run in a worker thread"""
+        FileValidator._check_size(os.path.getsize(file_path))
+        with open(file_path, "rb") as f:
+            FileValidator._check_header(f.read(PDF_HEADER_WINDOW))
+        FileValidator._check_structure(file_path)
+    
+    @staticmethod
+    def _check_size(file_size: int) -> None:
+        """Reject empty and oversized files"""
         if file_size > settings.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=413,
@@ -39,35 +78,40 @@ class FileValidator:
                 status_code=400,
                 detail="File is empty"
             )
+    
+    @staticmethod
+    def _check_header(head: bytes) -> None:
+        """Reject files without a PDF header"""
+        # Only PDFs are accepted, and the header is enough to tell without
+        # running a MIME sniffer over the whole upload
+        if head.find(PDF_HEADER) == -1:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid file type. Expected PDF"
+            )
+    
+    @staticmethod
+    def _check_structure(*args, **kwargs) -> None:
+        """
+        Verify PDF structure by opening it with PyMuPDF
         
-        # Check MIME type
-        try:
-            mime = magic.from_buffer(content, mime=True)
-            if mime not in settings.ALLOWED_MIME_TYPES:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid file type. Expected PDF, got {mime}"
-                )
-        except Exception as e:
-            logger.warning(f"MIME type detection failed: {e}, assuming PDF")
+        Blocks on FITZ_LOCK, so it must run in a worker thread.
         
-        # Verify PDF structure
+        Args:
+            *args, **kwargs: Passed to fitz.open (a path, or stream=...)
+        """
         try:
-            import fitz
             # Try to open as PDF
-            doc = fitz.open(stream=content, filetype="pdf")
+            with FITZ_LOCK, fitz.open(*args, **kwargs) as doc:
+                page_count = len(doc)
             
-            if len(doc) == 0:
+            if page_count == 0:
                 raise HTTPException(
                     status_code=400,
                     detail="PDF has no pages"
                 )
-            
-            doc.close()
         except Exception as e:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid or corrupted PDF file: {str(e)}"
             )
-        
-        logger.info(f"File validation passed: {file.filename}, size: {file_size} bytes")
@@ -1,7 +1,9 @@
 """Amount parsing utilities"""
 import regex as re
 from typing import Optional, Tuple
+from functools import lru_cache
 import logging
+from app.utils.regex_patterns import PatternUnion
 
 logger = logging.getLogger(__name__)
 
@@ -14,11 +16,38 @@ CURRENCY_PATTERNS = {
     "EUR": [r"€", r"EUR", r"euros?"],
 }
 
+# Currency symbols are stripped with str.translate; the word-like codes
+# with one alternation pass instead of a substitution per pattern
+_CURRENCY_SYMBOLS = str.maketrans("", "", "₹$£€")
+_CURRENCY_WORDS_RE = re.compile(r"Rs\.?|INR|rupees?|USD|dollars?|GBP|pounds?|EUR|euros?", re.IGNORECASE)
+_PARENTHESES = str.maketrans("", "", "()")
+_NUMBER_CHARS = str.maketrans("", "", "0123456789,.-")
+_CR_DR_RE = re.compile(r"Cr\.?|Dr\.?", re.IGNORECASE)
 
+# Thousands-comma and decimal-comma (European) number formats. The groups
+# are atomic: nothing after them can fail, so giving back digits never
+# helps, and the engine is told not to try
+_NUMBER_RE = re.compile(r"-?\d{1,3}(?>(?:,\d{3})*)(?>(?:\.\d{1,2})?)")
+_EUROPEAN_NUMBER_RE = re.compile(r"-?\d{1,3}(?>(?:\.\d{3})*)(?>(?:,\d{1,2})?)")
+
+# Every currency pattern in detection priority order, with its currency
+_CURRENCY_UNION = PatternUnion(
+    tuple(pattern for patterns in CURRENCY_PATTERNS.values() for pattern in patterns),
+    re.IGNORECASE,
+)
+_CURRENCY_BY_BRANCH = tuple(
+    code for code, patterns in CURRENCY_PATTERNS.items() for _ in patterns
+)
+
+
+@lru_cache(maxsize=2048)
 def parse_amount(amount_string: str, default_currency: str = "INR") -> Tuple[Optional[float], str]:
     """
     Parse amount string and extract numeric value and currency
     
+    Results are cached; figures such as "Rs. 0.00" recur throughout a
+    statement and each parse runs a dozen currency substitutions.
+    
     Args:
         amount_string: Raw amount string from PDF (e.g., "Rs. 45,240.00")
         default_currency: Default currency if not detected
@@ -32,30 +61,32 @@ def parse_amount(amount_string: str, default_currency: str = "INR") -> Tuple[Opt
     original = amount_string
     amount_string = amount_string.strip()
     
+    # A bare number has no currency or markers to strip, so it is read
+    # without running any of the regexes below
+    plain = _plain_number(amount_string)
+    if plain is not None:
+        return plain, default_currency
+    
     # Detect currency
     currency = detect_currency(amount_string) or default_currency
     
     # Remove currency symbols and codes
-    for curr_code, patterns in CURRENCY_PATTERNS.items():
-        for pattern in patterns:
-            amount_string = re.sub(pattern, "", amount_string, flags=re.IGNORECASE)
+    amount_string = _CURRENCY_WORDS_RE.sub("", amount_string.translate(_CURRENCY_SYMBOLS))
     
     # Remove whitespace
     amount_string = amount_string.strip()
     
     # Remove common text like "Cr", "Dr", parentheses
-    amount_string = re.sub(r"\(|\)|Cr\.?|Dr\.?", "", amount_string, flags=re.IGNORECASE)
+    amount_string = _CR_DR_RE.sub("", amount_string.translate(_PARENTHESES))
     amount_string = amount_string.strip()
     
     # Extract number (handle commas, periods)
     # Pattern: optional minus, digits with commas, optional decimal point and digits
-    number_pattern = r"-?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?"
-    match = re.search(number_pattern, amount_string)
+    match = _NUMBER_RE.search(amount_string)
     
     if not match:
         # Try alternative format: decimal comma (European style)
-        number_pattern = r"-?\d{1,3}(?:\.\d{3})*(?:,\d{1,2})?"
-        match = re.search(number_pattern, amount_string)
+        match = _EUROPEAN_NUMBER_RE.search(amount_string)
         
         if match:
             # Convert European format to standard
@@ -83,6 +114,59 @@ def parse_amount(amount_string: str, default_currency: str = "INR") -> Tuple[Opt
     return None, currency
 
 
+def _plain_number(text: str) -> Optional[float]:
+    """
+    Convert text that is exactly one thousands-comma number, as _NUMBER_RE
+    would match it in full (e.g. "-45,240.00", "0.5")
+    
+    Args:
+        text: Stripped amount string
+        
+    Returns:
+        Amount as float, or None if text needs the regex extraction
+    """
+    # Cheap rejection of anything with a currency, letters or spaces;
+    # the first character alone settles most prefixed amounts
+    if not (text[:1].isdigit() or text[:1] == "-") or text.translate(_NUMBER_CHARS):
+        return None
+    
+    body = text[1:] if text.startswith("-") else text
+    whole, _, decimals = body.partition(".")
+    groups = whole.split(",")
+    if (
+        body.isascii()
+        and 1 <= len(groups[0]) <= 3
+        and all(len(group) == 3 for group in groups[1:])
+        and whole.replace(",", "").isdigit()
+        and len(decimals) <= 2
+        and (not decimals or decimals.isdigit())
+    ):
+        return float(text.replace(",", ""))
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_amount_fast(amount_string: str) -> float:
+    """
+    Convert an already-matched numeric token such as "5,882.52" to float
+    
+    Statements repeat the same few figures across summary blocks and
+    fallbacks, so results are cached. Comma-free tokens skip the copy.
+    
+    Args:
+        amount_string: Digits with optional thousands commas and decimals
+        
+    Returns:
+        Amount as float
+        
+    Raises:
+        ValueError: If the token is not a number
+    """
+    if "," in amount_string:
+        amount_string = amount_string.replace(",", "")
+    return float(amount_string)
+
+
 def detect_currency(text: str) -> Optional[str]:
     """
     Detect currency from text
@@ -93,10 +177,9 @@ def detect_currency(text: str) -> Optional[str]:
     Returns:
         Currency code or None
     """
-    for currency_code, patterns in CURRENCY_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return currency_code
+    # First hit in CURRENCY_PATTERNS order, found in one scan
+    for idx, _ in _CURRENCY_UNION.matches(text):
+        return _CURRENCY_BY_BRANCH[idx]
     
     return None
 
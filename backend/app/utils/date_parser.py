@@ -1,9 +1,11 @@
 """Date parsing utilities"""
 from datetime import datetime
 from dateutil import parser as date_parser
+from functools import lru_cache
 from typing import Optional
-import regex as re
+import re
 import logging
+from app.utils.regex_patterns import compile_patterns
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +26,60 @@ DATE_FORMATS = [
 ]
 
 
+
+def _date_shape(text: str, has_month_name: bool) -> tuple[frozenset, bool]:
+    """Punctuation a date contains and whether it spells out the month"""
+    return frozenset(c for c in text if not c.isalnum() and not c.isspace()), has_month_name
+
+
+# DATE_FORMATS grouped by shape, in their original order. strptime must
+# consume the whole string, so a format only fits dates with exactly its
+# separators, and only those with letters if it has a month name.
+_FORMATS_BY_SHAPE: dict[tuple[frozenset, bool], tuple[str, ...]] = {}
+for _fmt in DATE_FORMATS:
+    _key = _date_shape(re.sub(r"%[a-zA-Z]", "", _fmt), "%b" in _fmt or "%B" in _fmt)
+    _FORMATS_BY_SHAPE[_key] = _FORMATS_BY_SHAPE.get(_key, ()) + (_fmt,)
+
+# Two-date patterns for parse_date_range, in priority order
+_DATE_RANGE_PATTERNS = compile_patterns([
+    r"(\d{1,2}-\w{3}-\d{4})\s+(?:To|to)\s+(\d{1,2}-\w{3}-\d{4})",
+    r"(\d{8})\s+(?:to|To)\s+(\d{8})",
+    r"From\s+(\d{2}\d{2}\d{4})\s+to\s+(\d{2}\d{2}\d{4})",
+    r"From\s+(\w+\s+\d{1,2})\s+to\s+(\w+\s+\d{1,2},\s+\d{4})",
+    r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
+])
+
+# Day-first dates as captured by the extractors: 20/May/2025, 1-Mar-2023, 01/03/2023
+_DMY_SHAPE = re.compile(r"(\d{1,2})([/-])(\d{1,2}|[A-Za-z]{3})\2(\d{4})")
+_MONTH_ABBR = {
+    name: number for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), start=1
+    )
+}
+
+# Day, month (number or name) and year with any common separators, for
+# dates no DATE_FORMATS entry fits (e.g. "5.3.23", "05 - Mar - 2023")
+_GENERIC_DATE = re.compile(r"(\d{1,2})[\s./-]+(\d{1,2}|[A-Za-z]{3,9})[\s./-]+(\d{4}|\d{2})")
+_MONTHS = {
+    **_MONTH_ABBR,
+    **{
+        name: number for number, name in enumerate(
+            ("january", "february", "march", "april", "may", "june", "july",
+             "august", "september", "october", "november", "december"), start=1
+        )
+    },
+    "sept": 9,
+}
+
+
+@lru_cache(maxsize=8192)
 def parse_date(date_string: str) -> Optional[str]:
     """
     Parse date string and return in ISO 8601 format (YYYY-MM-DD)
     
+    The same dates recur across a statement's fields and transaction rows,
+    so results are cached instead of re-running strptime per format.
+    
     Args:
         date_string: Raw date string from PDF
         
@@ -39,8 +91,9 @@ def parse_date(date_string: str) -> Optional[str]:
     
     date_string = date_string.strip()
     
-    # Try each format
-    for fmt in DATE_FORMATS:
+    # Try each format that fits the string's shape
+    shape = _date_shape(date_string, any(c.isalpha() for c in date_string))
+    for fmt in _FORMATS_BY_SHAPE.get(shape, ()):
         try:
             dt = datetime.strptime(date_string, fmt)
             
@@ -56,15 +109,115 @@ def parse_date(date_string: str) -> Optional[str]:
         except ValueError:
             continue
     
+    # Day-month-year with unusual separators, read without dateutil
+    generic = _parse_generic_date(date_string)
+    if generic:
+        return generic
+    
     # Try dateutil parser as fallback (flexible parsing)
     try:
         dt = date_parser.parse(date_string, dayfirst=True)
+        logger.warning(f"Date '{date_string}' needed the dateutil fallback")
         return dt.strftime("%Y-%m-%d")
     except Exception as e:
         logger.warning(f"Failed to parse date '{date_string}': {e}")
         return None
 
 
+def _parse_generic_date(date_string: str) -> Optional[str]:
+    """
+    Read a day-first date whose separators no DATE_FORMATS entry fits
+    
+    dateutil tokenizes the whole string on every call; statement dates are
+    nearly always day, month and year, so one regex handles the rest.
+    
+    Args:
+        date_string: Stripped date string that no format parsed
+        
+    Returns:
+        ISO 8601 formatted date string, or None to fall back to dateutil
+    """
+    match = _GENERIC_DATE.fullmatch(date_string)
+    if not match:
+        return None
+    
+    day, month, year = match.groups()
+    month_num = int(month) if month.isdigit() else _MONTHS.get(month.lower())
+    year_num = int(year)
+    if len(year) == 2:
+        # dateutil's rule, which these dates used to get: the year within
+        # 50 years of the current one
+        this_year = datetime.now().year
+        year_num += this_year // 100 * 100
+        if year_num >= this_year + 50:
+            year_num -= 100
+        elif year_num < this_year - 50:
+            year_num += 100
+    
+    try:
+        if month_num:
+            return datetime(year_num, month_num, int(day)).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+    return None
+
+
+def parse_dmy_slash(date_string: str) -> Optional[str]:
+    """
+    Fast path for strings already known to be shaped DD/MM/YYYY
+    
+    Args:
+        date_string: Date captured by a \\d{2}/\\d{2}/\\d{4} pattern
+        
+    Returns:
+        ISO 8601 formatted date string or None if parsing fails
+    """
+    day, month, year = date_string[:2], date_string[3:5], date_string[6:10]
+    try:
+        # Validate without going through strptime's format parsing
+        if int(year) >= 1000:
+            datetime(int(year), int(month), int(day))
+            return f"{year}-{month}-{day}"
+    except ValueError:
+        pass
+    
+    # Anything unusual goes through the generic parser
+    return parse_date(date_string)
+
+
+@lru_cache(maxsize=1024)
+def parse_dmy(date_string: str) -> Optional[str]:
+    """
+    Parse a day-first date by its shape instead of trying every format
+    
+    Handles DD/MM/YYYY, DD-MM-YYYY, DD/Mon/YYYY, DD-Mon-YYYY and DDMMYYYY
+    directly; anything else (or an impossible date) goes through parse_date
+    so results never differ from it.
+    
+    Args:
+        date_string: Date captured by an extractor pattern
+        
+    Returns:
+        ISO 8601 formatted date string or None if parsing fails
+    """
+    date_string = date_string.strip()
+    match = _DMY_SHAPE.fullmatch(date_string)
+    if match:
+        day, _, month, year = match.groups()
+        month_num = _MONTH_ABBR.get(month.lower()) if month.isalpha() else int(month)
+    elif len(date_string) == 8 and date_string.isdigit():
+        day, month_num, year = date_string[:2], int(date_string[2:4]), date_string[4:]
+    else:
+        return parse_date(date_string)
+    
+    try:
+        if month_num and int(year) >= 1000:
+            return datetime(int(year), month_num, int(day)).strftime("%Y-%m-%d")
+    except ValueError:
+        pass
+    return parse_date(date_string)
+
+
 def parse_date_range(text: str) -> tuple[Optional[str], Optional[str]]:
     """
     Parse date range from text
@@ -76,16 +229,8 @@ def parse_date_range(text: str) -> tuple[Optional[str], Optional[str]]:
         Tuple of (start_date, end_date) in ISO 8601 format
     """
     # Try to find two dates
-    date_patterns = [
-        r"(\d{1,2}-\w{3}-\d{4})\s+(?:To|to)\s+(\d{1,2}-\w{3}-\d{4})",
-        r"(\d{8})\s+(?:to|To)\s+(\d{8})",
-        r"From\s+(\d{2}\d{2}\d{4})\s+to\s+(\d{2}\d{2}\d{4})",
-        r"From\s+(\w+\s+\d{1,2})\s+to\s+(\w+\s+\d{1,2},\s+\d{4})",
-        r"(\d{1,2}/\d{1,2}/\d{4})\s*-\s*(\d{1,2}/\d{1,2}/\d{4})",
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_RANGE_PATTERNS:
+        match = pattern.search(text)
         if match:
             start_raw, end_raw = match.groups()
             start_date = parse_date(start_raw)
@@ -1,5 +1,15 @@
 """Regex patterns for data extraction"""
 import regex as re
+from typing import Optional, Union
+import threading
+import logging
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
 
 
 # Card issuer detection patterns
@@ -158,19 +168,216 @@ def compile_patterns(patterns: list[str]) -> list[re.Pattern]:
     return [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
 
 
-def search_with_context(text: str, pattern: str, context_chars: int = 100) -> tuple[str, str]:
+# Lowercase literals such that every one of an issuer's patterns contains
+# at least one; if none occur in the text, none of its patterns can match
+ISSUER_LITERAL_HINTS = {
+    "kotak": ("kotak", "gstin", "corporate", "414767"),
+    "hdfc": ("hdfc", "platinum", "gstin"),
+    "icici": ("icici", "gstin"),
+    "amex": ("american", "aebc"),
+    "capital_one": ("capital",),
+    "idfc": ("idfc",),
+    "axis": ("axis",),
+}
+
+# Each issuer's patterns compiled once at import, lowercased to match
+# lowercased text without case-folding every character at match time
+# (none of them use case-sensitive escapes such as \S or \D)
+ISSUER_PATTERNS_COMPILED = {
+    issuer: [re.compile(pattern.lower()) for pattern in patterns]
+    for issuer, patterns in ISSUER_PATTERNS.items()
+}
+
+
+class PatternUnion:
+    """
+    Prioritised patterns fused into a single alternation
+
+    Extractors try their patterns in order and take the first one that
+    matches anywhere in the text. Searching each pattern separately costs
+    one full scan of the text per pattern; the union finds the
+    highest-priority matching pattern in one overlapped scan instead.
+    When Hyperscan is installed, a prefilter database reports in one
+    SIMD pass which patterns can possibly match, and only those are run.
+    """
+
+    def __init__(self, patterns: tuple[str, ...], flags: int = 0):
+        self.branches = tuple(re.compile(pattern, flags) for pattern in patterns)
+        # Each branch is wrapped in a named group; being the outermost group
+        # it closes last, so ``lastgroup`` identifies the branch that fired
+        self.union = re.compile(
+            "|".join(f"(?P<b{i}>{pattern})" for i, pattern in enumerate(patterns)),
+            flags,
+        )
+        self._prefilter = _compile_prefilter(patterns, flags) if hyperscan is not None else None
+        self._scratch = threading.local()
+
+    def _candidates(self, text: str) -> list[int]:
+        """Indexes of patterns the Hyperscan prefilter reports as possible hits"""
+        return _prefilter_hits(self._prefilter, self._scratch, text, len(self.branches))
+
+    def matches(self, text: str):
+        """
+        Yield matches in the same order as searching each pattern in turn
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Iterator of (pattern index, match) for every pattern that matches
+        """
+        if self._prefilter is not None:
+            # Prefilter hits are a superset; confirm each with the real pattern
+            for idx in self._candidates(text):
+                m = self.branches[idx].search(text)
+                if m:
+                    yield idx, m
+            return
+
+        best_idx, best_pos = None, None
+        for m in self.union.finditer(text, overlapped=True):
+            idx = int(m.lastgroup[1:])
+            if best_idx is None or idx < best_idx:
+                best_idx, best_pos = idx, m.start()
+                if idx == 0:
+                    break
+        if best_idx is None:
+            return
+
+        # The lowest-index branch that fired is never shadowed by an earlier
+        # alternative, so its first hit is exactly what a lone search returns
+        yield best_idx, self.branches[best_idx].match(text, best_pos)
+
+        # Later branches are only needed when the caller rejects a candidate;
+        # search them individually so a shadowed first hit is never missed
+        for idx in range(best_idx + 1, len(self.branches)):
+            m = self.branches[idx].search(text)
+            if m:
+                yield idx, m
+
+
+def _prefilter_hits(database, scratch_local: threading.local, text: str, pattern_count: int) -> list[int]:
+    """
+    Scan text once with a prefilter database
+    
+    Args:
+        database: Database from _compile_prefilter
+        scratch_local: Thread-local holding each thread's Hyperscan scratch
+        text: Text to scan
+        pattern_count: Number of patterns in the database
+        
+    Returns:
+        Sorted ids of the patterns that may match
+    """
+    scratch = getattr(scratch_local, "value", None)
+    if scratch is None:
+        scratch = scratch_local.value = hyperscan.Scratch(database)
+
+    hits = set()
+
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(pattern_id)
+        # Returning True halts the scan once every pattern has reported
+        return len(hits) == pattern_count
+
+    database.scan(text.encode("utf-8", "surrogatepass"), match_event_handler=on_match, scratch=scratch)
+    return sorted(hits)
+
+
+def _compile_prefilter(patterns: tuple[str, ...], flags: int):
+    """
+    Build a Hyperscan prefilter database for a pattern set
+
+    Prefilter mode approximates constructs Hyperscan can't run exactly, so
+    it may over-report but never misses a pattern that matches.
+
+    Args:
+        patterns: Regex pattern strings
+        flags: ``regex`` flags the patterns are compiled with
+
+    Returns:
+        Compiled hyperscan.Database, or None if the patterns can't be compiled
+    """
+    hs_flags = hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    if flags & re.IGNORECASE:
+        hs_flags |= hyperscan.HS_FLAG_CASELESS
+    if flags & re.DOTALL:
+        hs_flags |= hyperscan.HS_FLAG_DOTALL
+    if flags & re.MULTILINE:
+        hs_flags |= hyperscan.HS_FLAG_MULTILINE
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[hs_flags] * len(patterns),
+        )
+    except Exception as e:
+        # e.g. regex-only syntax such as variable-length lookbehind
+        logger.debug(f"Hyperscan prefilter disabled for pattern set: {e}")
+        return None
+    return database
+
+
+# Every issuer pattern in one Hyperscan database, with the (issuer, pattern
+# index) each database id stands for
+_ISSUER_PATTERN_IDS = tuple(
+    (issuer, idx) for issuer, patterns in ISSUER_PATTERNS.items() for idx in range(len(patterns))
+)
+_ISSUER_PREFILTER = _compile_prefilter(
+    tuple(pattern for patterns in ISSUER_PATTERNS.values() for pattern in patterns), re.IGNORECASE
+) if hyperscan is not None else None
+_issuer_scratch = threading.local()
+
+
+def scan_issuer_patterns(text: str) -> Optional[dict[str, list[re.Pattern]]]:
+    """
+    Find which issuer patterns can match text in a single Hyperscan pass
+    
+    Hyperscan reports each pattern's presence, not the non-overlapping
+    matches detection counts, so the returned patterns still have to be
+    run; every other issuer pattern is known not to match.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        Compiled patterns per issuer with possible hits, or None when
+        Hyperscan is unavailable
+    """
+    if _ISSUER_PREFILTER is None:
+        return None
+    
+    candidates: dict[str, list[re.Pattern]] = {}
+    for pattern_id in _prefilter_hits(_ISSUER_PREFILTER, _issuer_scratch, text, len(_ISSUER_PATTERN_IDS)):
+        issuer, idx = _ISSUER_PATTERN_IDS[pattern_id]
+        candidates.setdefault(issuer, []).append(ISSUER_PATTERNS_COMPILED[issuer][idx])
+    return candidates
+
+
+def _as_pattern(pattern: Union[str, re.Pattern]) -> re.Pattern:
+    """Compiled form of a pattern, compiling strings case-insensitively"""
+    if isinstance(pattern, str):
+        return re.compile(pattern, re.IGNORECASE)
+    return pattern
+
+
+def search_with_context(text: str, pattern: Union[str, re.Pattern], context_chars: int = 100) -> tuple[str, str]:
     """
     Search for pattern and return match with surrounding context
     
     Args:
         text: Text to search
-        pattern: Regex pattern
+        pattern: Compiled pattern (e.g. from compile_patterns), or
+            a pattern string matched case-insensitively
         context_chars: Number of characters to include before/after match
         
     Returns:
         Tuple of (matched_text, context)
     """
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _as_pattern(pattern).search(text)
     if match:
         start = max(0, match.start() - context_chars)
         end = min(len(text), match.end() + context_chars)
@@ -179,20 +386,26 @@ def search_with_context(text: str, pattern: str, context_chars: int = 100) -> tu
     return "", ""
 
 
-def find_nearest_value(text: str, keyword_pattern: str, value_pattern: str, max_distance: int = 200) -> str:
+def find_nearest_value(
+    text: str,
+    keyword_pattern: Union[str, re.Pattern],
+    value_pattern: Union[str, re.Pattern],
+    max_distance: int = 200
+) -> str:
     """
     Find value near a keyword
     
     Args:
         text: Text to search
-        keyword_pattern: Pattern for keyword (e.g., "Due Date")
-        value_pattern: Pattern for value (e.g., date pattern)
+        keyword_pattern: Pattern for keyword (e.g., "Due Date"), compiled or
+            a string matched case-insensitively
+        value_pattern: Pattern for value (e.g., date pattern), likewise
         max_distance: Maximum characters between keyword and value
         
     Returns:
         Matched value or empty string
     """
-    keyword_match = re.search(keyword_pattern, text, re.IGNORECASE)
+    keyword_match = _as_pattern(keyword_pattern).search(text)
     if not keyword_match:
         return ""
     
@@ -201,7 +414,7 @@ def find_nearest_value(text: str, keyword_pattern: str, value_pattern: str, max_
     search_end = min(len(text), search_start + max_distance)
     search_text = text[search_start:search_end]
     
-    value_match = re.search(value_pattern, search_text, re.IGNORECASE)
+    value_match = _as_pattern(value_pattern).search(search_text)
     if value_match:
         return value_match.group(1) if value_match.groups() else value_match.group(0)
     
@@ -0,0 +1,106 @@
+"""Regex compilation with a linear-time engine where possible"""
+import re
+import regex
+import logging
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+logger = logging.getLogger(__name__)
+
+
+# Flags that translate directly to RE2 inline modifiers
+_INLINE_FLAGS = (
+    (regex.IGNORECASE, "i"),
+    (regex.MULTILINE, "m"),
+    (regex.DOTALL, "s"),
+)
+_SUPPORTED_FLAGS = regex.IGNORECASE | regex.MULTILINE | regex.DOTALL
+
+# RE2's \s is ASCII-only; PDF text is full of NBSP and other Unicode spaces,
+# so spell out the same set Python's \s matches
+_UNICODE_SPACE = r"\t-\r\x{1c}-\x{1f}\x{85}\p{Z}"
+
+
+def _to_re2_syntax(pattern: str):
+    """
+    Rewrite a Python-syntax pattern so RE2 matches the same text
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        RE2 pattern string, or None if the pattern needs the backtracking engine
+    """
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if not in_class and pattern.startswith(r"[\s\S]", i):
+            out.append("(?s:.)")
+            i += 6
+            continue
+        if ch == "\\" and i + 1 < len(pattern):
+            esc = pattern[i + 1]
+            if esc == "s":
+                out.append(_UNICODE_SPACE if in_class else f"[{_UNICODE_SPACE}]")
+            elif esc == "S" and not in_class:
+                out.append(f"[^{_UNICODE_SPACE}]")
+            elif esc == "S" or esc.isdigit():
+                # \S inside a class and backreferences have no RE2 equivalent
+                return None
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if ch == "]" and out[-1] not in ("[", "[^"):
+                in_class = False
+        elif ch == "[":
+            in_class = True
+            if pattern.startswith("[^", i):
+                out.append("[^")
+                i += 2
+                continue
+        elif ch == "(" and pattern.startswith("(?", i) and pattern[i + 2:i + 3] in ("=", "!", "<", ">"):
+            # Lookarounds and atomic groups
+            return None
+        out.append(ch)
+        i += 1
+    return "".join(out)
+
+
+def compile(pattern: str, flags: int = 0):
+    """
+    Compile a pattern with RE2 when installed, otherwise with ``re``
+
+    RE2 guarantees linear-time matching, which keeps the lazy ``.{0,100}?``
+    style patterns safe on noisy OCR text. Patterns RE2 cannot express
+    (lookarounds, backreferences) fall back to the stdlib engine, and
+    ``regex`` is only used for syntax ``re`` rejects (e.g. variable-length
+    lookbehind).
+
+    Args:
+        pattern: Regex pattern string
+        flags: ``re``/``regex`` flags (IGNORECASE, MULTILINE, DOTALL)
+
+    Returns:
+        Compiled pattern exposing the usual search/match/findall API
+    """
+    if re2 is not None and not flags & ~_SUPPORTED_FLAGS:
+        translated = _to_re2_syntax(pattern)
+        if translated is not None:
+            inline = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+            try:
+                return re2.compile(f"(?{inline}){translated}" if inline else translated)
+            except Exception as e:
+                logger.debug(f"RE2 rejected pattern, using re instead: {e}")
+    if not flags & ~_SUPPORTED_FLAGS:
+        try:
+            return re.compile(pattern, flags)
+        except re.error:
+            pass
+    return regex.compile(pattern, flags)
@@ -0,0 +1,68 @@
+"""Shared test fixtures"""
+import copy
+
+import pytest
+
+from app.db.database import get_database
+from app.main import app
+
+
+class FakeCollection:
+    """In-memory stand-in for the motor collection calls the repository makes"""
+
+    def __init__(self):
+        self.docs = []
+        self.calls = []
+        self.updates = []
+
+    def _find(self, filter):
+        for doc in self.docs:
+            if all(doc.get(key) == value for key, value in filter.items()):
+                return doc
+        return None
+
+    async def find_one(self, filter, projection=None):
+        self.calls.append("find_one")
+        doc = self._find(filter)
+        if doc is None:
+            return None
+        doc = copy.deepcopy(doc)
+        if projection:
+            included = {key for key, keep in projection.items() if keep and key != "_id"}
+            if included:
+                doc = {key: value for key, value in doc.items() if key in included}
+            else:
+                doc = {key: value for key, value in doc.items() if projection.get(key, 1)}
+        return doc
+
+    async def insert_one(self, doc):
+        self.calls.append("insert_one")
+        self.docs.append(copy.deepcopy(doc))
+
+    async def insert_many(self, docs, ordered=True):
+        self.calls.append("insert_many")
+        self.docs.extend(copy.deepcopy(doc) for doc in docs)
+
+    async def update_one(self, filter, update):
+        self.calls.append("update_one")
+        self.updates.append(copy.deepcopy(update["$set"]))
+        doc = self._find(filter)
+        if doc is not None:
+            doc.update(copy.deepcopy(update["$set"]))
+
+
+class FakeDatabase(dict):
+    """Collections created on first access, like a Mongo database"""
+
+    def __missing__(self, name):
+        collection = self[name] = FakeCollection()
+        return collection
+
+
+@pytest.fixture
+def fake_db():
+    """In-memory database, also injected into the API's get_database dependency"""
+    db = FakeDatabase()
+    app.dependency_overrides[get_database] = lambda: db
+    yield db
+    app.dependency_overrides.pop(get_database, None)
@@ -1,6 +1,10 @@
 """Basic tests for the API"""
+from datetime import datetime
+import fitz
 from fastapi.testclient import TestClient
+from app.api.v1.endpoints import parse as parse_endpoints
 from app.main import app
+from app.models.schemas import ParseResult
 
 client = TestClient(app)
 
@@ -39,3 +43,108 @@ def test_get_nonexistent_job():
     """Test getting status of nonexistent job"""
     response = client.get("/api/v1/parse/fake-job-id/status")
     assert response.status_code in [404, 500]  # Depends on MongoDB connection
+
+
+LEGACY_RESULT_DOC = {
+    "job_id": "legacy-job",
+    "status": "completed",
+    "filename": "statement.pdf",
+    "issuer": "HDFC Bank",
+    "data": {
+        "card_issuer": "HDFC Bank",
+        "card_number": "5228 52XX XXXX 0591",
+        "statement_period": {"raw": "01/02/2023 - 28/02/2023"},
+        "payment_due_date": {"raw": "19/03/2023", "formatted": "2023-03-19"},
+        "total_amount_due": {"raw": "45,240.00", "amount": 45240.0},
+    },
+    "confidence_scores": {
+        "card_issuer": 1.0,
+        "card_number": 1.0,
+        "statement_period": 0.0,
+        "payment_due_date": 1.0,
+        "total_amount_due": 1.0,
+    },
+    "metadata": {"pages": 2, "processing_time_ms": 120, "parser_used": "pymupdf", "file_size_bytes": 1024},
+    "processed_at": datetime(2023, 3, 1, 12, 0),
+}
+
+
+def test_results_validated_through_response_model(fake_db):
+    """Test stored results written before newer fields existed go out in ParseResult's shape"""
+    fake_db["results"].docs.append(dict(LEGACY_RESULT_DOC, created_at=datetime(2023, 3, 1)))
+    response = client.get("/api/v1/parse/results/legacy-job")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["data"]["minimum_amount_due"] is None
+    assert data["data"]["total_amount_due"]["currency"] == "INR"
+    assert data["metadata"]["ocr_required"] is False
+    assert "created_at" not in data
+
+
+def test_status_validated_through_response_model(fake_db):
+    """Test the status response keeps JobStatusResponse's fields"""
+    now = datetime(2023, 3, 1, 12, 0)
+    fake_db["jobs"].docs.append({
+        "job_id": "job-1", "filename": "a.pdf", "status": "processing",
+        "progress_percentage": 40, "message": "Parsing", "created_at": now, "updated_at": now,
+    })
+    response = client.get("/api/v1/parse/status/job-1")
+    assert response.status_code == 200
+    assert response.json() == {
+        "job_id": "job-1",
+        "status": "processing",
+        "progress_percentage": 40,
+        "message": "Parsing",
+        "result": None,
+        "created_at": "2023-03-01T12:00:00",
+        "updated_at": "2023-03-01T12:00:00",
+    }
+
+
+def test_confidence_average_not_serialized(fake_db):
+    """Test the derived average stays out of the results response"""
+    fake_db["results"].docs.append(dict(LEGACY_RESULT_DOC, job_id="avg-job"))
+    data = client.get("/api/v1/parse/results/avg-job").json()
+    assert "average" not in data["confidence_scores"]
+
+
+def _pdf_bytes():
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "HDFC Bank Credit Card Statement")
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
+
+
+def test_upload_writes_completed_state_once(fake_db, monkeypatch):
+    """Test a successful upload ends with a single COMPLETED status write"""
+    async def fake_parse(file_path, filename, job_id, use_ocr=False):
+        return ParseResult.model_validate(dict(LEGACY_RESULT_DOC, job_id=job_id, filename=filename))
+
+    monkeypatch.setattr(parse_endpoints.orchestrator, "parse", fake_parse)
+    response = client.post(
+        "/api/v1/parse/upload",
+        files={"file": ("statement.pdf", _pdf_bytes(), "application/pdf")},
+    )
+    assert response.status_code == 200
+
+    updates = fake_db["jobs"].updates
+    assert [update["status"] for update in updates] == ["processing", "processing", "completed"]
+    assert updates[-1]["progress_percentage"] == 100
+    assert fake_db["jobs"].docs[0]["status"] == "completed"
+
+
+def test_batch_creates_jobs_in_one_insert(fake_db):
+    """Test a batch upload creates one job per file with a single insert"""
+    response = client.post(
+        "/api/v1/parse/batch",
+        files=[("files", (f"statement{i}.pdf", _pdf_bytes(), "application/pdf")) for i in range(3)],
+    )
+    assert response.status_code == 200
+
+    job_ids = response.json()["job_ids"]
+    jobs = fake_db["jobs"]
+    assert jobs.calls == ["insert_many"]
+    assert [doc["job_id"] for doc in jobs.docs] == job_ids
+    assert [doc["filename"] for doc in jobs.docs] == ["statement0.pdf", "statement1.pdf", "statement2.pdf"]
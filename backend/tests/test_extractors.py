@@ -0,0 +1,162 @@
+"""Tests for issuer extractors"""
+import pytest
+import regex
+from app.core.extractors.hdfc import HDFCExtractor
+from app.core.extractors.kotak import KotakExtractor
+from app.utils.date_parser import parse_date
+
+extractor = KotakExtractor()
+
+
+def test_kotak_card_number_formats():
+    """Test masked Kotak card numbers are still recognised"""
+    assert extractor.extract_card_number("Card: 414767XXXXXX6705")[0] == "414767XXXXXX6705"
+    assert extractor.extract_card_number("Card Number: 4147 67** **** 6705")[0] == "Card Number: 4147 67** **** 6705"
+    assert extractor.extract_card_number("ref 1234 **** 5678")[0] == "1234 **** 5678"
+
+
+def test_kotak_card_number_long_mask_run():
+    """Test long runs of mask characters are rejected"""
+    for text in ("Card Number: 1234 12 " + "*" * 20000, "1234" + "*" * 20000):
+        assert extractor.extract_card_number(text) == ("", 0.0)
+
+
+def test_extract_all_cache_returns_independent_copies():
+    """Test mutating a returned extraction doesn't change a later cache hit"""
+    text = (
+        "Kotak Mahindra Bank Credit Card Statement\n"
+        "Statement Period: 01-Feb-2023 To 28-Feb-2023\n"
+        "Payment Due Date: 19-Mar-2023\n"
+        "Total Amount Due Rs. 4,240.00\n"
+        "05/02/2023 AMAZON RETAIL 1,200.00\n"
+    )
+    first = extractor.extract_all(text)
+    expected = first["data"]["statement_period"].model_dump()
+    first["data"]["statement_period"].start_date = "1999-01-01"
+    first["data"]["transactions"][0]["merchant"] = "changed"
+    
+    second = extractor.extract_all(text)
+    assert second["data"]["statement_period"].model_dump() == expected
+    assert second["data"]["transactions"][0]["merchant"] != "changed"
+
+
+def test_extract_all_fail_fast_is_opt_in():
+    """Test unconfirmed issuers still get a full extraction unless fail_fast is set"""
+    text = "Statement Period: 01-Feb-2023 To 28-Feb-2023\nTotal Amount Due Rs. 4,240.00\n"
+    full = extractor.extract_all(text)
+    assert full["confidence"]["total_amount_due"] > 0
+    assert full["data"]["total_amount_due"].amount == 4240.0
+
+    empty = extractor.extract_all(text, fail_fast=True)
+    assert empty["data"]["card_issuer"] == ""
+    assert all(score == 0.0 for key, score in empty["confidence"].items() if key != "card_issuer")
+
+
+def test_extract_all_keeps_pattern_priority_across_long_text():
+    """Test a lower-priority label near the top doesn't beat a better label further down"""
+    filler = "05/02/2023 AMAZON RETAIL 1,200.00\n" * 600
+    text = (
+        "Kotak Mahindra Bank Credit Card Statement\n"
+        "Due Date: 20-Mar-2023\n"
+        "Rs. 10.00\n"
+        + filler
+        + "Payment Due Date: 19-Mar-2023\n"
+        "Total Amount Due Rs. 4,240.00\n"
+    )
+    result = extractor.extract_all(text)
+    assert result["data"]["payment_due_date"].formatted == "2023-03-19"
+    assert result["data"]["total_amount_due"].amount == 4240.0
+
+
+def test_extract_all_skips_fields_without_anchor_words(monkeypatch):
+    """Test a field whose anchor words are all absent skips its patterns"""
+    calls = []
+    monkeypatch.setattr(extractor, "extract_due_date", lambda text: calls.append(text))
+    text = "Kotak Mahindra Bank Credit Card\nTotal Outstanding Rs. 4,240.00\n"
+    result = extractor.extract_all(text)
+    assert calls == []
+    assert result["data"]["payment_due_date"].raw == ""
+    assert result["confidence"]["payment_due_date"] == 0.0
+    assert result["data"]["total_amount_due"].amount == 4240.0
+
+
+def test_extract_all_keeps_astral_characters_in_raw_values():
+    """Test characters outside the BMP survive into extracted snippets"""
+    text = "Kotak Mahindra Bank\n05/02/2023 CAFE \U0001F355 PIZZA 1,200.00\nTotal Amount Due Rs. 4,240.00\n"
+    result = extractor.extract_all(text)
+    assert result["data"]["transactions"][0]["merchant"] == "CAFE \U0001F355 PIZZA"
+
+
+# The HDFC pattern lists as they were before any single-pass rewrites
+_HDFC_BASELINE_CARD = (
+    r"(\d{4}\s*\d{2}X{2}\s*X{4}\s*\d{4})",
+    r"(\d{4}\s+X{4}\s+X{4}\s+\d{4})",
+    r"Card\s+No\.?\s*:?\s*(\d{4}\s+\d{2}X{2}\s+X{4}\s+\d{4})",
+)
+_HDFC_BASELINE_DUE = (
+    r"Payment\s+Due\s+Date.{0,200}?(\d{2}/\d{2}/\d{4})",
+    r"Due\s+Date.{0,100}?(\d{2}/\d{2}/\d{4})",
+    r"Payment\s+Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
+    r"Due\s+Date\s*:?\s*(\d{2}/\d{2}/\d{4})",
+    r"Pay\s+by\s*:?\s*(\d{2}/\d{2}/\d{4})",
+    r"Payment\s+Due\s+Date.{0,200}?(\d{8})",
+)
+_HDFC_BASELINE_TOTAL = (
+    r"Payment\s+Due\s+Date\s+Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)",
+    r"Minimum\s+Amount\s+Due[\s\n]+\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+([\d,]+\.?\d*)",
+    r"Total\s+Amount\s+Due\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"Total\s+Dues\s*:?\s*([\d,]+\.?\d*)",
+    r"New\s+Balance\s*:?\s*Rs\.?\s*([\d,]+\.?\d*)",
+    r"CLOSING\s+BALANCE\s*:?\s*([\d,]+\.?\d*)",
+    r"\d{2}/\d{2}/\d{4}\s+([\d,]+\.?\d*)\s+[\d,]+\.?\d*",
+)
+
+HDFC_TEXTS = (
+    "HDFC Bank\nCard No: 5228 52XX XXXX 0591\n"
+    "Payment Due Date Minimum Amount Due\n28/06/2019 45,240.00 2,262.00\n",
+    # Only the \s+ pattern takes an unspaced 4-X mask, so this card isn't one
+    "Card 1234XXXX XXXX 5678\nPayment Due Date Minimum Amount Due\n28/06/2019 45,240.005 2,262.00\n",
+    # A plain 4-X mask earlier in the text than the 52XX one
+    "4147 XXXX XXXX 1234 on file\nCard No: 5228 52XX XXXX 0591\nPayment Due Date: 28/06/2019\n",
+    "Payment Due Date Minimum Amount Due\n31/02/2019 0.00 0.00\nDue Date 01/07/2019\nTotal Dues 1,000\n",
+    "Payment Due Date\n" + "x" * 250 + "\n28/06/2019 Pay by 27/06/2019 New Balance Rs. 12.5\n",
+    "no fields here",
+)
+
+
+def _hdfc_baseline_card(text):
+    for pattern in _HDFC_BASELINE_CARD:
+        match = regex.search(pattern, text, regex.IGNORECASE)
+        if match:
+            return ' '.join(match.group(1).split())
+    return ""
+
+
+def _hdfc_baseline_due(text):
+    for pattern in _HDFC_BASELINE_DUE:
+        match = regex.search(pattern, text, regex.IGNORECASE | regex.DOTALL)
+        if match and parse_date(match.group(1)):
+            return match.group(1), parse_date(match.group(1))
+    return "", None
+
+
+def _hdfc_baseline_total(text):
+    for pattern in _HDFC_BASELINE_TOTAL:
+        match = regex.search(pattern, text, regex.IGNORECASE)
+        if match:
+            try:
+                amount = float(match.group(1).replace(',', ''))
+            except ValueError:
+                continue
+            if amount > 0:
+                return match.group(1), amount
+    return "", 0.0
+
+
+@pytest.mark.parametrize("text", HDFC_TEXTS)
+def test_hdfc_fields_match_baseline_patterns(text):
+    """Test HDFC card, due date and total agree with the original pattern lists"""
+    data = HDFCExtractor().extract_all(text)["data"]
+    assert data["card_number"] == _hdfc_baseline_card(text)
+    assert (data["payment_due_date"].raw, data["payment_due_date"].formatted) == _hdfc_baseline_due(text)
+    assert (data["total_amount_due"].raw, data["total_amount_due"].amount) == _hdfc_baseline_total(text)
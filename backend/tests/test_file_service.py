@@ -0,0 +1,49 @@
+"""Tests for temporary upload storage"""
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.config import settings
+from app.services import file_service
+from app.services.file_service import FileService
+
+
+class CountingUpload(UploadFile):
+    """Upload that counts the chunks read from it"""
+
+    reads = 0
+
+    async def read(self, size=-1):
+        self.reads += 1
+        return await super().read(size)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TEMP_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "MAX_FILE_SIZE", 10)
+    monkeypatch.setattr(file_service, "UPLOAD_CHUNK_SIZE", 4)
+    return FileService()
+
+
+@pytest.mark.asyncio
+async def test_save_upload_streams_file_to_disk(service, tmp_path):
+    """Test an upload within the limit is saved whole"""
+    path = await service.save_upload(UploadFile(io.BytesIO(b"%PDF-1.7\n"), filename="a.pdf"))
+    with open(path, "rb") as f:
+        assert f.read() == b"%PDF-1.7\n"
+    assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(path)]
+
+
+@pytest.mark.asyncio
+async def test_save_upload_rejects_oversized_upload_early(service, tmp_path):
+    """Test an oversized upload stops at the limit and leaves no file behind"""
+    upload = CountingUpload(io.BytesIO(b"x" * 100), filename="big.pdf")
+    with pytest.raises(HTTPException) as exc_info:
+        await service.save_upload(upload)
+    assert exc_info.value.status_code == 413
+    # Chunks of 4 bytes pass the 10-byte limit on the third read
+    assert upload.reads == 3
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,45 @@
+"""Tests for issuer detection"""
+from app.models.enums import CardIssuer
+from app.services.issuer_detection import _ISSUER_NAME_PHRASES, IssuerDetector
+from app.utils.regex_patterns import ISSUER_LITERAL_HINTS, ISSUER_PATTERNS, ISSUER_PATTERNS_COMPILED
+
+detector = IssuerDetector()
+
+
+def test_literal_hints_cover_every_issuer_pattern():
+    """Test each issuer pattern contains one of the issuer's literal hints"""
+    for issuer, patterns in ISSUER_PATTERNS.items():
+        for pattern in patterns:
+            literal = pattern.lower().replace("\\.", ".")
+            assert any(hint in literal for hint in ISSUER_LITERAL_HINTS[issuer]), pattern
+
+
+def test_scored_detection_without_issuer_name():
+    """Test issuers are still scored on patterns that don't name the bank"""
+    assert detector.detect_issuer("GSTIN 33AAACH2702H2Z6 Platinum Times Card") == CardIssuer.HDFC
+
+
+def test_name_phrases_are_scored_patterns():
+    """Test each bank name short-circuiting detection is one of its issuer's patterns"""
+    for issuer_key, phrases in _ISSUER_NAME_PHRASES:
+        for phrase in phrases:
+            assert any(p.fullmatch(phrase) for p in ISSUER_PATTERNS_COMPILED[issuer_key]), phrase
+
+
+def test_other_bank_in_transaction_line_defers_to_scoring():
+    """Test a transfer line naming another bank doesn't override the statement's issuer"""
+    text = "Amex Platinum Card AEBC statement\nMembership Rewards\nTransfer to HDFC 1,000.00"
+    assert detector.detect_issuer(text) == CardIssuer.AMEX
+    text = "American Express Banking Corp\nStatement\nNEFT to HDFC Bank 1,000.00"
+    assert detector.detect_issuer(text) == CardIssuer.AMEX
+
+
+def test_bank_name_substring_inside_word_is_not_a_name():
+    """Test "axis" inside words like "taxis" doesn't identify Axis Bank"""
+    text = "Kotak Credit Card\nCITY TAXIS 450.00\nPRAXIS BOOKS 1,200.00"
+    assert detector.detect_issuer(text) == CardIssuer.KOTAK
+
+
+def test_bank_name_in_header_detects_issuer():
+    """Test a statement naming only its own bank is detected from the name"""
+    assert detector.detect_issuer("ICICI Bank Credit Card Statement\nTotal Amount Due 1,000.00") == CardIssuer.ICICI
@@ -0,0 +1,186 @@
+"""Tests for the parser orchestrator"""
+import asyncio
+
+import fitz
+import pytest
+
+from app.core import orchestrator as orchestrator_module
+from app.core.orchestrator import ParserOrchestrator
+from app.models.enums import ParserType
+
+STATEMENT_LINES = (
+    "HDFC Bank Credit Card Statement",
+    "Card No: 5228 52XX XXXX 0591",
+    "Statement Date: 08/06/2019",
+    "Payment Due Date Minimum Amount Due",
+    "28/06/2019 45,240.00 2,262.00",
+)
+
+
+@pytest.fixture
+def statement_pdf(tmp_path):
+    path = tmp_path / "statement.pdf"
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, line in enumerate(STATEMENT_LINES):
+        page.insert_text((72, 72 + 16 * i), line)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def orchestrator(monkeypatch):
+    orch = ParserOrchestrator()
+    orch.text_runs = 0
+    extract_text = orch._extract_text_with_fallback
+
+    async def counting(*args, **kwargs):
+        orch.text_runs += 1
+        return await extract_text(*args, **kwargs)
+
+    monkeypatch.setattr(orch, "_extract_text_with_fallback", counting)
+    return orch
+
+
+def test_cached_result_is_independent_per_job(orchestrator, statement_pdf):
+    """Test a reused result shares no nested objects with earlier jobs"""
+    first = asyncio.run(orchestrator.parse(statement_pdf, "a.pdf", "job-1"))
+    first.data.card_number = "mutated"
+    first.data.total_amount_due.amount = -1.0
+    first.confidence_scores.card_number = 0.0
+
+    second = asyncio.run(orchestrator.parse(statement_pdf, "b.pdf", "job-2"))
+    assert orchestrator.text_runs == 1
+    assert (second.job_id, second.filename) == ("job-2", "b.pdf")
+    assert second.data.card_number == "5228 52XX XXXX 0591"
+    assert second.data.total_amount_due.amount == 45240.0
+    assert second.confidence_scores.card_number == 1.0
+
+    second.data.payment_due_date.raw = "mutated"
+    third = asyncio.run(orchestrator.parse(statement_pdf, "c.pdf", "job-3"))
+    assert third.data.payment_due_date.raw == "28/06/2019"
+
+
+def test_expired_result_is_parsed_again(orchestrator, statement_pdf, monkeypatch):
+    """Test results older than the TTL aren't reused"""
+    monkeypatch.setattr(orchestrator_module, "RESULT_CACHE_TTL_SECONDS", 0)
+    asyncio.run(orchestrator.parse(statement_pdf, "a.pdf", "job-1"))
+    asyncio.run(orchestrator.parse(statement_pdf, "a.pdf", "job-2"))
+    assert orchestrator.text_runs == 2
+    assert len(orchestrator._result_cache) == 1
+
+
+def test_result_cache_bounded_by_bytes(orchestrator, statement_pdf, monkeypatch):
+    """Test results are evicted once their serialized size exceeds the budget"""
+    asyncio.run(orchestrator.parse(statement_pdf, "a.pdf", "job-1"))
+    size = orchestrator._result_cache_bytes
+    assert size > 0
+
+    monkeypatch.setattr(orchestrator_module, "RESULT_CACHE_MAX_BYTES", size)
+    asyncio.run(orchestrator.parse(statement_pdf, "a.pdf", "job-2", use_ocr=False))
+    assert orchestrator.text_runs == 1
+
+    # A second entry for the same file pushes the total past the budget
+    orchestrator._cache_result(("other", False), next(iter(orchestrator._result_cache.values()))[2])
+    assert list(orchestrator._result_cache) == [("other", False)]
+    assert orchestrator._result_cache_bytes == size
+
+
+SUFFICIENT_TEXT = "HDFC Bank Credit Card Statement " * 20
+
+
+@pytest.fixture
+def stubbed_parsers(monkeypatch):
+    """Orchestrator whose text parsers return canned text and record their runs"""
+    orch = ParserOrchestrator()
+    orch.runs = []
+    monkeypatch.setattr(orchestrator_module, "detect_if_ocr_needed", lambda file_path, threshold: (False, None))
+
+    def stub(parser_type, text):
+        async def extract_text(file_path):
+            orch.runs.append(parser_type)
+            return text
+
+        async def extract_metadata(file_path):
+            return {"parser": parser_type.value}
+
+        parser = orch.parsers[parser_type]
+        monkeypatch.setattr(parser, "extract_text", extract_text)
+        monkeypatch.setattr(parser, "extract_metadata", extract_metadata)
+
+    orch.stub = stub
+    return orch
+
+
+@pytest.fixture
+def speculative_pdfplumber(stubbed_parsers, monkeypatch):
+    """pdfplumber stub that runs until told to stop, recording how it ended"""
+    orch = stubbed_parsers
+    orch.pdfplumber_calls = []
+
+    async def extract_text(file_path, cancel=None):
+        orch.pdfplumber_calls.append("started")
+        for _ in range(100):
+            if cancel is not None and cancel.is_set():
+                orch.pdfplumber_calls.append("stopped")
+                return ""
+            await asyncio.sleep(0.01)
+        orch.pdfplumber_calls.append("finished")
+        return SUFFICIENT_TEXT
+
+    async def extract_metadata(file_path):
+        return {"parser": "pdfplumber"}
+
+    monkeypatch.setattr(orch.pdfplumber_parser, "extract_text", extract_text)
+    monkeypatch.setattr(orch.pdfplumber_parser, "extract_metadata", extract_metadata)
+    return orch
+
+
+def test_speculative_pdfplumber_stopped_when_pymupdf_suffices(speculative_pdfplumber):
+    """Test the speculative pdfplumber run is stopped and awaited once PyMuPDF wins"""
+    orch = speculative_pdfplumber
+    orch.stub(ParserType.PYMUPDF, SUFFICIENT_TEXT)
+
+    text, parser_used, _ = asyncio.run(orch._extract_text_with_fallback("statement.pdf"))
+    assert (text, parser_used) == (SUFFICIENT_TEXT, ParserType.PYMUPDF)
+    assert orch.pdfplumber_calls == ["started", "stopped"]
+
+
+def test_speculative_pdfplumber_result_used_as_fallback(speculative_pdfplumber):
+    """Test pdfplumber's speculative run is the fallback result, not run twice"""
+    orch = speculative_pdfplumber
+    orch.stub(ParserType.PYMUPDF, "")
+    orch.stub(ParserType.PYPDFIUM2, "")
+
+    text, parser_used, metadata = asyncio.run(orch._extract_text_with_fallback("statement.pdf"))
+    assert (text, parser_used) == (SUFFICIENT_TEXT, ParserType.PDFPLUMBER)
+    assert metadata == {"parser": "pdfplumber"}
+    assert orch.pdfplumber_calls == ["started", "finished"]
+
+
+def test_pdfplumber_not_started_when_detection_text_suffices(speculative_pdfplumber, monkeypatch):
+    """Test no speculative run starts when OCR detection already has enough text"""
+    orch = speculative_pdfplumber
+    monkeypatch.setattr(
+        orchestrator_module, "detect_if_ocr_needed", lambda file_path, threshold: (False, SUFFICIENT_TEXT)
+    )
+    orch.stub(ParserType.PYMUPDF, "")
+
+    _, parser_used, _ = asyncio.run(orch._extract_text_with_fallback("statement.pdf"))
+    assert parser_used == ParserType.PYMUPDF
+    assert orch.runs == []
+    assert orch.pdfplumber_calls == []
+
+
+def test_pypdfium2_used_when_pymupdf_text_insufficient(speculative_pdfplumber):
+    """Test pypdfium2 is tried after PyMuPDF and its text wins over pdfplumber"""
+    orch = speculative_pdfplumber
+    orch.stub(ParserType.PYMUPDF, "")
+    orch.stub(ParserType.PYPDFIUM2, SUFFICIENT_TEXT)
+
+    text, parser_used, metadata = asyncio.run(orch._extract_text_with_fallback("statement.pdf"))
+    assert (text, parser_used) == (SUFFICIENT_TEXT, ParserType.PYPDFIUM2)
+    assert metadata == {"parser": ParserType.PYPDFIUM2.value}
+    assert orch.runs == [ParserType.PYMUPDF, ParserType.PYPDFIUM2]
+    assert orch.pdfplumber_calls == ["started", "stopped"]
@@ -0,0 +1,121 @@
+"""Tests for the PDF parsers"""
+import asyncio
+import os
+import threading
+
+import fitz
+import pytest
+from PIL import Image
+
+from app.config import settings
+from app.core.parsers import pdfplumber_parser, tesseract_parser
+from app.core.parsers.pypdfium2_parser import Pypdfium2Parser
+from app.core.parsers.tesseract_parser import TesseractOCRParser
+
+
+def test_ocr_page_hands_pytesseract_a_pgm_file(monkeypatch):
+    """Test pytesseract reads the page from a PGM file that is removed afterwards"""
+    seen = {}
+
+    def image_to_string(image, lang, config):
+        seen["path"] = image
+        with open(image, "rb") as f:
+            seen["header"] = f.read(2)
+        with Image.open(image) as decoded:
+            seen["size"] = decoded.size
+        return "text"
+
+    monkeypatch.setattr(tesseract_parser.pytesseract, "image_to_string", image_to_string)
+    parser = TesseractOCRParser()
+    parser.use_tesserocr = False
+    assert parser._ocr_page(Image.new("L", (40, 30), 255)) == "text"
+    assert seen["path"].endswith(".pgm")
+    assert seen["header"] == b"P5"
+    assert seen["size"] == (40, 30)
+    assert not os.path.exists(seen["path"])
+
+
+def test_shutdown_page_pool_stops_workers():
+    """Test the page pool's processes are stopped and a later use starts a new pool"""
+    pool = pdfplumber_parser._get_page_pool()
+    assert pool.submit(os.getpid).result(timeout=60) != os.getpid()
+    pdfplumber_parser.shutdown_page_pool()
+    assert pdfplumber_parser._page_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(os.getpid)
+    pdfplumber_parser.shutdown_page_pool()
+
+
+def test_pypdfium2_parser_reads_every_page(tmp_path):
+    """Test pypdfium2 returns each page's text in order, with page metadata"""
+    path = str(tmp_path / "statement.pdf")
+    doc = fitz.open()
+    for line in ("HDFC Bank Credit Card Statement", "Total Amount Due 4,240.00"):
+        doc.new_page().insert_text((72, 72), line)
+    doc.save(path)
+    doc.close()
+
+    parser = Pypdfium2Parser()
+    text = asyncio.run(parser.extract_text(path))
+    assert text.index("HDFC Bank Credit Card Statement") < text.index("Total Amount Due 4,240.00")
+    assert asyncio.run(parser.extract_metadata(path))["pages"] == 2
+
+
+def test_pypdfium2_parser_returns_empty_text_for_unreadable_file(tmp_path):
+    """Test a file PDFium can't open yields empty text for the fallback to skip"""
+    path = tmp_path / "broken.pdf"
+    path.write_bytes(b"%PDF-1.7\nnot really a pdf")
+    assert asyncio.run(Pypdfium2Parser().extract_text(str(path))) == ""
+
+
+class FakeTessBaseAPI:
+    """Records which threads loaded a model and the page segmentation mode used"""
+
+    loaded = []
+
+    def __init__(self, lang, psm):
+        self.loaded.append((threading.current_thread().name, lang, psm))
+
+    def SetImage(self, image):
+        pass
+
+    def SetSourceResolution(self, dpi):
+        pass
+
+    def GetUTF8Text(self):
+        return ""
+
+
+@pytest.fixture
+def fresh_ocr_pool(monkeypatch):
+    monkeypatch.setattr(tesseract_parser, "_ocr_pool", None)
+    monkeypatch.setattr(settings, "TESSERACT_WORKERS", 3)
+    monkeypatch.setattr(settings, "TESSERACT_CONFIG", "--psm 6")
+    yield
+    if tesseract_parser._ocr_pool is not None:
+        tesseract_parser._ocr_pool.shutdown()
+
+
+def test_warm_ocr_pool_loads_a_model_in_every_thread(fresh_ocr_pool, monkeypatch):
+    """Test warming starts every pool thread and each loads its model once"""
+    monkeypatch.setattr(FakeTessBaseAPI, "loaded", [])
+    monkeypatch.setattr(tesseract_parser, "tesserocr", type("tesserocr", (), {"PyTessBaseAPI": FakeTessBaseAPI}))
+
+    tesseract_parser.warm_ocr_pool()
+    loaded = FakeTessBaseAPI.loaded
+    assert len(loaded) == 3
+    assert len({thread for thread, _, _ in loaded}) == 3
+    assert all((lang, psm) == (settings.TESSERACT_LANG, 6) for _, lang, psm in loaded)
+
+    # Pages OCR'd afterwards reuse the threads' loaded models
+    parser = TesseractOCRParser()
+    images = [Image.new("L", (8, 8), 255)] * 6
+    list(tesseract_parser._get_ocr_pool().map(parser._ocr_page, images))
+    assert len(FakeTessBaseAPI.loaded) == 3
+
+
+def test_warm_ocr_pool_skipped_without_tesserocr(fresh_ocr_pool, monkeypatch):
+    """Test warming doesn't start the pool when pages go through the tesseract CLI"""
+    monkeypatch.setattr(tesseract_parser, "tesserocr", None)
+    tesseract_parser.warm_ocr_pool()
+    assert tesseract_parser._ocr_pool is None
@@ -0,0 +1,99 @@
+"""Tests for PatternUnion matching order"""
+import pytest
+import regex as re
+
+from app.core.extractors import amex, axis, capital_one, hdfc, icici, idfc, kotak
+from app.utils.regex_patterns import PatternUnion
+
+TEXTS = (
+    "Statement Period: 01-Feb-2023 To 28-Feb-2023\nTotal Amount Due Rs. 4,240.00",
+    "Amount Rs. 10.00\nDue Date 19-Mar-2023\nTotal Amount Due Rs. 4,240.00",
+    "Card: 414767XXXXXX6705\nCard Number: 4147 67** **** 6705\nref 1234 **** 5678",
+    "Payment Due Date: 19/03/2023 Due Date: 20/03/2023 Pay by: 18/03/2023",
+    "Kotak Mahindra Bank Credit Card\nPayment Due Date\n19-Mar-2023\nMinimum Amount Due",
+    "no statement fields here",
+    "",
+)
+
+
+def _sequential(union, text):
+    """Each pattern searched in turn, as the extractors did before the union"""
+    hits = []
+    for idx, pattern in enumerate(union.branches):
+        m = pattern.search(text)
+        if m:
+            hits.append((idx, m))
+    return hits
+
+
+def _spans(hits):
+    return [(idx, m.span(), m.groups()) for idx, m in hits]
+
+
+def _without_prefilter(patterns, flags=0):
+    union = PatternUnion(patterns, flags)
+    union._prefilter = None
+    return union
+
+
+def _extractor_unions():
+    return [
+        value
+        for module in (amex, axis, capital_one, hdfc, icici, idfc, kotak)
+        for value in vars(module).values()
+        if isinstance(value, PatternUnion)
+    ]
+
+
+def test_earlier_branch_matching_later_in_text_comes_first():
+    """Test a higher-priority pattern wins even when a later one matches first"""
+    union = _without_prefilter((r"Total\s+Amount\s+Due", r"Amount", r"Due"))
+    text = "Amount Due Rs. 10.00\nTotal Amount Due Rs. 4,240.00"
+    hits = list(union.matches(text))
+    assert _spans(hits) == _spans(_sequential(union, text))
+    assert [(idx, m.start()) for idx, m in hits] == [(0, 21), (1, 0), (2, 7)]
+
+
+def test_shadowed_first_hit_of_later_branch_is_kept():
+    """Test a later pattern's first hit is found where an earlier one also matches"""
+    union = _without_prefilter((r"Due\s+Date", r"Due", r"(\d{2})/(\d{2})/(\d{4})"))
+    text = "Due Date 19/03/2023 Due 20/03/2023"
+    assert _spans(union.matches(text)) == _spans(_sequential(union, text))
+
+
+def test_reject_then_continue_matches_sequential_loop():
+    """Test a caller skipping candidates reaches the same accepted match"""
+    union = _without_prefilter((r"Due\s+Date:?\s*(\S+)", r"Pay\s+by:?\s*(\S+)", r"(\d{2}/\d{2}/\d{4})"))
+    text = "Payment Due Date: N/A Pay by: soon 18/03/2023"
+
+    def first_date(hits):
+        for idx, m in hits:
+            if re.fullmatch(r"\d{2}/\d{2}/\d{4}", m.group(1)):
+                return idx, m.span()
+        return None
+
+    assert first_date(union.matches(text)) == first_date(_sequential(union, text)) == (2, (35, 45))
+
+
+def test_no_match_yields_nothing():
+    """Test a union with no matching pattern yields nothing"""
+    assert list(_without_prefilter((r"Total", r"Due")).matches("nothing here")) == []
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_extractor_unions_match_sequential_order(text):
+    """Test every extractor union yields what searching its patterns in turn does"""
+    unions = _extractor_unions()
+    assert unions
+    for union in unions:
+        union = _without_prefilter(tuple(b.pattern for b in union.branches), union.union.flags)
+        assert _spans(union.matches(text)) == _spans(_sequential(union, text))
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_prefilter_matches_sequential_order(text):
+    """Test the Hyperscan prefilter path yields the same order"""
+    pytest.importorskip("hyperscan")
+    for union in _extractor_unions():
+        if union._prefilter is not None:
+            assert _spans(union.matches(text)) == _spans(_sequential(union, text))
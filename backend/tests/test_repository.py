@@ -0,0 +1,31 @@
+"""Tests for the MongoDB repository"""
+import pytest
+
+from app.db.repository import JobRepository
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_inserts_all_jobs_in_one_call(fake_db):
+    """Test create_jobs writes every job with one insert_many"""
+    repo = JobRepository(fake_db)
+    await repo.create_jobs([("job-1", "a.pdf"), ("job-2", "b.pdf")])
+
+    jobs = fake_db["jobs"]
+    assert jobs.calls == ["insert_many"]
+    assert [(doc["job_id"], doc["filename"]) for doc in jobs.docs] == [("job-1", "a.pdf"), ("job-2", "b.pdf")]
+    assert all(doc["status"] == "pending" and doc["progress_percentage"] == 0 for doc in jobs.docs)
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_matches_create_job(fake_db):
+    """Test a bulk-created job reads back the same as one created alone"""
+    repo = JobRepository(fake_db)
+    await repo.create_job("job-1", "a.pdf")
+    await repo.create_jobs([("job-2", "a.pdf")])
+
+    single, bulk = fake_db["jobs"].docs
+    ignored = {"job_id", "created_at", "updated_at"}
+    assert {k: v for k, v in single.items() if k not in ignored} == {k: v for k, v in bulk.items() if k not in ignored}
+    status = await repo.get_job_status("job-2")
+    assert status.status.value == "pending"
+    assert status.message == "Job created"
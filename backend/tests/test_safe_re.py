@@ -0,0 +1,142 @@
+"""Tests for the RE2 translation in safe_re"""
+import glob
+import importlib.util
+import os
+import re
+
+import pytest
+import regex
+
+re2 = pytest.importorskip("re2")
+
+from app.utils import safe_re
+
+EXTRACTORS_DIR = os.path.join(os.path.dirname(__file__), "..", "app", "core", "extractors")
+
+# Fragments of the statement layouts the extractors target
+STATEMENT_TEXT = """Kotak Mahindra Bank Credit Card Statement
+Statement Period: 01/02/2023 - 28/02/2023
+Statement Date: 28/02/2023 to 27/03/2023
+Statement for period: 01-02-2023 to 28-02-2023
+From 01/02/2023 to 28/02/2023
+Payment Due Date: 19-Mar-2023
+Payment Due Date : 19/03/2023
+Due Date: 19/Mar/2023
+Pay by: 18/03/2023
+Payment due on 17/03/2023
+Total Amount Due Rs. 45,240.00
+Total Amount Due
+Rs.   12,345.67
+Total Outstanding: INR 1,000.50
+Amount Due : ₹ 3,210.00
+New Balance Rs 9,999.99
+Closing Balance: Rs.100.00
+Minimum Amount Due: Rs. 2,262.00
+Opening Balance - 5,000
+Available Credit: 95,000.00
+Credit Limit: 1,00,000
+Previous Bal: Rs. 4,321.00
+Statement Summary 12,345.67 2,262.00 0.00 45,240.00
+Statement Date
+15/02/2023 45,240.00
+Rewards Points Summary Opening 120 Earned 40 Closing Balance: 160
+American Express Banking Corp. americanexpress.co.in AEBC
+Membership Number: 3769 XXXXXX 01007
+3769 XXXX XXXX 000 XXXX-XXXXXX-01007
+From January 14 to February 13, 2024
+From 14012024 to 13022024
+Minimum Payment Due £25.00 by February 10, 2024
+Payment Due Date: March 9, 2024
+Due Date: 9 March 2024
+Pay by: April 1 2024
+Capital One Europe plc capitalone.co.uk
+Card ending in 4321
+5228 **** **** 0591 5228 XXXX XXXX 0591
+Statement date 3 Nov 24
+1 October 2024 to 31 October 2024
+It's due on 24 Nov 2024
+Payment Due Date: 24112024
+due date on 5 December 24
+20/May/2025 - 19/Jun/2025
+01-Feb-2023 To 28-Feb-2023
+05/02/2023 AMAZON RETAIL 1,200.00
+"""
+
+# Unicode spaces PDF extraction produces, which RE2's own \s would miss
+SAMPLES = (
+    STATEMENT_TEXT,
+    STATEMENT_TEXT.replace(" ", "\u00a0"),
+    STATEMENT_TEXT.replace(" ", "\u2009").replace("\n", "\r\n"),
+)
+
+
+def _extractor_patterns():
+    """(pattern, flags) of every safe_re.compile call made by the extractors"""
+    calls = []
+    original = safe_re.compile
+
+    def record(pattern, flags=0):
+        calls.append((pattern, flags))
+        return original(pattern, flags)
+
+    safe_re.compile = record
+    try:
+        for path in sorted(glob.glob(os.path.join(EXTRACTORS_DIR, "*.py"))):
+            with open(path, encoding="utf-8") as f:
+                if "safe_re" not in f.read():
+                    continue
+            # Executed as a throwaway module so the real one is untouched
+            name = "_safe_re_probe_" + os.path.basename(path)[:-3]
+            spec = importlib.util.spec_from_file_location(name, path)
+            spec.loader.exec_module(importlib.util.module_from_spec(spec))
+    finally:
+        safe_re.compile = original
+    # Sibling modules imported along the way record their patterns twice
+    return list(dict.fromkeys(calls))
+
+
+EXTRACTOR_PATTERNS = _extractor_patterns()
+
+
+def _reference(pattern, flags):
+    """The pattern as the backtracking engines compile it"""
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return regex.compile(pattern, flags)
+
+
+def _matches(compiled, text):
+    return [(m.span(), m.groups()) for m in compiled.finditer(text)]
+
+
+def test_extractor_patterns_are_found():
+    """Test the extractors' patterns were collected, most of them via RE2"""
+    assert len(EXTRACTOR_PATTERNS) > 50
+    compiled = [safe_re.compile(pattern, flags) for pattern, flags in EXTRACTOR_PATTERNS]
+    assert sum(type(c).__module__ == "re2" for c in compiled) > len(compiled) // 2
+
+
+@pytest.mark.parametrize("pattern,flags", EXTRACTOR_PATTERNS, ids=[p for p, _ in EXTRACTOR_PATTERNS])
+def test_extractor_pattern_matches_stdlib(pattern, flags):
+    """Test each extractor pattern matches exactly what stdlib re matches"""
+    compiled = safe_re.compile(pattern, flags)
+    reference = _reference(pattern, flags)
+    for text in SAMPLES:
+        assert _matches(compiled, text) == _matches(reference, text)
+
+
+def test_whitespace_translation_matches_unicode_spaces():
+    """Test translated \\s and \\S cover NBSP and other Unicode spaces"""
+    for pattern in (r"Due\s+Date", r"Rs\.?\s*([\d,]+)", r"[\s\S]{0,5}Total", r"(\S+)\s+(\S+)"):
+        compiled = safe_re.compile(pattern, re.IGNORECASE)
+        assert type(compiled).__module__ == "re2"
+        for space in (" ", "\u00a0", "\u2009", "\u3000", "\t", "\x1c", "\x85"):
+            text = f"Due{space}Date Rs.{space}1,234 ab{space}Total"
+            assert _matches(compiled, text) == _matches(re.compile(pattern, re.IGNORECASE), text)
+
+
+def test_unsupported_constructs_fall_back():
+    """Test patterns RE2 can't express are compiled by the backtracking engines"""
+    for pattern in (r"(?<=Rs\.)\d+", r"(a)\1", r"[\S]+", r"Rewards(?>[\s\S]{0,200})"):
+        assert type(safe_re.compile(pattern)).__module__ != "re2"